@@ -2,8 +2,14 @@
 from sympy.utilities.iterables import is_sequence
 from sympy.external import import_module
 from itertools import cycle
-from spb.series import BaseSeries
-from spb.backends.utils import convert_colormap
+from spb.series import BaseSeries, _VECTORIZE_BYTES_PER_POINT
+from spb.backends.utils import convert_colormap, _get_nbytes
+import warnings
+
+
+def _rebuild_plot(cls, series, kwargs):
+    """Recreate a plot when unpickling it."""
+    return cls(*series, **kwargs)
 
 
 class Plot:
@@ -91,6 +97,16 @@ class Plot:
     size : (float, float) or None, optional
         Set the size of the plot, `(width, height)`. Default to None.
 
+    Notes
+    =====
+
+    Data series created with ``n="auto"`` (or ``n1="auto"``, ...) compute
+    their number of discretization points from the size in pixels of the
+    plot: for example, a line gets one point per pixel along the horizontal
+    direction, whereas a domain coloring image gets one point per pixel of
+    the area it covers. Hence, the cost of the evaluation follows the
+    resolution of the output.
+
     Examples
     ========
 
@@ -171,6 +187,10 @@ class Plot:
     ranges over [-pi, pi]).
     """
 
+    _default_pixel_size = (640, 480)
+    # Approximate size (width, height) in pixels of the plot area, used when
+    # `size` is not provided.
+
     def __new__(cls, *args, **kwargs):
         backend = cls._get_backend(kwargs)
         return super().__new__(backend)
@@ -287,6 +307,84 @@ class Plot:
         self.size = None
         check_and_set("size", kwargs.get("size", None))
 
+        self._set_auto_discretization()
+        self._check_memory_budget()
+
+    def _get_pixel_size(self):
+        """Return the size (width, height) in pixels of the area where the
+        data series are going to be rendered.
+        """
+        if self.size is not None:
+            return self.size
+        return self._default_pixel_size
+
+    def _set_auto_discretization(self):
+        """Compute the number of discretization points of the data series
+        created with ``n="auto"``, based on the size of the plot.
+        """
+        pixels = self._get_pixel_size()
+        for s in self._series:
+            s._set_auto_discretization(pixels)
+
+    def _check_memory_budget(self):
+        """Compare the estimated memory required to evaluate the data series
+        with the budget set in ``cfg["evaluation"]["memory_budget"]``.
+        If the budget is exceeded, apply ``cfg["evaluation"]["memory_policy"]``:
+
+        * ``"reduce"``: reduce the number of discretization points.
+        * ``"chunk"``: evaluate the expressions in chunks, in order to reduce
+          the memory used by the intermediate results.
+        * ``"raise"``: raise an error.
+        """
+        # NOTE: import it here, as `set_defaults` replaces the dictionary
+        from spb.defaults import cfg
+
+        budget = cfg["evaluation"]["memory_budget"]
+        policy = cfg["evaluation"]["memory_policy"]
+        if budget is None:
+            return
+        if policy not in ["reduce", "chunk", "raise"]:
+            raise ValueError(
+                "`memory_policy` must be one of the following values: "
+                "'reduce', 'chunk', 'raise'. Received: '{}'".format(policy))
+
+        estimates = [s.estimate_memory() for s in self._series]
+        total = sum(estimates)
+        if total <= budget:
+            return
+
+        msg = ("The estimated memory required to evaluate the data series "
+            "({} bytes) exceeds the budget ({} bytes). ".format(total, budget))
+
+        if policy == "reduce":
+            reducible = [s for s in self._series if s._discretization_attrs]
+            fixed = total - sum(e for s, e in zip(self._series, estimates)
+                if s._discretization_attrs)
+            if (len(reducible) == 0) or (fixed >= budget):
+                raise ValueError(msg +
+                    "The number of discretization points can't be reduced "
+                    "enough to satisfy the budget.")
+            factor = (budget - fixed) / (total - fixed)
+            for s in reducible:
+                s._reduce_discretization(factor)
+            warnings.warn(msg + "The number of discretization points has "
+                "been reduced.")
+        elif policy == "chunk":
+            outputs = sum(s._get_number_of_points() * s._bytes_per_point
+                for s in self._series)
+            if outputs >= budget:
+                raise ValueError(msg +
+                    "Chunked evaluation can't satisfy the budget: reduce "
+                    "the number of discretization points.")
+            chunk = int((budget - outputs) /
+                (len(self._series) * _VECTORIZE_BYTES_PER_POINT))
+            for s in self._series:
+                s._chunk_size = max(chunk, 1)
+            warnings.warn(msg + "The expressions are going to be evaluated "
+                "in chunks of {} points.".format(max(chunk, 1)))
+        else:
+            raise ValueError(msg)
+
     def _copy_kwargs(self):
         """Copy the values of the plot attributes into a dictionary which will
         be later used to create a new `Plot` object having the same attributes.
@@ -388,6 +486,132 @@ class Plot:
         """
         raise NotImplementedError
 
+    def stream(self, index, x, y):
+        """Append new points to a streaming data series (for example, a
+        ``StreamingList2DSeries``) and push them to the figure, if it has
+        already been created. Only the new points are sent to the plotting
+        library, whenever it supports incremental updates.
+
+        Parameters
+        ==========
+
+        index : int
+            Index of the streaming series in the plot.
+
+        x, y : float, list or np.ndarray
+            Coordinates of the new points.
+
+        Examples
+        ========
+
+        .. code-block:: python
+
+           from spb.series import StreamingList2DSeries
+           from spb.backends.matplotlib import MB
+           s = StreamingList2DSeries(window=1000)
+           p = MB(s, show=False)
+           p.show()
+           # whenever a new batch of samples is available
+           p.stream(0, new_x, new_y)
+
+        """
+        s = self._series[index]
+        if not s.is_streaming:
+            raise ValueError(
+                "The series at index {} is not a streaming ".format(index) +
+                "series. Received: {}".format(type(s).__name__))
+        s.append(x, y)
+        self._update_streaming(index)
+
+    def _update_streaming(self, index):
+        """Implement the logic to push the new points of the streaming
+        series at position ``index`` to the figure.
+        """
+        raise NotImplementedError
+
+    def __reduce__(self):
+        # NOTE: the figures created by the plotting libraries are usually
+        # not picklable. The plot is recreated from its data series and
+        # options: the figure is going to be rebuilt on first use.
+        return (_rebuild_plot,
+            (type(self), self.series, self._do_sum_kwargs(self, self)))
+
+    def bake(self):
+        """Evaluate the data series and store their numerical data, which is
+        included when the plot is pickled. This allows to evaluate a plot in
+        one process and to render it in another process, without evaluating
+        the expressions again.
+
+        Examples
+        ========
+
+        .. code-block:: python
+
+           import pickle
+           p = plot(sin(x), show=False)
+           p.bake()
+           data = pickle.dumps(p)
+           # in another process
+           p = pickle.loads(data)
+           p.show()
+
+        """
+        for s in self.series:
+            s.bake()
+
+    def _get_artists_nbytes(self):
+        """Return a list of tuples ``(name, nbytes)``, one for each object
+        (artist) of the figure containing numerical data, where ``nbytes``
+        is the number of bytes held by its arrays. Backends should override
+        this method.
+        """
+        return []
+
+    def memory_report(self):
+        """Report the memory held by the data series and by the objects
+        created by the plotting library. Note that the figure is going
+        to be created (hence, the data series evaluated) if it doesn't
+        exist yet.
+
+        Returns
+        =======
+
+        report : dict
+            A dictionary with the following keys:
+
+            * ``"series"``: list of dictionaries, one for each data series,
+              with keys ``"series"`` (string representation), ``"estimated"``
+              (estimated peak memory of the evaluation, in bytes) and
+              ``"nbytes"`` (bytes currently held by the series).
+            * ``"artists"``: list of dictionaries, one for each object of
+              the figure, with keys ``"artist"`` (type name) and
+              ``"nbytes"``.
+            * ``"total"``: bytes held by the series and the artists.
+
+        Examples
+        ========
+
+        .. code-block:: python
+
+           from sympy import symbols, sin
+           from spb import plot
+           x = symbols("x")
+           p = plot(sin(x), show=False)
+           p.memory_report()
+        """
+        # make sure the figure has been populated
+        self.fig
+
+        series = [dict(
+            series=str(s),
+            estimated=s.estimate_memory(),
+            nbytes=_get_nbytes(s.__dict__)) for s in self._series]
+        artists = [dict(artist=name, nbytes=nbytes)
+            for name, nbytes in self._get_artists_nbytes()]
+        total = (sum(s["nbytes"] for s in series) +
+            sum(a["nbytes"] for a in artists))
+        return dict(series=series, artists=artists, total=total)
+
     def show(self):
         """Implement the functionalities to display the plot."""
         raise NotImplementedError
@@ -1,6 +1,7 @@
 from sympy.external import import_module
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
+from spb.backends.utils import _get_nbytes
 import os
 
 
@@ -236,6 +237,7 @@ class BokehBackend(Plot):
     """
 
     _library = "bokeh"
+    _default_pixel_size = (600, 400)
 
     colorloop = []
     colormaps = []
@@ -388,7 +390,7 @@ class BokehBackend(Plot):
                         x, y = s.get_data()
                         source = {
                             "xs": x if not s.is_polar else y * np.cos(x),
-                            "ys": x if not s.is_polar else y * np.sin(x)
+                            "ys": y if not s.is_polar else y * np.sin(x)
                         }
 
                     lkw = dict(line_width=2,
@@ -405,8 +407,8 @@ class BokehBackend(Plot):
                         self._fig.circle("xs", "ys", source=source, **kw)
 
             elif s.is_contour and (not s.is_complex):
-                x, y, z = s.get_data()
-                x, y, zz = [t.flatten() for t in [x, y, z]]
+                x, y, z = s.get_data(fields=("x1d", "y1d", "z"))
+                zz = z.flatten()
                 minx, miny, minz = min(x), min(y), min(zz)
                 maxx, maxy, maxz = max(x), max(y), max(zz)
 
@@ -502,6 +504,21 @@ class BokehBackend(Plot):
                         major_label_overrides={k: v for k, v in zip(ticks, labels)})
                     self._fig.add_layout(colorbar1, "right")
 
+            elif s.is_implicit and (not s.is_3Dsurface):
+                points = s.get_data()
+                if points[-1] != "lines":
+                    raise NotImplementedError(
+                        "{} is not supported by {}: only equalities can be "
+                        "plotted.".format(type(s), type(self).__name__)
+                    )
+                # the level curve is an ordinary line
+                x, y, _ = points
+                lkw = dict(line_width=2,
+                    legend_label=s.get_label(self._use_latex),
+                    color=next(self._cl))
+                kw = merge({}, lkw, s.rendering_kw)
+                self._fig.line(x, y, **kw)
+
             elif s.is_geometry:
                 x, y = s.get_data()
                 color = next(self._cl)
@@ -580,6 +597,31 @@ class BokehBackend(Plot):
             color_mapper=color_mapper, title=name, width=8)
         return data_source, glyph, colorbar, kw
 
+    def _get_artists_nbytes(self):
+        return [(type(r.glyph).__name__, _get_nbytes(dict(r.data_source.data)))
+            for r in self._fig.renderers if hasattr(r, "data_source")]
+
+    def _update_streaming(self, index):
+        np = import_module('numpy')
+
+        if len(self.series) != len(self._fig.renderers):
+            # the figure has not been created yet: the new points are going
+            # to be rendered together with the others
+            return
+        s = self.series[index]
+        source = self._fig.renderers[index].data_source
+        if s.steps or s.is_polar:
+            # the new points modify the previous ones
+            x, y = s.get_data()
+            source.data.update({
+                "xs": x if not s.is_polar else y * np.cos(x),
+                "ys": y if not s.is_polar else y * np.sin(x)
+            })
+            return
+        # only the new points are sent to the browser
+        x, y = s._get_new_points()
+        source.stream({"xs": x, "ys": y}, rollover=s.window)
+
     def _update_interactive(self, params):
         np = import_module('numpy')
 
@@ -612,7 +654,7 @@ class BokehBackend(Plot):
                     rend[i].data_source.data.update(source)
 
                 elif s.is_contour and (not s.is_complex):
-                    x, y, z = s.get_data()
+                    z, = s.get_data(fields=("z",))
                     cb = self._handles[i]
                     rend[i].data_source.data.update({"image": [z]})
                     zz = z.flatten()
@@ -649,7 +691,7 @@ class BokehBackend(Plot):
                 elif s.is_complex and s.is_domain_coloring and not s.is_3Dsurface:
                     # TODO: for some unkown reason, domain_coloring and
                     # interactive plot don't like each other...
-                    x, y, mag, angle, img, _ = s.get_data()
+                    mag, angle, img = s.get_data(fields=("abs", "arg", "img"))
                     img = self._get_img(img)
                     source = {
                         "image": [img],
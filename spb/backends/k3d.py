@@ -1,7 +1,7 @@
 from sympy.external import import_module
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
-from spb.backends.utils import compute_streamtubes
+from spb.backends.utils import compute_streamtubes, _get_nbytes
 from spb.utils import get_vertices_indices
 import warnings
 import os
@@ -84,6 +84,7 @@ class K3DBackend(Plot):
     """
 
     _library = "k3d"
+    _default_pixel_size = (800, 512)
 
     colormaps = []
     cyclic_colormaps = []
@@ -247,6 +248,33 @@ class K3DBackend(Plot):
                 line = self.k3d.line(vertices, **kw)
                 self._fig += line
 
+            elif s.is_3Dsurface and s.is_mesh:
+                # the triangulation computed by the adaptive algorithm
+                if s.is_parametric:
+                    x, y, z, u, v, faces = s.get_data(
+                        fields=("x", "y", "z", "u", "v", "faces"))
+                    attribute = s.color_func(x, y, z, u, v)
+                else:
+                    x, y, z, faces = s.get_data(
+                        fields=("x", "y", "z", "faces"))
+                    attribute = s.color_func(x, y, z)
+                vertices = np.column_stack([x, y, z]).astype(np.float32)
+                self._high_aspect_ratio(x, y, z)
+                a = dict(
+                    name=s.get_label(self._use_latex, "%s") if self._show_label else None,
+                    side="double",
+                    flat_shading=False,
+                    wireframe=False,
+                    color=self._convert_to_int(next(self._cl)),
+                )
+                if s.use_cm:
+                    attribute = np.asarray(attribute, dtype=np.float32)
+                    a["color_map"] = next(self._cm)
+                    a["attribute"] = attribute
+                    a["color_range"] = [attribute.min(), attribute.max()]
+                kw = merge({}, a, s.rendering_kw)
+                self._fig += self.k3d.mesh(vertices, faces.astype(np.uint32), **kw)
+
             elif (s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit)):
                 if s.is_parametric:
                     x, y, z, u, v = s.get_data()
@@ -281,20 +309,17 @@ class K3DBackend(Plot):
                 self._fig += surf
 
             elif s.is_implicit and s.is_3Dsurface:
-                _, _, _, r = s.get_data()
-                xmin, xmax = s.start_x, s.end_x
-                ymin, ymax = s.start_y, s.end_y
-                zmin, zmax = s.start_z, s.end_z
+                # only the triangles of the surface are sent to the figure
+                vertices, faces = s.get_mesh()
                 a = dict(
-                    xmin=xmin, xmax=xmax,
-                    ymin=ymin, ymax=ymax,
-                    zmin=zmin, zmax=zmax,
-                    compression_level=9,
-                    level=0.0, flat_shading=True,
+                    name=s.get_label(self._use_latex, "%s") if self._show_label else None,
+                    side="double",
+                    flat_shading=True,
                     color=self._convert_to_int(next(self._cl))
                 )
                 kw = merge({}, a, s.rendering_kw)
-                plt_iso = self.k3d.marching_cubes(r.astype(np.float32), **kw)
+                plt_iso = self.k3d.mesh(vertices.astype(np.float32),
+                    faces.astype(np.uint32), **kw)
 
                 self._fig += plt_iso
 
@@ -360,7 +385,8 @@ class K3DBackend(Plot):
                 self._fig += vec
 
             elif s.is_complex and s.is_3Dsurface:
-                x, y, mag, arg, colors, colorscale = s.get_data()
+                x, y, mag, colors, colorscale = s.get_data(
+                    fields=("x", "y", "abs", "img", "colors"))
 
                 x, y, z = [t.flatten() for t in [x, y, mag]]
                 vertices = np.vstack([x, y, z]).T.astype(np.float32)
@@ -464,6 +490,10 @@ class K3DBackend(Plot):
         elif self.zlim:
             self._bounds.append([mx, Mx, my, My, self.zlim[0], self.zlim[1]])
 
+    def _get_artists_nbytes(self):
+        return [(type(o).__name__, _get_nbytes(o.trait_values()))
+            for o in self._fig.objects]
+
     def _update_interactive(self, params):
         np = import_module('numpy')
 
@@ -521,7 +551,8 @@ class K3DBackend(Plot):
                     self.fig.objects[i].vectors = vectors
 
                 elif s.is_complex and s.is_3Dsurface:
-                    x, y, mag, _, colors, _ = s.get_data()
+                    x, y, mag, colors = s.get_data(
+                        fields=("x", "y", "abs", "img"))
                     x, y, z = [t.flatten().astype(np.float32) for t in [x, y, mag]]
                     vertices = np.vstack([x, y, z]).astype(np.float32)
                     self._fig.objects[i].vertices = vertices.T
@@ -1,9 +1,10 @@
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
-from spb.backends.utils import compute_streamtubes
+from spb.backends.utils import compute_streamtubes, _get_nbytes
 from sympy import latex
 from sympy.external import import_module
 import itertools
+import warnings
 
 # Global variable
 # Set to False when running tests / doctests so that the plots don't show.
@@ -18,28 +19,16 @@ def unset_show():
     _show = False
 
 
-def _matplotlib_list(interval_list):
+def _rectangles_to_vertices(rectangles):
     """
-    Returns lists for matplotlib `fill` command from a list of bounding
-    rectangular intervals
+    Returns the vertices for matplotlib's `PolyCollection` from an array of
+    rectangles, whose rows are ``[x_start, x_end, y_start, y_end]``.
     """
-    xlist = []
-    ylist = []
-    if len(interval_list):
-        for intervals in interval_list:
-            intervalx = intervals[0]
-            intervaly = intervals[1]
-            xlist.extend(
-                [intervalx.start, intervalx.start, intervalx.end, intervalx.end, None]
-            )
-            ylist.extend(
-                [intervaly.start, intervaly.end, intervaly.end, intervaly.start, None]
-            )
-    else:
-        # XXX Ugly hack. Matplotlib does not accept empty lists for `fill`
-        xlist.extend([None, None, None, None])
-        ylist.extend([None, None, None, None])
-    return xlist, ylist
+    np = import_module('numpy')
+    x1, x2, y1, y2 = np.asarray(rectangles, dtype=float).reshape(-1, 4).T
+    return np.stack([
+        np.column_stack([x1, x1, x2, x2]),
+        np.column_stack([y1, y2, y2, y1])], axis=-1)
 
 
 class MatplotlibBackend(Plot):
@@ -73,6 +62,12 @@ class MatplotlibBackend(Plot):
         contour/contourf function to customize the appearance.
         Refer to [#fn1]_ to learn more about customization.
 
+    dpi : float, optional
+        Resolution of the figure in dots per inch. Together with ``size``
+        (in inches), it determines the number of discretization points of
+        the data series created with ``n="auto"``. Default to Matplotlib's
+        ``rcParams["figure.dpi"]``.
+
     image_kw : dict, optional
         A dictionary of keywords/values which is passed to Matplotlib's
         imshow function to customize the appearance.
@@ -140,6 +135,7 @@ class MatplotlibBackend(Plot):
         self.plt = self.matplotlib.pyplot
         self.cm = cm = self.matplotlib.cm
         self.LineCollection = self.matplotlib.collections.LineCollection
+        self.PolyCollection = self.matplotlib.collections.PolyCollection
         self.ListedColormap = self.matplotlib.colors.ListedColormap
         self.Normalize = self.matplotlib.colors.Normalize
 
@@ -153,6 +149,7 @@ class MatplotlibBackend(Plot):
 
 
         self._init_cyclers()
+        self.dpi = kwargs.get("dpi", None)
         super().__init__(*args, **kwargs)
 
         # set labels
@@ -202,6 +199,15 @@ class MatplotlibBackend(Plot):
         self._cm = process_iterator(self._cm, self.colormaps)
         self._cyccm = process_iterator(self._cyccm, self.cyclic_colormaps)
 
+    def _get_pixel_size(self):
+        rc = self.plt.rcParams
+        size = self.size if self.size is not None else rc["figure.figsize"]
+        dpi = self.dpi if self.dpi is not None else rc["figure.dpi"]
+        # the axes only cover a fraction of the figure
+        fx = rc["figure.subplot.right"] - rc["figure.subplot.left"]
+        fy = rc["figure.subplot.top"] - rc["figure.subplot.bottom"]
+        return size[0] * dpi * fx, size[1] * dpi * fy
+
     def _create_figure(self):
         is_3Dvector = any([s.is_3Dvector for s in self.series])
         aspect = self.aspect
@@ -226,9 +232,10 @@ class MatplotlibBackend(Plot):
             self.ax = self._plotgrid_ax
         else:
             if not self.is_iplot:
-                self._fig = self.plt.figure(figsize=self.size)
+                self._fig = self.plt.figure(figsize=self.size, dpi=self.dpi)
             else:
-                self._fig = self.matplotlib.figure.Figure(figsize=self.size)
+                self._fig = self.matplotlib.figure.Figure(figsize=self.size,
+                    dpi=self.dpi)
 
             is_3D = [s.is_3D for s in self.series]
             if any(is_3D) and (not all(is_3D)):
@@ -410,6 +417,38 @@ class MatplotlibBackend(Plot):
                 ylims.append((np.amin(y), np.amax(y)))
                 zlims.append((np.amin(z), np.amax(z)))
 
+            elif s.is_3Dsurface and s.is_mesh:
+                # the triangulation computed by the adaptive algorithm
+                if s.is_parametric:
+                    x, y, z, u, v, faces = s.get_data(
+                        fields=("x", "y", "z", "u", "v", "faces"))
+                    facecolors = s.color_func(x, y, z, u, v)
+                else:
+                    x, y, z, faces = s.get_data(
+                        fields=("x", "y", "z", "faces"))
+                    facecolors = s.color_func(x, y, z)
+                skw = dict(linewidth=0.1)
+                if s.use_cm:
+                    skw["cmap"] = next(self._cm)
+                else:
+                    skw["color"] = next(self._cl)
+                kw = merge({}, skw, s.rendering_kw)
+                if len(faces) == 0:
+                    warnings.warn("The triangulation of `{}` ".format(
+                        s.get_label(False)) + "doesn't contain any triangle: "
+                        + "nothing to render.")
+                    continue
+                c = self.ax.plot_trisurf(x, y, faces, z, **kw)
+                if s.use_cm:
+                    # by default, the triangles are colored by z
+                    c.set_array(facecolors[faces].mean(axis=1))
+                    c.autoscale()
+                is_cb_added = self._add_colorbar(c, s.get_label(self._use_latex), s.use_cm)
+                self._add_handle(i, c, kw, is_cb_added, self._fig.axes[-1])
+                xlims.append((np.amin(x), np.amax(x)))
+                ylims.append((np.amin(y), np.amax(y)))
+                zlims.append((np.amin(z), np.amax(z)))
+
             elif (s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit)):
                 if not s.is_parametric:
                     x, y, z = self.series[i].get_data()
@@ -439,30 +478,49 @@ class MatplotlibBackend(Plot):
                 ylims.append((np.amin(y), np.amax(y)))
                 zlims.append((np.amin(z), np.amax(z)))
 
+            elif s.is_implicit and s.is_3Dsurface:
+                vertices, faces = s.get_mesh()
+                x, y, z = vertices.T
+                skw = dict(color=next(self._cl), linewidth=0)
+                kw = merge({}, skw, s.rendering_kw)
+                if len(faces) > 0:
+                    c = self.ax.plot_trisurf(x, y, faces, z, **kw)
+                    self._add_handle(i, c, kw)
+                else:
+                    warnings.warn("The surface `{}` ".format(s.get_label(False))
+                        + "doesn't cross the plotting volume: nothing to "
+                        + "render.")
+                xlims.append((s.start_x, s.end_x))
+                ylims.append((s.start_y, s.end_y))
+                zlims.append((s.start_z, s.end_z))
+
             elif s.is_implicit and not s.is_3Dsurface:
                 points = s.get_data()
-                if len(points) == 2:
-                    # interval math plotting
-                    x, y = _matplotlib_list(points[0])
-                    c = self.ax.fill(x, y, color=next(self._cl),
-                        edgecolor="None")
+                plot_type = points[-1]
+                if plot_type == "fill":
+                    # interval math plotting: all the rectangles are drawn
+                    # as a single collection
+                    c = self.PolyCollection(
+                        _rectangles_to_vertices(points[0]),
+                        facecolor=next(self._cl), edgecolor="None")
+                    self.ax.add_collection(c)
                     self._add_handle(i, c)
+                elif plot_type == "lines":
+                    # equality: the level curve is an ordinary line
+                    x, y, _ = points
+                    lkw = dict(label=s.get_label(self._use_latex),
+                        color=next(self._cl))
+                    kw = merge({}, lkw, s.rendering_kw)
+                    c, = self.ax.plot(x, y, **kw)
+                    self._add_handle(i, c, kw)
                 else:
-                    # use contourf or contour depending on whether it is
-                    # an inequality or equality.
-                    xarray, yarray, zarray, plot_type = points
+                    # inequality: use contourf
+                    xarray, yarray, zarray, _ = points
                     color = next(self._cl)
-                    if plot_type == "contour":
-                        colormap = self.ListedColormap([color, color])
-                        ckw = dict(cmap=colormap)
-                        kw = merge({}, ckw, s.rendering_kw)
-                        c = self.ax.contour(xarray, yarray, zarray, [0.0],
-                            **kw)
-                    else:
-                        colormap = self.ListedColormap(["white", color])
-                        ckw = dict(cmap=colormap)
-                        kw = merge({}, ckw, s.rendering_kw)
-                        c = self.ax.contourf(xarray, yarray, zarray, **kw)
+                    colormap = self.ListedColormap(["white", color])
+                    ckw = dict(cmap=colormap)
+                    kw = merge({}, ckw, s.rendering_kw)
+                    c = self.ax.contourf(xarray, yarray, zarray, **kw)
                     self._add_handle(i, c, kw)
 
             elif s.is_vector:
@@ -558,7 +616,8 @@ class MatplotlibBackend(Plot):
 
             elif s.is_complex:
                 if not s.is_3Dsurface:
-                    x, y, _, _, img, colors = s.get_data()
+                    x, y, img, colors = s.get_data(
+                        fields=("x", "y", "img", "colors"))
                     ikw = dict(
                         extent=[np.amin(x), np.amax(x), np.amin(y), np.amax(y)],
                         interpolation="nearest",
@@ -585,7 +644,8 @@ class MatplotlibBackend(Plot):
                             [r"-$\pi$", r"-$\pi / 2$", "0", r"$\pi / 2$", r"$\pi$"]
                         )
                 else:
-                    x, y, mag, arg, facecolors, colorscale = s.get_data()
+                    x, y, mag, facecolors, colorscale = s.get_data(
+                        fields=("x", "y", "abs", "img", "colors"))
 
                     skw = dict(rstride=1, cstride=1, linewidth=0.1)
                     if s.use_cm:
@@ -788,6 +848,26 @@ class MatplotlibBackend(Plot):
         mappable = self.cm.ScalarMappable(cmap=cmap, norm=norm)
         self._fig.colorbar(mappable, orientation="vertical", label=label, cax=cax)
 
+    def _get_artists_nbytes(self):
+        if self.ax.name == "3d":
+            # 3D collections only expose the vertices projected on the
+            # screen, which are computed when the figure is drawn
+            self._fig.canvas.draw()
+        artists = (list(self.ax.lines) + list(self.ax.collections) +
+            list(self.ax.images) + list(self.ax.patches))
+        nbytes = []
+        for a in artists:
+            arrays = []
+            for m in ["get_xydata", "get_data_3d", "get_array", "get_offsets"]:
+                if hasattr(a, m):
+                    arrays.append(getattr(a, m)())
+            if hasattr(a, "get_paths"):
+                arrays.extend([p.vertices for p in a.get_paths()])
+            # components of the quivers
+            arrays.extend([getattr(a, "U", None), getattr(a, "V", None)])
+            nbytes.append((type(a).__name__, _get_nbytes(arrays)))
+        return nbytes
+
     def _update_interactive(self, params):
         np = import_module('numpy')
         mpl_toolkits = import_module(
@@ -878,19 +958,18 @@ class MatplotlibBackend(Plot):
 
                 elif s.is_implicit and not s.is_3Dsurface:
                     points = s.get_data()
-                    if len(points) == 2:
+                    plot_type = points[-1]
+                    if plot_type == "fill":
                         raise NotImplementedError
+                    elif plot_type == "lines":
+                        x, y, _ = points
+                        self._handles[i][0].set_data(x, y)
                     else:
                         for c in self._handles[i][0].collections:
                             c.remove()
-                        xx, yy, zz, ones, plot_type = points
+                        xx, yy, zz, _ = points
                         kw = self._handles[i][1]
-                        if plot_type == "contour":
-                            self._handles[i][0] = self.ax.contour(
-                                xx, yy, zz, [0.0], **kw
-                            )
-                        else:
-                            self._handles[i][0] = self.ax.contourf(xx, yy, ones, **kw)
+                        self._handles[i][0] = self.ax.contourf(xx, yy, zz, **kw)
                         xlims.append((np.amin(xx), np.amax(xx)))
                         ylims.append((np.amin(yy), np.amax(yy)))
 
@@ -936,11 +1015,12 @@ class MatplotlibBackend(Plot):
 
                 elif s.is_complex:
                     if not s.is_3Dsurface:
-                        x, y, _, _, img, colors = s.get_data()
+                        img, = s.get_data(fields=("img",))
                         self._handles[i][0].remove()
                         self._handles[i][0] = self.ax.imshow(img, **self._handles[i][1])
                     else:
-                        x, y, mag, arg, facecolors, colorscale = s.get_data()
+                        x, y, mag, facecolors = s.get_data(
+                            fields=("x", "y", "abs", "img"))
                         self._handles[i][0].remove()
                         kw = self._handles[i][1]
                         if s.use_cm:
@@ -969,6 +1049,19 @@ class MatplotlibBackend(Plot):
 
         self._set_lims(xlims, ylims, zlims)
 
+    def _update_streaming(self, index):
+        if index not in self._handles:
+            # the figure has not been created yet: the new points are going
+            # to be rendered together with the others
+            return
+        # NOTE: Line2D only supports replacing its data. The window of a
+        # streaming series is a view of its buffer, so no copies are made.
+        x, y = self.series[index].get_data()
+        self._handles[index][0].set_data(x, y)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self._fig.canvas.draw_idle()
+
     def process_series(self):
         """ Loop over data series, generates numerical data and add it to the
         figure.
@@ -1,12 +1,22 @@
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
-from spb.backends.utils import get_seeds_points
+from spb.backends.utils import get_seeds_points, _get_nbytes
 from sympy.external import import_module
 import itertools
 import warnings
 import os
 
 
+def _cast_unsupported_dtype(*arrays):
+    """Plotly can't serialize arrays of some dtypes, for example float16:
+    cast them to float32. The other arrays are returned untouched.
+    """
+    np = import_module('numpy')
+    return [a.astype(np.float32)
+        if isinstance(a, np.ndarray) and (a.dtype == np.float16) else a
+        for a in arrays]
+
+
 class PlotlyBackend(Plot):
     """
     A backend for plotting SymPy's symbolic expressions using Plotly.
@@ -101,6 +111,7 @@ class PlotlyBackend(Plot):
     """
 
     _library = "plotly"
+    _default_pixel_size = (700, 450)
 
     colorloop = []
     colormaps = []
@@ -291,7 +302,7 @@ class PlotlyBackend(Plot):
                     kw = merge({}, lkw, s.rendering_kw)
                     self._fig.add_trace(go.Scatter(x=x, y=y, **kw))
                 else:
-                    x, y = s.get_data()
+                    x, y = _cast_unsupported_dtype(*s.get_data())
                     color = next(self._cl)
                     lkw = dict(
                         name=s.get_label(self._use_latex),
@@ -346,6 +357,29 @@ class PlotlyBackend(Plot):
                 kw = merge({}, lkw, s.rendering_kw)
                 self._fig.add_trace(go.Scatter3d(x=x, y=y, z=z, **kw))
 
+            elif s.is_3Dsurface and s.is_mesh:
+                # the triangulation computed by the adaptive algorithm
+                if s.is_parametric:
+                    xx, yy, zz, uu, vv, faces = s.get_data(
+                        fields=("x", "y", "z", "u", "v", "faces"))
+                    intensity = s.color_func(xx, yy, zz, uu, vv)
+                else:
+                    xx, yy, zz, faces = s.get_data(
+                        fields=("x", "y", "z", "faces"))
+                    intensity = s.color_func(xx, yy, zz)
+                col = next(self._cl)
+                skw = dict(
+                    name=s.get_label(self._use_latex),
+                    showscale=self.legend and show_3D_colorscales,
+                    colorbar=self._create_colorbar(ii, s.get_label(self._use_latex)),
+                    colorscale=next(self._cm) if s.use_cm else [[0, col], [1, col]],
+                    intensity=intensity,
+                )
+                kw = merge({}, skw, s.rendering_kw)
+                self._fig.add_trace(go.Mesh3d(x=xx, y=yy, z=zz,
+                    i=faces[:, 0], j=faces[:, 1], k=faces[:, 2], **kw))
+                count += 1
+
             elif s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit):
                 if not s.is_parametric:
                     xx, yy, zz = s.get_data()
@@ -374,30 +408,21 @@ class PlotlyBackend(Plot):
                 count += 1
 
             elif s.is_3Dsurface and s.is_implicit:
-                xx, yy, zz, rr = s.get_data()
-                # create a solid color
-                col = next(self._cl)
-                colorscale = [[0, col], [1, col]]
+                # only the triangles of the surface are sent to the figure
+                vertices, faces = s.get_mesh()
                 skw = dict(
-                    isomin=0,
-                    isomax=0,
-                    showscale=False,
-                    colorscale=colorscale
+                    name=s.get_label(self._use_latex),
+                    color=next(self._cl),
+                    flatshading=True
                 )
                 kw = merge({}, skw, s.rendering_kw)
-                self._fig.add_trace(go.Isosurface(
-                    x=xx.flatten(),
-                    y=yy.flatten(),
-                    z=zz.flatten(),
-                    value=rr.flatten(), **kw
-                ))
+                self._fig.add_trace(go.Mesh3d(
+                    x=vertices[:, 0], y=vertices[:, 1], z=vertices[:, 2],
+                    i=faces[:, 0], j=faces[:, 1], k=faces[:, 2], **kw))
                 count += 1
 
-
             elif s.is_contour and (not s.is_complex):
-                xx, yy, zz = s.get_data()
-                xx = xx[0, :]
-                yy = yy[:, 0]
+                xx, yy, zz = s.get_data(fields=("x1d", "y1d", "z"))
                 ckw = dict(
                     contours=dict(
                         coloring=None,
@@ -550,7 +575,8 @@ class PlotlyBackend(Plot):
 
                     count += 1
                 else:
-                    xx, yy, mag, angle, colors, colorscale = s.get_data()
+                    xx, yy, mag, angle, colorscale = s.get_data(
+                        fields=("x", "y", "abs", "arg", "colors"))
                     if s.coloring != "a":
                         warnings.warn(
                             "Plotly doesn't support custom coloring "
@@ -604,6 +630,21 @@ class PlotlyBackend(Plot):
 
                     count += 1
 
+            elif s.is_implicit and (not s.is_3Dsurface):
+                points = s.get_data()
+                if points[-1] != "lines":
+                    raise NotImplementedError(
+                        "{} is not supported by {}: only equalities can be "
+                        "plotted.".format(type(s), type(self).__name__)
+                    )
+                # the level curve is an ordinary line
+                x, y, _ = points
+                lkw = dict(
+                    name=s.get_label(self._use_latex), mode="lines", line_color=next(self._cl)
+                )
+                kw = merge({}, lkw, s.rendering_kw)
+                self._fig.add_trace(go.Scatter(x=x, y=y, **kw))
+
             elif s.is_geometry:
                 x, y = s.get_data()
                 lkw = dict(
@@ -617,6 +658,28 @@ class PlotlyBackend(Plot):
                     "{} is not supported by {}".format(type(s), type(self).__name__)
                 )
 
+    def _get_artists_nbytes(self):
+        return [(type(t).__name__, _get_nbytes(t.to_plotly_json()))
+            for t in self._fig.data]
+
+    def _update_streaming(self, index):
+        if len(self.series) != len(self._fig.data):
+            # the figure has not been created yet: the new points are going
+            # to be rendered together with the others
+            return
+        # NOTE: plotly.py doesn't expose Plotly.extendTraces: the trace
+        # receives the current window of the streaming series, which is
+        # bounded when a rolling window is used.
+        s = self.series[index]
+        x, y = _cast_unsupported_dtype(*s.get_data())
+        with self._fig.batch_update():
+            if s.is_polar:
+                self._fig.data[index]["r"] = y
+                self._fig.data[index]["theta"] = x
+            else:
+                self._fig.data[index]["x"] = x
+                self._fig.data[index]["y"] = y
+
     def _update_interactive(self, params):
         np = import_module('numpy')
         plotly = import_module(
@@ -637,7 +700,7 @@ class PlotlyBackend(Plot):
                     self.fig.data[i]["customdata"] = param
 
                 elif s.is_2Dline:
-                    x, y = self.series[i].get_data()
+                    x, y = _cast_unsupported_dtype(*self.series[i].get_data())
                     if not s.is_polar:
                         if s.is_geometry:
                             self.fig.data[i]["x"] = x
@@ -670,7 +733,7 @@ class PlotlyBackend(Plot):
                     self.fig.data[i]["cmax"] = _max
 
                 elif s.is_contour and (not s.is_complex):
-                    _, _, zz = s.get_data()
+                    zz, = s.get_data(fields=("z",))
                     self.fig.data[i]["z"] = zz
 
                 elif s.is_vector and s.is_3D:
@@ -705,7 +768,7 @@ class PlotlyBackend(Plot):
                         # interactive plot don't like each other...
                         raise NotImplementedError
                     else:
-                        xx, yy, mag, angle, colors, colorscale = s.get_data()
+                        mag, angle = s.get_data(fields=("abs", "arg"))
                         self.fig.data[i]["z"] = mag
                         self.fig.data[i]["surfacecolor"] = angle
                         self.fig.data[i]["customdata"] = angle
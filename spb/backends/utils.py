@@ -593,3 +593,26 @@ def compute_streamtubes(xx, yy, zz, uu, vv, ww, kwargs):
             c = c + len(l) + 1
 
     return vertices, attributes
+
+
+def _get_nbytes(obj, _depth=0, _seen=None):
+    """Return the number of bytes held by the Numpy arrays contained in
+    ``obj``, which can be an array or a (nested) list, tuple or dictionary.
+    Arrays shared between multiple containers are counted only once.
+    """
+    np = import_module('numpy')
+
+    if _seen is None:
+        _seen = set()
+    if isinstance(obj, np.ndarray):
+        if id(obj) in _seen:
+            return 0
+        _seen.add(id(obj))
+        return obj.nbytes
+    if _depth > 3:
+        return 0
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_get_nbytes(o, _depth + 1, _seen) for o in obj)
+    return 0
@@ -1,9 +1,10 @@
 from sympy.core.containers import Tuple
 from sympy.functions.elementary.miscellaneous import sqrt
-from sympy.functions.elementary.complexes import re, im, arg
+from sympy.functions.elementary.complexes import re, im, arg, Abs
 from sympy.core.expr import Expr
 from sympy.core.symbol import Dummy, symbols
 from sympy.core.numbers import I
+from sympy.external import import_module
 from spb.defaults import cfg
 import warnings
 
@@ -15,9 +16,12 @@ from spb.series import (
     ComplexPointInteractiveSeries,
     _set_discretization_points,
     SurfaceOver2DRangeSeries,
-    InteractiveSeries
+    ContourSeries,
+    InteractiveSeries,
+    Vector2DSeries,
+    ComplexVector2DSeries,
+    VectorScalarSeries
 )
-from spb.vectors import plot_vector
 from spb.utils import _plot_sympify, _check_arguments, _is_range
 from spb.defaults import TWO_D_B, THREE_D_B
 
@@ -28,6 +32,30 @@ from spb.defaults import TWO_D_B, THREE_D_B
 #   create "domain coloring" plots.
 
 
+def _get_array_points(a):
+    """If ``a`` represents complex points with NumPy arrays, return a tuple
+    ``(points, label)`` to be used to create a complex point series, where
+    ``points`` is either an array or a tuple of two arrays (real and
+    imaginary parts). Otherwise, return None.
+    """
+    np = import_module('numpy')
+
+    if isinstance(a, np.ndarray):
+        return a, ""
+    if not isinstance(a, (list, tuple, Tuple)):
+        return None
+    arrays = [t for t in a if isinstance(t, np.ndarray)]
+    labels = [t for t in a if isinstance(t, str)]
+    if (len(arrays) == 0) or (len(arrays) + len(labels) != len(a)):
+        return None
+    label = labels[0] if len(labels) > 0 else ""
+    if len(arrays) == 1:
+        return arrays[0], label
+    if (len(arrays) == 2) and not any(np.iscomplexobj(t) for t in arrays):
+        return tuple(arrays), label
+    return None
+
+
 def _build_series(*args, interactive=False, **kwargs):
     series = []
     # apply the user-specified function to the expression
@@ -53,7 +81,13 @@ def _build_series(*args, interactive=False, **kwargs):
     # option to be used with lambdify with complex functions
     kwargs.setdefault("modules", cfg["complex"]["modules"])
 
-    if all([hasattr(a, "is_complex") and a.is_complex for a in args]):
+    array_points = [_get_array_points(a) for a in args]
+    if (len(args) > 0) and all(t is not None for t in array_points):
+        # args are NumPy arrays of complex points, or real/imaginary parts
+        cls = ComplexPointSeries if not interactive else ComplexPointInteractiveSeries
+        for points, label in array_points:
+            series.append(cls(points, label, **kwargs))
+    elif all([hasattr(a, "is_complex") and a.is_complex for a in args]):
         # args is a list of complex numbers
         cls = ComplexPointSeries if not interactive else ComplexPointInteractiveSeries
         for a in args:
@@ -357,9 +391,11 @@ def plot_real_imag(*args, **kwargs):
         respectively, when `adaptive=False`. For line plots, default to 1000.
         For surface/contour plots (2D and 3D), default to 300.
 
-    n : int, optional
+    n : int or "auto", optional
         Set the same number of discretization points in all directions to be
         used when `adaptive=False`.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     real : boolean, optional
         If True, plot the real part of the complex function. Default to True.
@@ -626,9 +662,11 @@ def plot_complex(*args, **kwargs):
         respectively, when `adaptive=False`. For line plots, default to 1000.
         For surface/contour plots (2D and 3D), default to 300.
 
-    n : int, optional
+    n : int or "auto", optional
         Set the same number of discretization points in all directions to be
         used when `adaptive=False`.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : boolean, optional
         Default to True, in which case the plot will be shown on the screen.
@@ -807,8 +845,12 @@ def plot_complex_list(*args, **kwargs):
     Parameters
     ==========
     args :
-        numbers : list, tuple
-            A list of complex numbers.
+        numbers : list, tuple, np.ndarray
+            A list of complex numbers. NumPy arrays of complex numbers are
+            used as they are, without sympifying or copying them. The real
+            and imaginary parts can also be provided as two separate real
+            arrays, grouped in a tuple: ``(re, im)`` or
+            ``(re, im, label)``.
 
         label : str
             The name associated to the list of the complex numbers to be
@@ -914,6 +956,20 @@ def plot_complex_list(*args, **kwargs):
        [0]: complex points (0.0, 0.0666666666666667*exp(0.133333333333333*I*pi), 0.133333333333333*exp(0.266666666666667*I*pi), 0.2*exp(0.4*I*pi), 0.266666666666667*exp(0.533333333333333*I*pi), 0.333333333333333*exp(0.666666666666667*I*pi), 0.4*exp(0.8*I*pi), 0.466666666666667*exp(0.933333333333333*I*pi), 0.533333333333333*exp(1.06666666666667*I*pi), 0.6*exp(1.2*I*pi), 0.666666666666667*exp(1.33333333333333*I*pi), 0.733333333333333*exp(1.46666666666667*I*pi), 0.8*exp(1.6*I*pi), 0.866666666666667*exp(1.73333333333333*I*pi), 0.933333333333333*exp(1.86666666666667*I*pi))
        [1]: complex points (0, 0.133333333333333*exp(0.133333333333333*I*pi), 0.266666666666667*exp(0.266666666666667*I*pi), 0.4*exp(0.4*I*pi), 0.533333333333333*exp(0.533333333333333*I*pi), 0.666666666666667*exp(0.666666666666667*I*pi), 0.8*exp(0.8*I*pi), 0.933333333333333*exp(0.933333333333333*I*pi), 1.06666666666667*exp(1.06666666666667*I*pi), 1.2*exp(1.2*I*pi), 1.33333333333333*exp(1.33333333333333*I*pi), 1.46666666666667*exp(1.46666666666667*I*pi), 1.6*exp(1.6*I*pi), 1.73333333333333*exp(1.73333333333333*I*pi), 1.86666666666667*exp(1.86666666666667*I*pi))
 
+    Plot large sets of complex numbers, for example the eigenvalues of a
+    random matrix, with NumPy arrays:
+
+    .. plot::
+       :context: close-figs
+       :format: doctest
+       :include-source: True
+
+       >>> import numpy as np
+       >>> eigs = np.linalg.eigvals(np.random.randn(500, 500))
+       >>> plot_complex_list((eigs, "eigenvalues"), is_filled=False)
+       Plot object containing:
+       [0]: complex points: array of 500 points
+
     See Also
     ========
 
@@ -978,14 +1034,19 @@ def plot_complex_vector(*args, **kwargs):
         Number of discretization points for the quivers or streamlines in the
         x/y-direction, respectively. Default to 25.
 
-    n : int
+    n : int or "auto"
         Set the same number of discretization points in all directions for
         the quivers or streamlines. It overrides `n1`, `n2`.
         Default to 25.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     nc : int
         Number of discretization points for the scalar contour plot.
-        Default to 100.
+        Default to 100. When the scalar field is computed from the
+        vector field (`scalar=True`, `"abs"` or `"arg"`), this number is
+        slightly adjusted so that the quivers lie on a subset of the
+        contour's grid: the complex function is then evaluated only once.
 
     quiver_kw : dict
         A dictionary of keywords/values which is passed to the backend
@@ -996,10 +1057,13 @@ def plot_complex_vector(*args, **kwargs):
         Represents the scalar field to be plotted in the background of a 2D
         vector field plot. Can be:
 
-        - `True`: plot the magnitude of the vector field. Only works when a
-          single vector field is plotted.
+        - `True` or `"abs"`: plot the magnitude of the vector field. Only
+          works when a single vector field is plotted.
+        - `"arg"`: plot the argument of the complex function. Only works
+          when a single vector field is plotted.
         - `False`/`None`: do not plot any scalar field.
-        - `Expr`: a symbolic expression representing the scalar field.
+        - `Expr`: a symbolic expression of the complex variable,
+          representing the scalar field.
         - `list`/`tuple`: [scalar_expr, label], where the label will be
           shown on the colorbar.
 
@@ -1077,8 +1141,22 @@ def plot_complex_vector(*args, **kwargs):
        >>> plot_complex_vector(z**2, (z, -5 - 5j, 5 + 5j),
        ...     quiver_kw=dict(color="orange"), grid=False)
        Plot object containing:
-       [0]: contour: sqrt(((re(_x) - im(_y))**2 - (re(_y) + im(_x))**2)**2 + 4*(re(_x) - im(_y))**2*(re(_y) + im(_x))**2) for _x over (-5.0, 5.0) and _y over (-5.0, 5.0)
-       [1]: 2D vector series: [(re(_x) - im(_y))**2 - (re(_y) + im(_x))**2, 2*(re(_x) - im(_y))*(re(_y) + im(_x))] over (_x, -5.0, 5.0), (_y, -5.0, 5.0)
+       [0]: contour: Abs(z**2) for re(z) over (-5.0, 5.0) and im(z) over (-5.0, 5.0)
+       [1]: complex 2D vector series: [re(z**2), im(z**2)] over (re(z), -5.0, 5.0), (im(z), -5.0, 5.0)
+
+    Quivers plot with a contour plot in background representing the
+    argument of the complex function.
+
+    .. plot::
+       :context: close-figs
+       :format: doctest
+       :include-source: True
+
+       >>> plot_complex_vector(z**2, (z, -5 - 5j, 5 + 5j), scalar="arg",
+       ...     grid=False)
+       Plot object containing:
+       [0]: contour: arg(z**2) for re(z) over (-5.0, 5.0) and im(z) over (-5.0, 5.0)
+       [1]: complex 2D vector series: [re(z**2), im(z**2)] over (re(z), -5.0, 5.0), (im(z), -5.0, 5.0)
 
     Only quiver plot.
 
@@ -1089,7 +1167,7 @@ def plot_complex_vector(*args, **kwargs):
 
        >>> plot_complex_vector(z**2, (z, -5 - 5j, 5 + 5j), scalar=False)
        Plot object containing:
-       [0]: 2D vector series: [(re(_x) - im(_y))**2 - (re(_y) + im(_x))**2, 2*(re(_x) - im(_y))*(re(_y) + im(_x))] over (_x, -5.0, 5.0), (_y, -5.0, 5.0)
+       [0]: complex 2D vector series: [re(z**2), im(z**2)] over (re(z), -5.0, 5.0), (im(z), -5.0, 5.0)
 
     Only streamlines plot.
 
@@ -1100,7 +1178,7 @@ def plot_complex_vector(*args, **kwargs):
 
        >>> plot_complex_vector(z**2, (z, -5 - 5j, 5 + 5j), scalar=False, streamlines=True)
        Plot object containing:
-       [0]: 2D vector series: [(re(_x) - im(_y))**2 - (re(_y) + im(_x))**2, 2*(re(_x) - im(_y))*(re(_y) + im(_x))] over (_x, -5.0, 5.0), (_y, -5.0, 5.0)
+       [0]: complex 2D vector series: [re(z**2), im(z**2)] over (re(z), -5.0, 5.0), (im(z), -5.0, 5.0)
 
     Quivers plot for multiple complex expressions:
 
@@ -1111,8 +1189,8 @@ def plot_complex_vector(*args, **kwargs):
 
        >>> plot_complex_vector((z**2, (z, -5 - 5j, 5 + 0j)), (z**3, (z, -5 - 0j, 5 + 5j)))
        Plot object containing:
-       [0]: 2D vector series: [(re(_x) - im(_y))**2 - (re(_y) + im(_x))**2, 2*(re(_x) - im(_y))*(re(_y) + im(_x))] over (_x, -5.0, 5.0), (_y, -5.0, 0.0)
-       [1]: 2D vector series: [(re(_x) - im(_y))**3 - 3*(re(_x) - im(_y))*(re(_y) + im(_x))**2, 3*(re(_x) - im(_y))**2*(re(_y) + im(_x)) - (re(_y) + im(_x))**3] over (_x, -5.0, 5.0), (_y, 0.0, 5.0)
+       [0]: complex 2D vector series: [re(z**2), im(z**2)] over (re(z), -5.0, 5.0), (im(z), -5.0, 0.0)
+       [1]: complex 2D vector series: [re(z**3), im(z**3)] over (re(z), -5.0, 5.0), (im(z), 0.0, 5.0)
 
     See Also
     ========
@@ -1120,54 +1198,71 @@ def plot_complex_vector(*args, **kwargs):
     plot_real_imag, plot_complex, plot_complex_list
 
     """
-    # for each argument, generate two series: one for the real part and
-    # another for the imaginary part
-    kwargs["absarg"] = False
-    kwargs["abs"] = False
-    kwargs["arg"] = False
-    kwargs["real"] = True
-    kwargs["imag"] = True
-    kwargs["threed"] = False
-
     args = _plot_sympify(args)
-    series = _build_series(*args, **kwargs)
-    multiple_expr = len(series) > 2
-
-    def get_label(i):
-        _iterable = args[i] if multiple_expr else args
-        for t in _iterable:
-            if isinstance(t, str):
-                return t
-        return str(args[i][0] if multiple_expr else args[0])
-
-    # create new arguments to be used by plot_vector
-    new_args = []
-    x, y = symbols("x, y", cls=Dummy)
-    for i in range(int(len(series) / 2)):
-        s1 = series[2 * i]
-        s2 = series[2 * i + 1]
-        expr1 = s1.expr
-        expr2 = s2.expr
-        free_symbols = list(expr1.free_symbols)
-        if len(free_symbols) > 0:
-            fs = free_symbols[0]
-            expr1 = expr1.subs({fs: x + I * y})
-            expr2 = expr2.subs({fs: x + I * y})
-        r1 = (x, s1.start.real, s1.end.real)
-        r2 = (y, s1.start.imag, s1.end.imag)
-        label = get_label(i)
-        new_args.append(((expr1, expr2), r1, r2, label))
-
-    # substitute the complex variable in the scalar field
-    scalar = kwargs.get("scalar", None)
-    if scalar is not None:
-        if isinstance(scalar, Expr):
-            scalar = scalar.subs({fs: x + I * y})
-        elif isinstance(scalar, (list, tuple)):
-            scalar = list(scalar)
-            scalar[0] = scalar[0].subs({fs: x + I * y})
-        kwargs["scalar"] = scalar
-
+    kwargs = _set_discretization_points(kwargs, Vector2DSeries)
+    kwargs.setdefault("aspect", "equal")
+    kwargs.setdefault("legend", True)
     kwargs.setdefault("xlabel", "x")
     kwargs.setdefault("ylabel", "y")
-    return plot_vector(*new_args, **kwargs)
+    show = kwargs.pop("show", True)
+
+    # use the complex machinery to parse the arguments: one series is going
+    # to be created for each complex function. These series are never
+    # evaluated, they only provide expressions, ranges and labels.
+    kw = kwargs.copy()
+    kw.update({"absarg": True, "real": False, "imag": False,
+        "abs": False, "arg": False, "threed": False})
+    # option to be used with lambdify with complex functions
+    kwargs.setdefault("modules", cfg["complex"]["modules"])
+    series = [
+        ComplexVector2DSeries(s.expr, (s.var, s.start, s.end), s.label,
+            **kwargs)
+        for s in _build_series(*args, **kw)
+    ]
+
+    scalar = kwargs.get("scalar", True)
+    nc = kwargs.pop("nc", 100)
+    cs_kwargs = kwargs.copy()
+    cs_kwargs["n1"] = nc
+    cs_kwargs["n2"] = nc
+    if (scalar is True) or (scalar in ["abs", "arg"]):
+        # the scalar field is computed from the same evaluation of the
+        # complex function used by the vector field
+        if len(series) == 1:
+            scalar = "abs" if scalar is True else scalar
+            s = series[0]
+            func, label = {
+                "abs": (Abs, "Magnitude"), "arg": (arg, "Argument")
+            }[scalar]
+            series = [VectorScalarSeries(s, func(s.expr), label,
+                kind=scalar, **cs_kwargs)] + series
+    elif isinstance(scalar, (Expr, list, tuple)):
+        # the scalar field is a function of the complex variable: rewrite it
+        # as a function of two real variables and plot it over the entire
+        # region covered by all vector fields.
+        expr, label = ((scalar, str(scalar)) if isinstance(scalar, Expr)
+            else scalar)
+        x, y = symbols("x, y", cls=Dummy, real=True)
+        expr = expr.subs({series[-1].var: x + I * y})
+        rx = [s.ranges[0][1:] for s in series]
+        ry = [s.ranges[1][1:] for s in series]
+        series = [ContourSeries(expr,
+            (x, min(t[0] for t in rx), max(t[1] for t in rx)),
+            (y, min(t[0] for t in ry), max(t[1] for t in ry)),
+            label, **cs_kwargs)] + series
+    elif scalar:
+        raise ValueError(
+            "`scalar` must be either:\n"
+            + "1. True or 'abs', in which case the magnitude of the vector "
+            + "field will be plotted.\n"
+            + "2. 'arg': the argument of the complex function.\n"
+            + "3. a symbolic expression representing a scalar field.\n"
+            + "4. None/False: do not plot any scalar field.\n"
+            + "5. list/tuple of two elements, [scalar_expr, label]."
+        )
+
+    Backend = kwargs.pop("backend", TWO_D_B)
+    p = Backend(*series, **kwargs)
+    if show:
+        p.show()
+    return p
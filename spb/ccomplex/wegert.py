@@ -208,7 +208,7 @@ def create_colorscale(N=256):
     return colorscale
 
 
-def wegert(coloring, w, phaseres=20, N=256):
+def wegert(coloring, w, phaseres=20, N=256, compute_img=True):
     """ Choose between different domain coloring options.
 
     Parameters
@@ -247,10 +247,14 @@ def wegert(coloring, w, phaseres=20, N=256):
     N : int
         Number of discretized color in the colorscale. Default to 256.
 
+    compute_img : bool
+        If False, the image is not computed and `None` is returned in its
+        place. Useful when only the colorscale is needed. Default to True.
+
     Returns
     =======
 
-    img : np.ndarray [n x m x 3]
+    img : np.ndarray [n x m x 3] or None
         An array of RGB colors (0 <= R,G,B <= 255)
 
     colorscale : np.ndarray [N x 3] or None
@@ -276,6 +280,7 @@ def wegert(coloring, w, phaseres=20, N=256):
                 mapping.keys())
         )
     func, create_cc = mapping[coloring]
+    img = func(w, phaseres) if compute_img else None
     if create_cc:
-        return func(w, phaseres), create_colorscale(N)
-    return func(w, phaseres), None
+        return img, create_colorscale(N)
+    return img, None
@@ -0,0 +1,386 @@
+"""
+Vectorized extraction of level curves and level surfaces from functions
+sampled on a grid.
+
+The level curves are returned as NaN-separated polylines, which every
+backend is able to draw as an ordinary line, while the level surfaces are
+returned as triangle meshes: this is much lighter than sending the entire
+grid of values to a contouring routine.
+"""
+
+from itertools import permutations
+from sympy.external import import_module
+
+
+def _edge_points(x, y, z, nodes):
+    """Compute the coordinates of the zero crossings located on the given
+    edges, by linear interpolation of the values at their ends.
+
+    Edges are numbered as follows, with ``ny, nx = z.shape``: the
+    horizontal edge between ``z[j, i]`` and ``z[j, i+1]`` is
+    ``j * (nx - 1) + i``, the vertical edge between ``z[j, i]`` and
+    ``z[j+1, i]`` is ``ny * (nx - 1) + j * nx + i``.
+    """
+    np = import_module('numpy')
+    ny, nx = z.shape
+    n_horizontal = ny * (nx - 1)
+    horizontal = nodes < n_horizontal
+    j, i = np.divmod(nodes, nx - 1)
+    jv, iv = np.divmod(nodes - n_horizontal, nx)
+    j = np.where(horizontal, j, jv)
+    i = np.where(horizontal, i, iv)
+    # index of the other end of the edge
+    j2 = np.where(horizontal, j, j + 1)
+    i2 = np.where(horizontal, i + 1, i)
+    z1, z2 = z[j, i], z[j2, i2]
+    t = z1 / (z1 - z2)
+    px = x[i] + t * (x[i2] - x[i])
+    py = y[j] + t * (y[j2] - y[j])
+    return px, py
+
+
+def _segments(z):
+    """Return the segments of the level curve as a [n x 2] array of edge
+    numbers, where each row connects two zero crossings located in the same
+    cell of the grid.
+    """
+    np = import_module('numpy')
+    ny, nx = z.shape
+    finite = np.isfinite(z)
+    positive = z > 0
+
+    # zero crossings on horizontal and vertical edges
+    hc = positive[:, :-1] != positive[:, 1:]
+    vc = positive[:-1, :] != positive[1:, :]
+
+    # cells are identified by their bottom-left corner (j, i)
+    valid = (finite[:-1, :-1] & finite[:-1, 1:] &
+        finite[1:, 1:] & finite[1:, :-1])
+    j, i = [t.ravel() for t in np.meshgrid(
+        np.arange(ny - 1), np.arange(nx - 1), indexing="ij")]
+    n_horizontal = ny * (nx - 1)
+    # edges of each cell, in the order: bottom, right, top, left
+    edges = np.column_stack([
+        j * (nx - 1) + i,
+        n_horizontal + j * nx + i + 1,
+        (j + 1) * (nx - 1) + i,
+        n_horizontal + j * nx + i])
+    crossings = np.column_stack([
+        hc[:-1, :].ravel(), vc[:, 1:].ravel(),
+        hc[1:, :].ravel(), vc[:, :-1].ravel()])
+    crossings &= valid.ravel()[:, None]
+    count = crossings.sum(axis=1)
+
+    # cells crossed once by the curve
+    two = count == 2
+    segments = [edges[two][crossings[two]].reshape(-1, 2)]
+
+    # saddle cells: the curve crosses all the edges. The ambiguity is
+    # resolved with the value at the center of the cell.
+    four = np.flatnonzero(count == 4)
+    if len(four) > 0:
+        b, r, t, l = edges[four].T
+        jf, if_ = j[four], i[four]
+        center = (z[jf, if_] + z[jf, if_ + 1] + z[jf + 1, if_ + 1] +
+            z[jf + 1, if_]) / 4
+        # True: the segments cut off the bottom-right and the top-left
+        # corners. False: the bottom-left and the top-right corners.
+        cut = positive[jf, if_] == (center > 0)
+        segments.append(np.column_stack([
+            np.where(cut, b, l), np.where(cut, r, b)]))
+        segments.append(np.column_stack([
+            np.where(cut, t, r), np.where(cut, l, t)]))
+    return np.concatenate(segments)
+
+
+def _chain(segments, n_nodes):
+    """Join segments sharing an end into polylines.
+
+    Every node is shared by at most two segments, hence the segments form
+    open paths and closed loops.
+
+    Returns
+    =======
+
+    paths : list
+        Each element is a list of node indices. Closed loops end with
+        their first node.
+    """
+    np = import_module('numpy')
+    ends = segments.ravel()
+    others = segments[:, ::-1].ravel()
+    order = np.argsort(ends, kind="stable")
+    ends, others = ends[order], others[order]
+    # position of each segment end among the ends sharing the same node
+    first = np.searchsorted(ends, ends, side="left")
+    slot = np.arange(len(ends)) - first
+    neighbors = np.full((n_nodes, 2), -1)
+    neighbors[ends, slot] = others
+    degree = (neighbors >= 0).sum(axis=1)
+
+    neighbors = neighbors.tolist()
+    visited = bytearray(n_nodes)
+    paths = []
+    # open paths start at nodes with a single neighbor, then closed loops
+    for start in np.concatenate([np.flatnonzero(degree == 1),
+            np.flatnonzero(degree == 2)]).tolist():
+        if visited[start]:
+            continue
+        visited[start] = 1
+        path = [start]
+        prev, current = -1, start
+        while True:
+            a, b = neighbors[current]
+            nxt = b if a == prev else a
+            if nxt < 0:
+                break
+            if visited[nxt]:
+                if nxt == start:
+                    path.append(start)
+                break
+            visited[nxt] = 1
+            path.append(nxt)
+            prev, current = current, nxt
+        paths.append(path)
+    return paths
+
+
+def marching_squares(x, y, z, level=0):
+    """Extract the level curve ``f(x, y) = level`` of a function sampled
+    on a rectangular grid, using the marching squares algorithm with
+    linear interpolation of the crossings.
+
+    Parameters
+    ==========
+
+    x : np.ndarray [n]
+        Discretization of the horizontal axis.
+    y : np.ndarray [m]
+        Discretization of the vertical axis.
+    z : np.ndarray [m x n]
+        Values of the function, where ``z[j, i] = f(x[i], y[j])``, like
+        the ones obtained by evaluating a function over ``np.meshgrid(x, y)``.
+        Non-finite values are excluded from the curve.
+    level : float
+        The value of the level curve. Default to 0.
+
+    Returns
+    =======
+
+    xc, yc : np.ndarray
+        Coordinates of the polylines, separated by NaN. Closed curves
+        end with their first point.
+    """
+    np = import_module('numpy')
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    z = np.asarray(z, dtype=float) - level
+    if (z.shape[0] < 2) or (z.shape[1] < 2):
+        return np.array([]), np.array([])
+
+    segments = _segments(z)
+    if len(segments) == 0:
+        return np.array([]), np.array([])
+    nodes, segments = np.unique(segments, return_inverse=True)
+    segments = segments.reshape(-1, 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        px, py = _edge_points(x, y, z, nodes)
+
+    indices = []
+    for path in _chain(segments, len(nodes)):
+        indices.extend(path)
+        indices.append(-1)
+    indices = np.array(indices[:-1])
+    separator = indices < 0
+    xc = np.where(separator, np.nan, px[indices])
+    yc = np.where(separator, np.nan, py[indices])
+    return xc, yc
+
+
+# Corners of a cube, numbered like the elements of a [2 x 2 x 2] array
+# flattened in C order.
+_CUBE_CORNERS = [(a, b, c) for a in (0, 1) for b in (0, 1) for c in (0, 1)]
+
+
+def _cube_tetrahedra():
+    """Split a cube into six tetrahedra sharing the diagonal between the
+    corners 0 and 7, one for each ordering of the axis. Adjacent cubes
+    are split along the same diagonals of their common face, hence the
+    resulting surfaces have no holes.
+    """
+    tetrahedra = []
+    for axis in permutations(range(3)):
+        corner = [0, 0, 0]
+        t = [0]
+        for a in axis:
+            corner[a] = 1
+            t.append(_CUBE_CORNERS.index(tuple(corner)))
+        tetrahedra.append(t)
+    return tetrahedra
+
+
+_TETRAHEDRA = _cube_tetrahedra()
+_TETRAHEDRON_EDGES = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+
+
+def _tetrahedron_triangles():
+    """Triangles of the level surface inside a tetrahedron, for each of the
+    16 combinations of the signs at its vertices. The i-th bit of the
+    combination is set if the value at the i-th vertex is positive.
+    Triangles are given by the indices of the edges containing their
+    vertices, and each combination has two triangles: unused ones are
+    filled with -1.
+    """
+    edge = lambda a, b: _TETRAHEDRON_EDGES.index((min(a, b), max(a, b)))
+    table = []
+    for case in range(16):
+        positive = [v for v in range(4) if (case >> v) & 1]
+        negative = [v for v in range(4) if not (case >> v) & 1]
+        triangles = []
+        if len(positive) in [1, 3]:
+            # a single vertex is cut off by a triangle
+            lone, others = ((positive[0], negative) if len(positive) == 1
+                else (negative[0], positive))
+            triangles.append([edge(lone, o) for o in others])
+        elif len(positive) == 2:
+            # the section is a quadrilateral, split into two triangles
+            (a, b), (c, d) = positive, negative
+            triangles.append([edge(a, c), edge(a, d), edge(b, d)])
+            triangles.append([edge(a, c), edge(b, d), edge(b, c)])
+        triangles += [[-1, -1, -1]] * (2 - len(triangles))
+        table.append(triangles)
+    return table
+
+
+_TETRAHEDRON_TRIANGLES = _tetrahedron_triangles()
+
+
+def _cells_to_mesh(x, y, z, ijk, values):
+    """Extract the zero level surface from a set of cells of a grid.
+
+    Parameters
+    ==========
+
+    x, y, z : np.ndarray
+        Discretizations of the axis.
+    ijk : np.ndarray [N x 3]
+        Indices of the cells: the corners of the cell ``i, j, k`` are
+        ``x[i:i+2], y[j:j+2], z[k:k+2]``.
+    values : np.ndarray [N x 2 x 2 x 2]
+        Values of the function at the corners of the cells.
+
+    Returns
+    =======
+
+    vertices : np.ndarray [V x 3]
+    faces : np.ndarray [F x 3]
+    """
+    np = import_module('numpy')
+    shape = (len(x), len(y), len(z))
+    tetrahedra = np.array(_TETRAHEDRA)
+    corners = np.array(_CUBE_CORNERS)
+    edges = np.array(_TETRAHEDRON_EDGES)
+
+    # values and grid nodes at the vertices of the tetrahedra [T x 4]
+    values = values.reshape(len(values), 8)[:, tetrahedra].reshape(-1, 4)
+    points = (ijk[:, None, :] + corners[None, :, :]).reshape(-1, 3)
+    nodes = np.ravel_multi_index(tuple(points.T), shape).reshape(-1, 8)
+    nodes = nodes[:, tetrahedra].reshape(-1, 4)
+
+    positive = values > 0
+    case = (positive * np.array([1, 2, 4, 8])).sum(axis=1)
+    case[~np.isfinite(values).all(axis=1)] = 0
+    triangles = np.array(_TETRAHEDRON_TRIANGLES)[case]
+    t, k = np.nonzero(triangles[:, :, 0] >= 0)
+    triangles = triangles[t, k]
+    t = t[:, None]
+
+    # every vertex of the mesh lies on an edge of the grid: the ones shared
+    # by adjacent triangles are identified by the nodes at the ends of
+    # the edge.
+    n1 = nodes[t, edges[triangles, 0]]
+    n2 = nodes[t, edges[triangles, 1]]
+    key = np.minimum(n1, n2) * np.prod(shape) + np.maximum(n1, n2)
+    key, first, faces = np.unique(key.ravel(), return_index=True,
+        return_inverse=True)
+    faces = faces.reshape(-1, 3)
+
+    axis = [np.asarray(a, dtype=float) for a in (x, y, z)]
+    coords = lambda n: np.column_stack([a[i] for a, i in zip(axis,
+        np.unravel_index(n, shape))])
+    v1 = values[t, edges[triangles, 0]].ravel()[first]
+    v2 = values[t, edges[triangles, 1]].ravel()[first]
+    p1, p2 = coords(n1.ravel()[first]), coords(n2.ravel()[first])
+    vertices = p1 + (v1 / (v1 - v2))[:, None] * (p2 - p1)
+
+    # orient the triangles so that their normals point toward the
+    # positive values of the function
+    tv = coords(nodes[t[:, 0]].ravel()).reshape(-1, 4, 3)
+    pos = positive[t[:, 0]][:, :, None]
+    direction = ((tv * pos).sum(axis=1) / pos.sum(axis=1) -
+        (tv * ~pos).sum(axis=1) / (~pos).sum(axis=1))
+    a, b, c = [vertices[faces[:, i]] for i in range(3)]
+    flip = (np.cross(b - a, c - a) * direction).sum(axis=1) < 0
+    faces[flip] = faces[flip][:, [0, 2, 1]]
+    return vertices, faces
+
+
+def marching_cubes(x, y, z, v, level=0):
+    """Extract the level surface ``f(x, y, z) = level`` of a function
+    sampled on a rectangular grid, as a triangle mesh.
+
+    Only the cells crossed by the surface are processed. Each of them is
+    split into six tetrahedra, in which the surface is approximated by one
+    or two triangles, whose vertices are computed by linear interpolation.
+    This avoids the ambiguous configurations of the original marching cubes
+    algorithm.
+
+    Parameters
+    ==========
+
+    x : np.ndarray [n1]
+    y : np.ndarray [n2]
+    z : np.ndarray [n3]
+        Discretizations of the axis.
+    v : np.ndarray [n1 x n2 x n3]
+        Values of the function, where ``v[i, j, k] = f(x[i], y[j], z[k])``,
+        like the ones obtained by evaluating a function over
+        ``np.meshgrid(x, y, z, indexing="ij")``. Non-finite values are
+        excluded from the surface.
+    level : float
+        The value of the level surface. Default to 0.
+
+    Returns
+    =======
+
+    vertices : np.ndarray [V x 3]
+        Coordinates of the vertices of the mesh.
+    faces : np.ndarray [F x 3]
+        Indices of the vertices of each triangle. Triangles are oriented
+        so that their normals point toward the region where
+        ``f(x, y, z) > level``.
+    """
+    np = import_module('numpy')
+    v = np.asarray(v, dtype=float) - level
+    n1, n2, n3 = v.shape
+    if min(v.shape) < 2:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=int)
+
+    # find the cells crossed by the surface without stacking the values
+    # at their corners
+    corner = lambda a, b, c: v[a:n1-1+a, b:n2-1+b, c:n3-1+c]
+    finite = np.ones((n1 - 1, n2 - 1, n3 - 1), dtype=bool)
+    positive = np.zeros_like(finite)
+    negative = np.zeros_like(finite)
+    for a, b, c in _CUBE_CORNERS:
+        w = corner(a, b, c)
+        finite &= np.isfinite(w)
+        positive |= w > 0
+        negative |= w <= 0
+    ijk = np.argwhere(finite & positive & negative)
+    if len(ijk) == 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=int)
+    values = np.stack([v[tuple((ijk + c).T)] for c in _CUBE_CORNERS],
+        axis=1).reshape(-1, 2, 2, 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _cells_to_mesh(x, y, z, ijk, values)
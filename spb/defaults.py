@@ -64,7 +64,24 @@ def _hardcoded_defaults():
             "use_cm": False
         },
         adaptive={
-            "goal": 0.01
+            "goal": 0.01,
+            # algorithm used by lines with adaptive=True: "native" or
+            # "adaptive" (the learners of the adaptive module)
+            "sampler": "native",
+            # maximum number of evaluation points. None means no limit.
+            "max_points": 10000
+        },
+        evaluation={
+            # time budget (in seconds) for the numerical evaluation of a
+            # data series. None means no limit.
+            "timeout": None,
+            # memory budget (in bytes) for the numerical evaluation of all
+            # the data series of a plot. None means no limit.
+            "memory_budget": None,
+            # what to do when the estimated memory exceeds the budget:
+            # "reduce" the number of discretization points, evaluate in
+            # "chunk"s or "raise" an error.
+            "memory_policy": "reduce"
         },
         plot_range={
             "min": -10,
@@ -24,14 +24,19 @@ from sympy.core.numbers import oo
 from sympy.concrete.summations import Sum
 from sympy.functions.elementary.complexes import sign
 from sympy.functions.elementary.piecewise import Piecewise, piecewise_fold
+from sympy.geometry import Point2D, Point3D, Polygon, Segment2D
 from sympy.sets.sets import EmptySet, FiniteSet, Interval, Union
-from spb.defaults import TWO_D_B, THREE_D_B
+from sympy.external import import_module
+from spb.defaults import TWO_D_B, THREE_D_B, cfg
+import os
 from spb.utils import _plot_sympify, _check_arguments, _unpack_args
 from spb.series import (
     LineOver1DRangeSeries, Parametric2DLineSeries, Parametric3DLineSeries,
     SurfaceOver2DRangeSeries, ContourSeries, ParametricSurfaceSeries,
     ImplicitSeries, _set_discretization_points,
-    List2DSeries, GeometrySeries, Implicit3DSeries
+    List2DSeries, StreamingList2DSeries, GeometrySeries,
+    GeometryCollectionSeries, Implicit3DSeries,
+    uniform_eval
 )
 
 # N.B.
@@ -53,6 +58,14 @@ def _process_piecewise(piecewise, _range, label, **kwargs):
     series of the same expression are created (for example, one covering
     `x < 0` and the other covering `x > 2`), both having the same label.
 
+    The interval decomposition is computed only once. Then, each expression
+    is lambdified and evaluated only once, over the concatenation of all the
+    points where it is needed: the endpoints of its intervals, the elements
+    of its finite sets and, with uniform sampling, the discretizations of its
+    intervals. The results are assigned to the series, so that nothing is
+    evaluated twice. With adaptive sampling, the lines are evaluated when
+    the plot is rendered.
+
     However, if a piece is outside of the provided plotting range, then it
     will not be added to the plot. This may lead to not-complete plots in some
     backend, such as BokehBackend, which is capable of auto-recompute the data
@@ -60,6 +73,8 @@ def _process_piecewise(piecewise, _range, label, **kwargs):
     shown (thus no data series), there won't be any line on the plot in this
     area.
     """
+    np = import_module('numpy')
+
     # initial range
     irange = Interval(_range[1], _range[2], False, False)
     # ultimately it will contain all the series
@@ -67,6 +82,16 @@ def _process_piecewise(piecewise, _range, label, **kwargs):
     # only contains Line2DSeries with is_filled=True. They have higher
     # rendering priority, as such they will be added to `series` at last.
     filled_series = []
+    # Points are going to be evaluated later. In the above lists, they are
+    # represented by placeholders: [expr, locations, is_filled, line]
+    points = []
+    # lines to be evaluated with uniform sampling: [expr, series]
+    lines = []
+
+    def add_point(correct_list, expr, loc, is_filled, line=None):
+        p = [expr, [float(t) for t in loc], is_filled, line]
+        points.append(p)
+        correct_list.append(p)
 
     def func(expr, _set, c, from_union=False):
         if isinstance(_set, Interval):
@@ -93,27 +118,19 @@ def _process_piecewise(piecewise, _range, label, **kwargs):
             main_series = LineOver1DRangeSeries(
                 expr, (_range[0], start, end), current_label, **kwargs)
             series.append(main_series)
-            xx, yy = main_series.get_data()
+            if not (main_series.adaptive or main_series.only_integers):
+                lines.append([expr, main_series])
 
-            if xx[0] != _range[1]:
+            if float(start) != float(_range[1]):
                 correct_list = series if _set.left_open else filled_series
-                correct_list.append(
-                    List2DSeries([xx[0]], [yy[0]], is_point=True,
-                        is_filled=not _set.left_open)
-                )
-            if xx[-1] != _range[2]:
+                add_point(correct_list, expr, [start],
+                    not _set.left_open, main_series)
+            if float(end) != float(_range[2]):
                 correct_list = series if _set.right_open else filled_series
-                correct_list.append(
-                    List2DSeries([xx[-1]], [yy[-1]], is_point=True,
-                        is_filled=not _set.right_open)
-                )
+                add_point(correct_list, expr, [end],
+                    not _set.right_open, main_series)
         elif isinstance(_set, FiniteSet):
-            loc, val = [], []
-            for _loc in _set.args:
-                loc.append(float(_loc))
-                val.append(float(expr.evalf(subs={_range[0]: _loc})))
-            filled_series.append(List2DSeries(loc, val, is_point=True,
-                is_filled=True))
+            add_point(filled_series, expr, _set.args, True)
             if not from_union:
                 c += 1
         elif isinstance(_set, Union):
@@ -143,7 +160,50 @@ def _process_piecewise(piecewise, _range, label, **kwargs):
     for expr, cond in expr_cond:
         count = func(expr, irange.intersection(cond), count)
 
-    series += filled_series
+    # collect the locations where each expression must be evaluated
+    locations = {}
+    for p in points:
+        locations.setdefault(p[0], []).append(np.array(p[1]))
+    # NOTE: with n="auto", the number of discretization points is only known
+    # once the plot is created: those lines are evaluated by their series.
+    lines = [t for t in lines if not isinstance(t[1].n, str)]
+    for line in lines:
+        expr, s = line
+        line.append(s._discretize(s.start.real, s.end.real, s.n,
+            scale=s.scale))
+        locations.setdefault(expr, []).append(line[-1])
+
+    # evaluate each expression once, with vectorized operations
+    results = {}
+    for expr, locs in locations.items():
+        xx = np.concatenate(locs)
+        yy = uniform_eval([_range[0]], expr, xx,
+            modules=kwargs.get("modules", None),
+            timeout=kwargs.get("timeout", cfg["evaluation"]["timeout"]))
+        yy = np.broadcast_to(yy, xx.shape).astype(complex)
+        results[expr] = np.split(yy, np.cumsum([len(t) for t in locs])[:-1])
+        results[expr].reverse()
+
+    for p in points:
+        yy = results[p[0]].pop()
+        _re, _im = np.real(yy).copy(), np.imag(yy)
+        _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
+        p.append(_re)
+    for expr, s, x in lines:
+        yy = results[expr].pop()
+        s._uniform_sampling_cache = (s._get_sampling_key(),
+            (x, np.real(yy), np.imag(yy)))
+
+    def to_series(p):
+        if not isinstance(p, list):
+            return p
+        expr, loc, is_filled, line, val = p
+        loc = np.array(loc)
+        if line is not None:
+            loc, val = line._apply_transform(loc, val)
+        return List2DSeries(loc, val, is_point=True, is_filled=is_filled)
+
+    series = [to_series(t) for t in series + filled_series]
     return series
 
 
@@ -244,9 +304,10 @@ def plot(*args, show=True, **kwargs):
             representation of `expr` will be used.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn1]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the intervals where the function deviates
+        from a straight line are refined in batches. Use `adaptive_goal`
+        and `max_points` to further customize the output.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -254,13 +315,24 @@ def plot(*args, show=True, **kwargs):
     adaptive_goal : callable, int, float or None
         Controls the "smoothness" of the evaluation. Possible values:
 
-        * `None` (default):  it will use the following goal:
-          `lambda l: l.loss() < 0.01`
+        * `None` (default): 0.01.
         * number (int or float). The lower the number, the more
-          evaluation points. This number will be used in the following goal:
-          `lambda l: l.loss() < number`
-        * callable: a function requiring one input element, the learner. It
-          must return a float number. Refer to [#fn1]_ for more information.
+          evaluation points. With `adaptive_sampler="native"`, an interval
+          is refined if the deviation at its midpoint is greater than
+          `number / 10` times the range of the function. With
+          `adaptive_sampler="adaptive"`, this number will be used in the
+          following goal: `lambda l: l.loss() < number`
+        * callable: a function requiring one input element, the learner of
+          the `adaptive` module [#fn1]_. It must return a float number.
+
+    adaptive_sampler : str, optional
+        The adaptive algorithm. Possible values:
+
+        * `"native"` (default): a built-in algorithm, which evaluates the
+          function over many points at once.
+        * `"adaptive"`: the learners of the `adaptive` module [#fn1]_,
+          which evaluate one point at a time. They are always used when
+          `loss_fn` or a callable `adaptive_goal` are provided.
 
     aspect : (float, float) or str, optional
         Set the aspect ratio of the plot. The value depends on the backend
@@ -279,16 +351,32 @@ def plot(*args, show=True, **kwargs):
         A function of 2 variables, x, y (the points computed by the internal
         algorithm) which defines the line color. Default to None.
 
-    detect_poles : boolean
+    detect_poles : boolean or str
         Chose whether to detect and correctly plot poles.
         Defaulto to `False`. To improve detection, increase the number of
         discretization points `n` and/or change the value of `eps`.
 
+        If `"symbolic"`, the poles are also located with SymPy's
+        `singularities` (once, when the data series is created): the lines
+        are broken there, and additional points approaching each pole are
+        evaluated. In interactive plots, this only happens if the poles
+        don't depend on the parameters.
+
     eps : float
         An arbitrary small value used by the `detect_poles` algorithm.
         Default value to 0.1. Before changing this value, it is recommended to
         increase the number of discretization points.
 
+    exploit_symmetry : boolean, optional
+        Only used with `adaptive=False`. If True, the expression is analyzed
+        with SymPy's `periodicity` and by reflecting its variable. If the
+        range covers at least two periods, only one period is evaluated
+        and the results are tiled: the discretization is slightly adjusted
+        to fit an integer number of points in a period. Otherwise, if the
+        function is even or odd and the range is symmetric with respect to
+        zero, only one half is evaluated and the results are mirrored.
+        Default to False.
+
     is_point : boolean, optional
         Default to False, which will render a line connecting all the points.
         If True, a scatter plot will be generated.
@@ -311,11 +399,34 @@ def plot(*args, show=True, **kwargs):
         * callable : Refer to [#fn1]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
-    n : int, optional
+    max_points : int or None, optional
+        The maximum number of evaluation points of the adaptive algorithms.
+        Default to 10000.
+
+    executor : str, Executor or None, optional
+        How the learners of the `adaptive` module evaluate the function.
+        Possible values:
+
+        * `None` (default): one point after the other.
+        * `"threads"`: a thread pool, useful with functions releasing the
+          GIL, like the ones evaluated by NumPy.
+        * `"processes"`: the reusable process pool of the `loky` module.
+          Only worth it when each evaluation is expensive.
+        * an object exposing a `map` method, for example an instance of
+          `concurrent.futures.Executor`. It will not be shut down.
+
+    batch_size : int or None, optional
+        The number of points requested to the learners of the `adaptive`
+        module at each iteration. Default to 1 when `executor=None`,
+        otherwise to the number of CPUs.
+
+    n : int or "auto", optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
         If the `adaptive` flag is set to `True`, this parameter will be
         ignored.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     only_integers : boolean, optional
         Default to `False`. If `True`, discretize the domain with integer
@@ -348,6 +459,13 @@ def plot(*args, show=True, **kwargs):
         numerical value. Default value to 1000. Note: the higher this number,
         the slower the evaluation.
 
+    timeout : int, float or None, optional
+        Time budget (in seconds) for the numerical evaluation of each
+        expression. If it is exceeded, the evaluation stops and the points
+        that couldn't be evaluated are set to NaN (or the adaptive algorithm
+        returns the points evaluated so far), with a warning. Default to
+        ``cfg["evaluation"]["timeout"]``, which is None (no time budget).
+
     title : str, optional
         Title of the plot.
 
@@ -571,9 +689,10 @@ def plot_parametric(*args, show=True, **kwargs):
             representation of `expr_x` and `expr_y` will be used.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn2]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the intervals where the function deviates
+        from a straight line are refined in batches. Use `adaptive_goal`
+        and `max_points` to further customize the output.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -581,13 +700,24 @@ def plot_parametric(*args, show=True, **kwargs):
     adaptive_goal : callable, int, float or None
         Controls the "smoothness" of the evaluation. Possible values:
 
-        * `None` (default):  it will use the following goal:
-          `lambda l: l.loss() < 0.01`
+        * `None` (default): 0.01.
         * number (int or float). The lower the number, the more
-          evaluation points. This number will be used in the following goal:
-          `lambda l: l.loss() < number`
-        * callable: a function requiring one input element, the learner. It
-          must return a float number. Refer to [#fn2]_ for more information.
+          evaluation points. With `adaptive_sampler="native"`, an interval
+          is refined if the deviation at its midpoint is greater than
+          `number / 10` times the range of the function. With
+          `adaptive_sampler="adaptive"`, this number will be used in the
+          following goal: `lambda l: l.loss() < number`
+        * callable: a function requiring one input element, the learner of
+          the `adaptive` module [#fn2]_. It must return a float number.
+
+    adaptive_sampler : str, optional
+        The adaptive algorithm. Possible values:
+
+        * `"native"` (default): a built-in algorithm, which evaluates the
+          function over many points at once.
+        * `"adaptive"`: the learners of the `adaptive` module [#fn2]_,
+          which evaluate one point at a time. They are always used when
+          `loss_fn` or a callable `adaptive_goal` are provided.
 
     aspect : (float, float) or str, optional
         Set the aspect ratio of the plot. The value depends on the backend
@@ -615,11 +745,34 @@ def plot_parametric(*args, show=True, **kwargs):
         * callable : Refer to [#fn2]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
-    n : int, optional
+    max_points : int or None, optional
+        The maximum number of evaluation points of the adaptive algorithms.
+        Default to 10000.
+
+    executor : str, Executor or None, optional
+        How the learners of the `adaptive` module evaluate the function.
+        Possible values:
+
+        * `None` (default): one point after the other.
+        * `"threads"`: a thread pool, useful with functions releasing the
+          GIL, like the ones evaluated by NumPy.
+        * `"processes"`: the reusable process pool of the `loky` module.
+          Only worth it when each evaluation is expensive.
+        * an object exposing a `map` method, for example an instance of
+          `concurrent.futures.Executor`. It will not be shut down.
+
+    batch_size : int or None, optional
+        The number of points requested to the learners of the `adaptive`
+        module at each iteration. Default to 1 when `executor=None`,
+        otherwise to the number of CPUs.
+
+    n : int or "auto", optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
         If the `adaptive` flag is set to `True`, this parameter will be
         ignored.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : bool, optional
         The default value is set to `True`. Set show to `False` and
@@ -787,9 +940,10 @@ def plot3d_parametric_line(*args, show=True, **kwargs):
             representation of the expression will be used.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn3]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the intervals where the function deviates
+        from a straight line are refined in batches. Use `adaptive_goal`
+        and `max_points` to further customize the output.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -797,13 +951,24 @@ def plot3d_parametric_line(*args, show=True, **kwargs):
     adaptive_goal : callable, int, float or None
         Controls the "smoothness" of the evaluation. Possible values:
 
-        * `None` (default):  it will use the following goal:
-          `lambda l: l.loss() < 0.01`
+        * `None` (default): 0.01.
         * number (int or float). The lower the number, the more
-          evaluation points. This number will be used in the following goal:
-          `lambda l: l.loss() < number`
-        * callable: a function requiring one input element, the learner. It
-          must return a float number. Refer to [#fn3]_ for more information.
+          evaluation points. With `adaptive_sampler="native"`, an interval
+          is refined if the deviation at its midpoint is greater than
+          `number / 10` times the range of the function. With
+          `adaptive_sampler="adaptive"`, this number will be used in the
+          following goal: `lambda l: l.loss() < number`
+        * callable: a function requiring one input element, the learner of
+          the `adaptive` module [#fn3]_. It must return a float number.
+
+    adaptive_sampler : str, optional
+        The adaptive algorithm. Possible values:
+
+        * `"native"` (default): a built-in algorithm, which evaluates the
+          function over many points at once.
+        * `"adaptive"`: the learners of the `adaptive` module [#fn3]_,
+          which evaluate one point at a time. They are always used when
+          `loss_fn` or a callable `adaptive_goal` are provided.
 
     backend : Plot, optional
         A subclass of `Plot`, which will perform the rendering.
@@ -822,11 +987,34 @@ def plot3d_parametric_line(*args, show=True, **kwargs):
         * callable : Refer to [#fn3]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
-    n : int, optional
+    max_points : int or None, optional
+        The maximum number of evaluation points of the adaptive algorithms.
+        Default to 10000.
+
+    executor : str, Executor or None, optional
+        How the learners of the `adaptive` module evaluate the function.
+        Possible values:
+
+        * `None` (default): one point after the other.
+        * `"threads"`: a thread pool, useful with functions releasing the
+          GIL, like the ones evaluated by NumPy.
+        * `"processes"`: the reusable process pool of the `loky` module.
+          Only worth it when each evaluation is expensive.
+        * an object exposing a `map` method, for example an instance of
+          `concurrent.futures.Executor`. It will not be shut down.
+
+    batch_size : int or None, optional
+        The number of points requested to the learners of the `adaptive`
+        module at each iteration. Default to 1 when `executor=None`,
+        otherwise to the number of CPUs.
+
+    n : int or "auto", optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
         If the `adaptive` flag is set to `True`, this parameter will be
         ignored.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : bool, optional
         The default value is set to `True`. Set show to `False` and
@@ -982,7 +1170,8 @@ def plot3d(*args, show=True, **kwargs):
 
         Set adaptive to `True` to use the adaptive algorithm implemented in
         [#fn4]_ to create smooth plots. Use `adaptive_goal` and `loss_fn`
-        to further customize the output.
+        to further customize the output. By default, the results are
+        interpolated over a uniform grid: see `triangulate`.
 
     adaptive_goal : callable, int, float or None
         Controls the "smoothness" of the evaluation. Possible values:
@@ -1004,6 +1193,15 @@ def plot3d(*args, show=True, **kwargs):
         internal algorithm) which defines the surface color when
         ``use_cm=True``. Default to None.
 
+    exploit_symmetry : boolean, optional
+        Only used with `adaptive=False`. If True, the expression is analyzed
+        with SymPy's `periodicity` and by reflecting each variable. Along a
+        direction where the range covers at least two periods, only one
+        period is evaluated and the results are tiled. Along a direction
+        where the function is even or odd and the range is symmetric with
+        respect to zero, only one half is evaluated and the results are
+        mirrored. Default to False.
+
     is_polar : boolean, optional
         Default to False. If True, requests a polar discretization. In this
         case, ``range_x`` represents the radius, ``range_y`` represents the
@@ -1018,6 +1216,21 @@ def plot3d(*args, show=True, **kwargs):
         * callable : Refer to [#fn4]_ for more information. Specifically,
           look at `adaptive.learner.learnerND` to find more loss functions.
 
+    max_points : int or None, optional
+        The maximum number of evaluation points of the `adaptive` learner.
+        Default to 10000.
+
+    executor : str, Executor or None, optional
+        How the `adaptive` learner evaluates the function. Possible values:
+        `None` (default, one point after the other), `"threads"`,
+        `"processes"` (requires `loky`) or an object exposing a `map`
+        method, for example an instance of `concurrent.futures.Executor`.
+
+    batch_size : int or None, optional
+        The number of points requested to the `adaptive` learner at each
+        iteration. Default to 1 when `executor=None`, otherwise to the
+        number of CPUs.
+
     n1 : int, optional
         The x range is sampled uniformly at `n1` of points. Default value
         is 100.
@@ -1026,9 +1239,11 @@ def plot3d(*args, show=True, **kwargs):
         The y range is sampled uniformly at `n2` of points. Default value
         is 100.
 
-    n : int, optional
+    n : int or "auto", optional
         The x and y ranges are sampled uniformly at `n` of points.
         It overrides `n1` and `n2`.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : bool, optional
         The default value is set to `True`. Set show to `False` and
@@ -1046,10 +1261,24 @@ def plot3d(*args, show=True, **kwargs):
         function to customize the appearance of surfaces. Refer to the
         plotting library (backend) manual for more informations.
 
+    timeout : int, float or None, optional
+        Time budget (in seconds) for the numerical evaluation of each
+        expression. If it is exceeded, the evaluation stops and the points
+        that couldn't be evaluated are set to NaN, with a warning. Default
+        to ``cfg["evaluation"]["timeout"]``, which is None (no time budget).
+
     title : str, optional
         Title of the plot. It is set to the latex representation of
         the expression, if the plot has only one expression.
 
+    triangulate : bool, optional
+        Only used with `adaptive=True`. If False (default), the results of
+        the adaptive algorithm are interpolated over a uniform grid, whose
+        size depends on the smallest triangle: it might require a lot of
+        memory. If True, the triangles computed by the adaptive algorithm
+        are rendered directly. Supported by `MatplotlibBackend`,
+        `PlotlyBackend` and `K3DBackend`.
+
     tx : callable, optional
         Apply a numerical function to the discretized domain in the
         x-direction.
@@ -1248,6 +1477,22 @@ def plot3d_parametric_surface(*args, show=True, **kwargs):
             The label to be shown in the legend.  If not provided, the string
             representation of the expression will be used.
 
+    adaptive : bool, optional
+        The default value is set to `False`, which uses a uniform grid of
+        `n1` and `n2` points along the u and v directions.
+
+        Set adaptive to `True` to refine the grid where the curvature of
+        the surface is high: a cell of the (u, v) grid is subdivided into
+        four if the point at its center deviates from the mean of its
+        corners. The result is a triangle mesh, whose vertices are
+        concentrated around sharp features. Supported by
+        `MatplotlibBackend`, `PlotlyBackend` and `K3DBackend`.
+
+    adaptive_goal : float, optional
+        Used when `adaptive=True`. A cell is subdivided if the deviation is
+        greater than `adaptive_goal / 10` times the size of the surface.
+        The lower the number, the more evaluation points. Default to 0.01.
+
     backend : Plot, optional
         A subclass of `Plot`, which will perform the rendering.
         Default to `MatplotlibBackend`.
@@ -1257,17 +1502,28 @@ def plot3d_parametric_surface(*args, show=True, **kwargs):
         internal algorithm and the parameters) which defines the surface color
         when ``use_cm=True``. Default to None.
 
+    depth : int, optional
+        Used when `adaptive=True`: the maximum number of subdivisions of
+        the cells of the initial grid. Default to 4.
+
+    max_points : int, optional
+        Used when `adaptive=True`: the maximum number of evaluation points.
+        The cells with the largest deviation are subdivided first. Default
+        to 10000.
+
     n1 : int, optional
         The u range is sampled uniformly at `n1` of points. Default value
-        is 100.
+        is 100, or 20 with `adaptive=True`, where it sets the initial grid.
 
     n2 : int, optional
         The v range is sampled uniformly at `n2` of points. Default value
-        is 100.
+        is 100, or 20 with `adaptive=True`, where it sets the initial grid.
 
-    n : int, optional
+    n : int or "auto", optional
         The u and v ranges are sampled uniformly at `n` of points.
         It overrides `n1` and `n2`.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : bool, optional
         The default value is set to `True`. Set show to `False` and
@@ -1386,9 +1642,9 @@ def plot3d_implicit(*args, show=True, **kwargs):
        discretize a volume. A high number of discretization points creates a
        smoother mesh, at the cost of a much higher memory consumption and
        slower computation.
-    3. To plot ``f(x, y, z) = c`` either write ``expr = f(x, y, z) - c`` or
-       pass the appropriate keyword to ``surface_kw``. Read the backends
-       documentation to find out the available options.
+    3. the surface is extracted as a triangle mesh with a marching cubes
+       algorithm, hence only the triangles are sent to the backend.
+    4. To plot ``f(x, y, z) = c`` write ``expr = f(x, y, z) - c``.
 
 
     Parameters
@@ -1411,9 +1667,21 @@ def plot3d_implicit(*args, show=True, **kwargs):
             The label to be shown in the legend.  If not provided, the string
             representation of the expression will be used.
 
+    adaptive : bool, optional
+        If True, the volume is sampled with an octree: starting from the
+        grid of `n1, n2, n3` points, only the cells which might contain the
+        surface are subdivided, up to `depth` times. Only the cells crossed
+        by the surface are meshed, which allows much finer resolutions
+        than a uniform grid. Default to False.
+
     backend : Plot, optional
         A subclass of `Plot`, which will perform the rendering.
-        Only PlotlyBackend and K3DBackend support 3D implicit plotting.
+        BokehBackend doesn't support 3D implicit plotting.
+
+    depth : int, optional
+        The maximum number of subdivisions of the cells when
+        `adaptive=True`: the finest grid has `(n1 - 1) * 2**depth + 1`
+        points along the x direction, and so on. Default to 3.
 
     n1 : int, optional
         The x range is sampled uniformly at `n1` of points. Default value
@@ -1427,9 +1695,11 @@ def plot3d_implicit(*args, show=True, **kwargs):
         The z range is sampled uniformly at `n3` of points. Default value
         is 60.
 
-    n : int, optional
+    n : int or "auto", optional
         The u and v ranges are sampled uniformly at `n` of points.
         It overrides `n1` and `n2`.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : bool, optional
         The default value is set to `True`. Set show to `False` and
@@ -1491,17 +1761,24 @@ def plot3d_implicit(*args, show=True, **kwargs):
            x**4 + y**4 + z**4 - (x**2 + y**2 + z**2 - 0.3),
            (x, -2, 2), (y, -2, 2), (z, -2, 2), backend=PB)
 
-    Visualize the isocontours from `isomin=0` to `isomax=2`:
+    Octree sampling, with an effective resolution of about 500 points in
+    each direction:
 
     .. jupyter-execute::
 
        plot3d_implicit(
-           1/x**2 - 1/y**2 + 1/z**2, (x, -2, 2), (y, -2, 2), (z, -2, 2),
-           backend=PB,
-           surface_kw={
-               "isomin": 0, "isomax": 2,
-               "colorscale":"aggrnyl", "showscale":True
-           }
+           x**4 + y**4 + z**4 - (x**2 + y**2 + z**2 - 0.3),
+           (x, -2, 2), (y, -2, 2), (z, -2, 2), backend=KB,
+           adaptive=True, depth=3)
+
+    Visualize the isosurfaces at the levels 0, 1, 2:
+
+    .. jupyter-execute::
+
+       f = 1/x**2 - 1/y**2 + 1/z**2
+       plot3d_implicit(
+           f, f - 1, f - 2, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+           backend=PB, surface_kw={"opacity": 0.5}
        )
 
     See Also
@@ -1610,7 +1887,9 @@ def plot_implicit(*args, show=True, **kwargs):
 
     plot_implicit, by default, generates a contour using a mesh grid of fixed
     number of points. The greater the number of points, the greater the memory
-    used. By setting `adaptive=True`, interval arithmetic will be used to plot
+    used. The curves of equalities are extracted from the mesh grid and drawn
+    as ordinary lines, hence they are also supported by Plotly and Bokeh.
+    By setting `adaptive=True`, interval arithmetic will be used to plot
     functions. If the expression cannot be plotted using interval arithmetic,
     it defaults to generating a contour using a mesh grid. With interval
     arithmetic, the line width can become very small; in those cases, it is
@@ -1642,7 +1921,9 @@ def plot_implicit(*args, show=True, **kwargs):
     adaptive : Boolean
         The default value is set to False, meaning that the internal
         algorithm uses a mesh grid approach. In such case, Boolean
-        combinations of expressions cannot be plotted.
+        combinations of inequalities are evaluated as masks of the regions,
+        while Boolean combinations containing equalities automatically
+        switch to `adaptive=True`.
         If set to True, the internal algorithm uses interval arithmetic.
         It switches to the meshgrid approach if the expression cannot be
         plotted using interval arithmetic.
@@ -1667,11 +1948,19 @@ def plot_implicit(*args, show=True, **kwargs):
         Number of discretization points in the horizontal and vertical
         directions when `adaptive=False`. Default to 1000.
 
-    n : integer
+    n : int or "auto"
         Set the number of discretization points when `adaptive=False` in
         both direction simultaneously. Default value is 1000.
         The greater the value the more accurate the plot, but the more
         memory will be used.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
+
+    seed : int or None
+        Seed of the small random jitter applied to the initial grid when
+        `adaptive=True`, which avoids false positives with equalities.
+        Default to 0, so that the results are reproducible. If None, a
+        different jitter is used every time the data is computed.
 
     show : Boolean
         Default value is True. If set to False, the plot will not be shown.
@@ -1767,6 +2056,15 @@ def plot_implicit(*args, show=True, **kwargs):
 
         >>> plot_implicit(y > x**2, (x, -5, 5))
 
+    Boolean combinations of regions:
+
+    .. plot::
+        :context: close-figs
+        :format: doctest
+        :include-source: True
+
+        >>> plot_implicit((x**2 + y**2 < 4) & (y > x), (x, -3, 3), (y, -3, 3))
+
     See Also
     ========
 
@@ -1792,6 +2090,7 @@ def plot_implicit(*args, show=True, **kwargs):
         n1=kwargs.pop("n1", 1000),
         n2=kwargs.pop("n2", 1000),
         depth=kwargs.pop("depth", 0),
+        seed=kwargs.pop("seed", 0),
         adaptive=kwargs.pop("adaptive", False),
         contour_kw=kwargs.pop("contour_kw", dict())
     )
@@ -1864,7 +2163,17 @@ def plot_polar(*args, **kwargs):
     return plot(*args, **kwargs)
 
 
-def plot_geometry(*args, show=True, **kwargs):
+def _is_geometry_collection(exprs):
+    """Return True if `exprs` can be packed into a single
+    `GeometryCollectionSeries`.
+    """
+    for kind in (Point3D, Point2D, Segment2D, Polygon):
+        if all(isinstance(e, kind) for e in exprs):
+            return True
+    return False
+
+
+def plot_geometry(*args, show=True, batch=False, **kwargs):
     """Plot entities from the sympy.geometry module.
 
     Parameters
@@ -1888,6 +2197,15 @@ def plot_geometry(*args, show=True, **kwargs):
         A subclass of `Plot`, which will perform the rendering.
         Default to `MatplotlibBackend`.
 
+    batch : boolean, optional
+        Default to False. If True, the entities provided in the same
+        argument which are homogeneous collections of points, 2D segments
+        or polygons are packed into a single data series: coordinates are
+        extracted in one pass and the collection is rendered by a single
+        artist (scatter, line or fill), which is much faster when plotting
+        thousands of entities. Legend entries and labels are set per
+        collection, not per entity.
+
     is_filled : boolean
         Default to True. Fill the polygon/circle/ellipse.
 
@@ -2043,6 +2361,21 @@ def plot_geometry(*args, show=True, **kwargs):
        [0]: geometry entity: Point3D(5, 5, 5)
        [1]: geometry entity: Line3D(Point3D(-2, -3, -4), Point3D(2, 3, 4))
        [2]: plane series over (x, -5, 5), (y, -4, 4), (z, -10, 10)
+
+    Plot a large collection of segments with a single data series, which is
+    rendered by a single line:
+
+    .. plot::
+       :context: close-figs
+       :format: doctest
+       :include-source: True
+
+       >>> t = lambda k: k * pi / 50
+       >>> segments = [Segment(Point2D(cos(t(k)), sin(t(k))),
+       ...     Point2D(cos(2 * t(k)), sin(2 * t(k)))) for k in range(1, 100)]
+       >>> plot_geometry(segments, "segments", batch=True)
+       Plot object containing:
+       [0]: geometry collection of 99 Segment2D
     """
     args = _plot_sympify(args)
 
@@ -2051,6 +2384,18 @@ def plot_geometry(*args, show=True, **kwargs):
         args = [args]
 
     for a in args:
+        if batch:
+            # NOTE: don't use _unpack_args, which would compute the string
+            # representation of the whole collection as the default label
+            labels = [t for t in a if isinstance(t, str)]
+            exprs = [t for t in a if not isinstance(t, str)]
+            if (len(exprs) == 1) and isinstance(exprs[0], Tuple):
+                exprs = list(exprs[0])
+            if (len(exprs) > 1) and _is_geometry_collection(exprs):
+                label = labels[0] if len(labels) > 0 else ""
+                series.append(GeometryCollectionSeries(exprs, label, **kwargs))
+                continue
+
         exprs, ranges, label = _unpack_args(*a)
         r = ranges if len(ranges) > 0 else [None]
         if len(exprs) == 1:
@@ -2072,6 +2417,18 @@ def plot_geometry(*args, show=True, **kwargs):
     return p
 
 
+def _is_coordinates(a):
+    """Return True if ``a`` represents a list of coordinates (a list of
+    numbers, an array, an object supporting the buffer protocol or a path
+    to a ``.npy`` file), as opposed to a tuple ``(x, y, [label])``.
+    """
+    if isinstance(a, os.PathLike) or isinstance(a, str):
+        return True
+    if not isinstance(a, (list, tuple)):
+        return True
+    return (len(a) == 0) or (not hasattr(a[0], "__iter__"))
+
+
 def plot_list(*args, show=True, **kwargs):
     """Plots lists of coordinates (ie, lists of numbers).
 
@@ -2087,11 +2444,15 @@ def plot_list(*args, show=True, **kwargs):
     ==========
 
     args :
-        x : list or tuple
-            x-coordinates
+        x : list, tuple, np.ndarray, str or os.PathLike
+            x-coordinates. NumPy arrays (including views and
+            ``np.memmap``) and objects supporting the buffer protocol are
+            used without copies, preserving their dtype. Paths to ``.npy``
+            files are memory-mapped in read-only mode, so that large
+            recorded datasets are not loaded into RAM.
 
-        y : list or tuple
-            y-coordinates
+        y : list, tuple, np.ndarray, str or os.PathLike
+            y-coordinates. The same types accepted by ``x``.
 
         label : str, optional
             The label to be shown in the legend.
@@ -2133,6 +2494,12 @@ def plot_list(*args, show=True, **kwargs):
         the overall figure. The default value is set to `None`, meaning
         the size will be set by the backend.
 
+    streaming : boolean, optional
+        Default to False. If True, the coordinates are stored in
+        append-only series: new points can be added with
+        ``p.stream(index, x, y)``, which only sends the new points to the
+        backend (if supported), instead of re-rendering the whole figure.
+
     title : str, optional
         Title of the plot. It is set to the latex representation of
         the expression, if the plot has only one expression.
@@ -2156,6 +2523,11 @@ def plot_list(*args, show=True, **kwargs):
     xlim : (float, float), optional
         Denotes the x-axis limits, `(min, max)`.
 
+    window : int, optional
+        Only used when ``streaming=True``. The maximum number of points
+        shown by each series: older points are discarded as new ones are
+        appended. Default to None, which keeps every point.
+
     ylim : (float, float), optional
         Denotes the y-axis limits, `(min, max)`.
 
@@ -2200,14 +2572,27 @@ def plot_list(*args, show=True, **kwargs):
        [0]: list plot
        [1]: list plot
 
+    Append the coordinates of a signal as they are generated, keeping the
+    last 500 points only:
+
+    .. code-block:: python
+
+       import numpy as np
+       p = plot_list([], [], "signal", streaming=True, window=500)
+       for k in range(100):
+           t = np.linspace(k, k + 1, 10)
+           p.stream(0, t, np.sin(t))
+
     """
     series = []
+    streaming = kwargs.pop("streaming", False)
+    _cls = StreamingList2DSeries if streaming else List2DSeries
 
     if (
-        ((len(args) == 2) and (not hasattr(args[0][1], "__iter__"))) or
+        ((len(args) == 2) and all(_is_coordinates(a) for a in args)) or
         ((len(args) == 3) and isinstance(args[-1], str))
     ):
-        series.append(List2DSeries(*args, **kwargs))
+        series.append(_cls(*args, **kwargs))
     else:
         for a in args:
             if not isinstance(a, (list, tuple)):
@@ -2223,7 +2608,7 @@ def plot_list(*args, show=True, **kwargs):
                     "The label must be of type string.\n"
                     "Received: {}".format(type(a[-1]))
                 )
-            series.append(List2DSeries(*a, **kwargs))
+            series.append(_cls(*a, **kwargs))
 
     Backend = kwargs.pop("backend", TWO_D_B)
     p = Backend(*series, **kwargs)
@@ -2266,9 +2651,10 @@ def plot_piecewise(*args, **kwargs):
             representation of `expr` will be used.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn5]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the intervals where the function deviates
+        from a straight line are refined in batches. Use `adaptive_goal`
+        and `max_points` to further customize the output.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -2276,13 +2662,24 @@ def plot_piecewise(*args, **kwargs):
     adaptive_goal : callable, int, float or None
         Controls the "smoothness" of the evaluation. Possible values:
 
-        * `None` (default):  it will use the following goal:
-          `lambda l: l.loss() < 0.01`
+        * `None` (default): 0.01.
         * number (int or float). The lower the number, the more
-          evaluation points. This number will be used in the following goal:
-          `lambda l: l.loss() < number`
-        * callable: a function requiring one input element, the learner. It
-          must return a float number. Refer to [#fn5]_ for more information.
+          evaluation points. With `adaptive_sampler="native"`, an interval
+          is refined if the deviation at its midpoint is greater than
+          `number / 10` times the range of the function. With
+          `adaptive_sampler="adaptive"`, this number will be used in the
+          following goal: `lambda l: l.loss() < number`
+        * callable: a function requiring one input element, the learner of
+          the `adaptive` module [#fn5]_. It must return a float number.
+
+    adaptive_sampler : str, optional
+        The adaptive algorithm. Possible values:
+
+        * `"native"` (default): a built-in algorithm, which evaluates the
+          function over many points at once.
+        * `"adaptive"`: the learners of the `adaptive` module [#fn5]_,
+          which evaluate one point at a time. They are always used when
+          `loss_fn` or a callable `adaptive_goal` are provided.
 
     aspect : (float, float) or str, optional
         Set the aspect ratio of the plot. The value depends on the backend
@@ -2297,11 +2694,17 @@ def plot_piecewise(*args, **kwargs):
         A subclass of `Plot`, which will perform the rendering.
         Default to `MatplotlibBackend`.
 
-    detect_poles : boolean
+    detect_poles : boolean or str
         Chose whether to detect and correctly plot poles.
         Defaulto to `False`. To improve detection, increase the number of
         discretization points `n` and/or change the value of `eps`.
 
+        If `"symbolic"`, the poles are also located with SymPy's
+        `singularities` (once, when the data series is created): the lines
+        are broken there, and additional points approaching each pole are
+        evaluated. In interactive plots, this only happens if the poles
+        don't depend on the parameters.
+
     eps : float
         An arbitrary small value used by the `detect_poles` algorithm.
         Default value to 0.1. Before changing this value, it is recommended to
@@ -2320,11 +2723,34 @@ def plot_piecewise(*args, **kwargs):
         * callable : Refer to [#fn5]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
-    n : int, optional
+    max_points : int or None, optional
+        The maximum number of evaluation points of the adaptive algorithms.
+        Default to 10000.
+
+    executor : str, Executor or None, optional
+        How the learners of the `adaptive` module evaluate the function.
+        Possible values:
+
+        * `None` (default): one point after the other.
+        * `"threads"`: a thread pool, useful with functions releasing the
+          GIL, like the ones evaluated by NumPy.
+        * `"processes"`: the reusable process pool of the `loky` module.
+          Only worth it when each evaluation is expensive.
+        * an object exposing a `map` method, for example an instance of
+          `concurrent.futures.Executor`. It will not be shut down.
+
+    batch_size : int or None, optional
+        The number of points requested to the learners of the `adaptive`
+        module at each iteration. Default to 1 when `executor=None`,
+        otherwise to the number of CPUs.
+
+    n : int or "auto", optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
         If the `adaptive` flag is set to `True`, this parameter will be
         ignored.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     show : bool, optional
         The default value is set to `True`. Set show to `False` and
@@ -5,7 +5,9 @@ from spb.series import (
     InteractiveSeries,
     _set_discretization_points,
 )
-from spb.ccomplex.complex import _build_series as _build_complex_series
+from spb.ccomplex.complex import (
+    _build_series as _build_complex_series, _get_array_points
+)
 from spb.vectors import _preprocess, _build_series as _build_vector_series
 from spb.utils import _plot_sympify, _unpack_args
 from spb.defaults import TWO_D_B, THREE_D_B, cfg
@@ -382,8 +384,10 @@ def create_series(*args, **kwargs):
     n1, n2, n3 : int, optional
         Number of discretization points in the 3 directions.
 
-    n : int, optional
+    n : int or "auto", optional
         Set the same number of discretization points on all directions.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
 
     Returns
@@ -483,7 +487,7 @@ def create_series(*args, **kwargs):
     >>> s = create_series((v1, (x, -5, 5), (y, -4, 4)),
     ...     params={a: 2, b: 3}, is_vector=True)
     >>> len(s), type(s[0]), type(s[1])
-    (2, spb.series.ContourInteractiveSeries, spb.series.Vector2DInteractiveSeries)
+    (2, spb.series.VectorScalarInteractiveSeries, spb.series.Vector2DInteractiveSeries)
 
     Sliced 3D vector (single slice):
 
@@ -523,6 +527,10 @@ def create_series(*args, **kwargs):
     if is_complex:
         new_args = []
         for a in args:
+            if _get_array_points(a) is not None:
+                # NumPy arrays of complex points
+                new_args.append(a)
+                continue
             exprs, ranges, label = _unpack_args(
                 *a, matrices=False, fill_ranges=False
             )
@@ -767,11 +775,17 @@ def iplot(*args, show=True, **kwargs):
         labels of the parameter-controls. If False, the string
         representation will be used instead.
 
-    detect_poles : boolean
+    detect_poles : boolean or str
         Chose whether to detect and correctly plot poles in line plots.
         Defaulto to `False`. To improve detection, increase the number of
         discretization points `n` and/or change the value of `eps`.
 
+        If `"symbolic"`, the poles are also located with SymPy's
+        `singularities` (once, when the data series is created): the lines
+        are broken there, and additional points approaching each pole are
+        evaluated. In interactive plots, this only happens if the poles
+        don't depend on the parameters.
+
     eps : float
         An arbitrary small value used by the `detect_poles` algorithm.
         Default value to 0.1. Before changing this value, it is recommended to
@@ -781,9 +795,11 @@ def iplot(*args, show=True, **kwargs):
         Set the number of discretization points in the three directions,
         respectively.
 
-    n : int, optional
+    n : int or "auto", optional
         Set the number of discretization points on all directions.
         It overrides `n1, n2, n3`.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     nc : int, optional
         Number of discretization points for the contour plot when
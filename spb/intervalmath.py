@@ -0,0 +1,517 @@
+"""
+Vectorized interval arithmetic for adaptive implicit plotting.
+
+This module mirrors the semantics of ``sympy.plotting.intervalmath``, but
+each interval object holds NumPy arrays of lower and upper bounds, so that
+all the cells of a refinement level can be evaluated with a single call of
+the lambdified expression.
+
+Like its SymPy counterpart, it doesn't handle rounding: it can't be used
+for purposes other than plotting.
+
+The three-valued logic (True, None, False) used for the validity of an
+interval and for the result of a comparison is encoded with ``np.int8``
+arrays, where ``FALSE = 0``, ``NONE = 1`` and ``TRUE = 2``. With this
+encoding, fuzzy and/or/not become ``min``, ``max`` and ``2 - v``.
+"""
+
+from functools import reduce
+from sympy.external import import_module
+from sympy.simplify.simplify import nsimplify
+
+FALSE, NONE, TRUE = 0, 1, 2
+
+
+class IntervalArray:
+    """Represents an array of intervals, ``[start[i], end[i]]``.
+
+    ``is_valid`` tracks whether the result of a function is in the domain
+    and is continuous over each interval:
+
+    - ``TRUE``: the function is continuous and in its domain.
+    - ``FALSE``: the interval is not in the domain of the function.
+    - ``NONE``: the function is not continuous over the interval, or the
+      interval is partly in the domain of the function.
+    """
+
+    def __init__(self, start, end=None, is_valid=TRUE):
+        np = import_module('numpy')
+        if end is None:
+            end = start
+        start, end, is_valid = np.broadcast_arrays(
+            np.asarray(start, dtype=float), np.asarray(end, dtype=float),
+            np.asarray(is_valid, dtype=np.int8))
+        self.start = np.minimum(start, end)
+        self.end = np.maximum(start, end)
+        self.is_valid = is_valid.copy()
+
+    @property
+    def mid(self):
+        return (self.start + self.end) / 2.0
+
+    @property
+    def width(self):
+        return self.end - self.start
+
+    def __len__(self):
+        return len(self.start)
+
+    def __repr__(self):
+        return "IntervalArray(%s, %s)" % (self.start, self.end)
+
+    def _replace(self, mask, is_valid, start=None, end=None):
+        """Return a copy of this object where the elements selected by
+        ``mask`` are set to ``[start, end]`` (by default, the whole real
+        line) with the given validity.
+        """
+        np = import_module('numpy')
+        start = -np.inf if start is None else start
+        end = np.inf if end is None else end
+        return IntervalArray(
+            np.where(mask, start, self.start),
+            np.where(mask, end, self.end),
+            np.where(mask, is_valid, self.is_valid))
+
+    def _select(self, mask, other):
+        """Return the elements of ``other`` where ``mask`` is True, the
+        elements of this object otherwise.
+        """
+        np = import_module('numpy')
+        return IntervalArray(
+            np.where(mask, other.start, self.start),
+            np.where(mask, other.end, self.end),
+            np.where(mask, other.is_valid, self.is_valid))
+
+    def __add__(self, other):
+        np = import_module('numpy')
+        other = _as_interval(other)
+        return IntervalArray(self.start + other.start, self.end + other.end,
+            np.minimum(self.is_valid, other.is_valid))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        np = import_module('numpy')
+        other = _as_interval(other)
+        return IntervalArray(self.start - other.end, self.end - other.start,
+            np.minimum(self.is_valid, other.is_valid))
+
+    def __rsub__(self, other):
+        return _as_interval(other).__sub__(self)
+
+    def __neg__(self):
+        return IntervalArray(-self.end, -self.start, self.is_valid)
+
+    def __abs__(self):
+        return Abs(self)
+
+    def __mul__(self, other):
+        np = import_module('numpy')
+        if not isinstance(other, IntervalArray):
+            return IntervalArray(self.start * other, self.end * other,
+                self.is_valid)
+        valid = np.minimum(self.is_valid, other.is_valid)
+        products = np.array([
+            self.start * other.start, self.end * other.start,
+            self.start * other.end, self.end * other.end])
+        result = IntervalArray(products.min(axis=0), products.max(axis=0))
+        return result._replace(valid != TRUE, valid)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        np = import_module('numpy')
+        other = _as_interval(other)
+        valid = np.minimum(self.is_valid, other.is_valid)
+        quotients = np.array([
+            self.start / other.start, self.end / other.start,
+            self.start / other.end, self.end / other.end])
+        result = IntervalArray(quotients.min(axis=0), quotients.max(axis=0))
+        degenerate = (other.start == 0) & (other.end == 0)
+        result = result._replace(
+            (other.start <= 0) & (other.end >= 0), NONE)
+        result = result._replace(degenerate, FALSE)
+        result = result._replace(valid != TRUE, valid)
+        return result._replace(self.is_valid != TRUE, self.is_valid)
+
+    def __rtruediv__(self, other):
+        return _as_interval(other).__truediv__(self)
+
+    def __pow__(self, other):
+        if isinstance(other, IntervalArray):
+            result = exp(other * log(self))
+        elif other < 0:
+            result = 1 / self.__pow__(abs(other))
+        elif int(other) == other:
+            result = _pow_int(self, int(other))
+        else:
+            result = _pow_float(self, other)
+        # invalid intervals are returned unchanged
+        return result._select(self.is_valid != TRUE, self)
+
+    def __rpow__(self, other):
+        if isinstance(other, IntervalArray):
+            return other.__pow__(self)
+        if other < 0:
+            # a negative base is defined only for degenerate intervals with
+            # a rational exponent having an odd denominator, which is never
+            # the case with adaptive meshing.
+            result = self._replace(True, FALSE)
+        else:
+            result = IntervalArray(other ** self.start, other ** self.end,
+                self.is_valid)
+        return result._select(self.is_valid != TRUE, self)
+
+    def _compare(self, true_mask, false_mask, other):
+        np = import_module('numpy')
+        value = np.full(true_mask.shape, NONE, dtype=np.int8)
+        value[true_mask] = TRUE
+        value[false_mask] = FALSE
+        return IntervalMembershipArray(value,
+            np.minimum(self.is_valid, other.is_valid))
+
+    def __lt__(self, other):
+        other = _as_interval(other)
+        return self._compare(self.end < other.start, self.start > other.end,
+            other)
+
+    def __gt__(self, other):
+        return _as_interval(other).__lt__(self)
+
+    def __le__(self, other):
+        other = _as_interval(other)
+        return self._compare(self.end <= other.start, self.start > other.end,
+            other)
+
+    def __ge__(self, other):
+        return _as_interval(other).__le__(self)
+
+    def __eq__(self, other):
+        other = _as_interval(other)
+        equal = ((self.start == other.start) & (self.end == other.end) &
+            (self.start == self.end))
+        disjoint = (self.end < other.start) | (self.start > other.end)
+        return self._compare(equal, disjoint, other)
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    __hash__ = None
+
+
+def _as_interval(x):
+    if isinstance(x, IntervalArray):
+        return x
+    return IntervalArray(x)
+
+
+def _pow_int(inter, power):
+    """Evaluates an interval raised to a non-negative integer power."""
+    np = import_module('numpy')
+    start, end = inter.start ** power, inter.end ** power
+    if power % 2 == 1:
+        return IntervalArray(start, end)
+    across_zero = (inter.start < 0) & (inter.end > 0)
+    return IntervalArray(np.where(across_zero, 0, start),
+        np.where(across_zero, np.maximum(start, end), end))
+
+
+def _pow_float(inter, power):
+    """Evaluates an interval raised to a positive floating point."""
+    np = import_module('numpy')
+    num, denom = nsimplify(power).as_numer_denom()
+    if num % 2 == 0:
+        # even function, increasing with the absolute value
+        return _pow_int(IntervalArray(np.abs(inter.start) ** (power / 2),
+            np.abs(inter.end) ** (power / 2)), 2)._select(
+                (inter.start < 0) & (inter.end > 0),
+                IntervalArray(0, np.maximum(np.abs(inter.start),
+                    np.abs(inter.end)) ** power))
+    if denom % 2 == 0:
+        result = IntervalArray(np.abs(inter.start) ** power,
+            np.abs(inter.end) ** power)
+        result = result._select(inter.start < 0,
+            IntervalArray(0, np.abs(inter.end) ** power, NONE))
+        return result._replace(inter.end < 0, FALSE)
+    return IntervalArray(
+        np.sign(inter.start) * np.abs(inter.start) ** power,
+        np.sign(inter.end) * np.abs(inter.end) ** power, inter.is_valid)
+
+
+class IntervalMembershipArray:
+    """Represents the result of the comparison of two interval arrays, as
+    a pair of three-valued logic arrays:
+
+    - the first one is ``TRUE`` where the comparison is true throughout the
+      intervals, ``FALSE`` where it is false throughout the intervals,
+      ``NONE`` otherwise.
+    - the second one is the validity of the intervals being compared.
+    """
+
+    def __init__(self, value, valid):
+        np = import_module('numpy')
+        self._wrapped = tuple(np.broadcast_arrays(
+            np.asarray(value, dtype=np.int8),
+            np.asarray(valid, dtype=np.int8)))
+
+    def __getitem__(self, i):
+        return self._wrapped[i]
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        return iter(self._wrapped)
+
+    def __bool__(self):
+        # the truth value of an array of three-valued logic is ambiguous:
+        # lambdified conditionals (for example, Min, Max) can't be evaluated
+        raise TypeError(
+            "The truth value of an IntervalMembershipArray is ambiguous.")
+
+    def __and__(self, other):
+        np = import_module('numpy')
+        return IntervalMembershipArray(np.minimum(self[0], other[0]),
+            np.minimum(self[1], other[1]))
+
+    def __or__(self, other):
+        np = import_module('numpy')
+        return IntervalMembershipArray(np.maximum(self[0], other[0]),
+            np.minimum(self[1], other[1]))
+
+    def __invert__(self):
+        return IntervalMembershipArray(TRUE - self[0], self[1])
+
+    def __xor__(self, other):
+        np = import_module('numpy')
+        value = np.where(self[0] != other[0], TRUE, FALSE)
+        value[(self[0] == NONE) | (other[0] == NONE)] = NONE
+        return IntervalMembershipArray(value, np.minimum(self[1], other[1]))
+
+
+def Abs(x):
+    np = import_module('numpy')
+    x = _as_interval(x)
+    across_zero = (x.start < 0) & (x.end > 0)
+    start, end = np.abs(x.start), np.abs(x.end)
+    return IntervalArray(np.where(across_zero, 0, start),
+        np.where(across_zero, np.maximum(start, end), end), x.is_valid)
+
+
+def _monotonic(func):
+    """Create the interval version of a monotonic function defined over
+    the whole real line."""
+    def wrapper(x):
+        np = import_module('numpy')
+        x = _as_interval(x)
+        return IntervalArray(getattr(np, func)(x.start),
+            getattr(np, func)(x.end), x.is_valid)
+    wrapper.__name__ = func
+    wrapper.__doc__ = "Evaluates %s over an array of intervals." % func
+    return wrapper
+
+
+exp = _monotonic("exp")
+atan = _monotonic("arctan")
+sinh = _monotonic("sinh")
+tanh = _monotonic("tanh")
+asinh = _monotonic("arcsinh")
+
+
+def _logarithm(x, func):
+    np = import_module('numpy')
+    x = _as_interval(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = IntervalArray(func(x.start), func(x.end))
+    result = result._replace(x.start <= 0, NONE)
+    result = result._replace(x.end <= 0, FALSE)
+    return result._replace(x.is_valid != TRUE, x.is_valid)
+
+
+def log(x):
+    """Evaluates the natural logarithm of an array of intervals."""
+    np = import_module('numpy')
+    return _logarithm(x, np.log)
+
+
+def log10(x):
+    """Evaluates the logarithm to the base 10 of an array of intervals."""
+    np = import_module('numpy')
+    return _logarithm(x, np.log10)
+
+
+def _trig(x, offset_max, offset_min):
+    """Evaluates sin (offsets 1, 3) or cos (offsets 0, 2) of an array of
+    intervals, by looking at the quarter of period containing each end.
+    """
+    np = import_module('numpy')
+    func = np.sin if offset_max == 1 else np.cos
+    na = np.floor_divide(x.start, np.pi / 2.0)
+    nb = np.floor_divide(x.end, np.pi / 2.0)
+    fs, fe = func(x.start), func(x.end)
+    start, end = np.minimum(fs, fe), np.maximum(fs, fe)
+    different = na != nb
+    end = np.where(different &
+        ((na - offset_max) // 4 != (nb - offset_max) // 4), 1, end)
+    start = np.where(different &
+        ((na - offset_min) // 4 != (nb - offset_min) // 4), -1, start)
+    result = IntervalArray(start, end, x.is_valid)
+    return result._replace(nb - na > 4, x.is_valid, -1, 1)
+
+
+def sin(x):
+    """Evaluates the sine of an array of intervals."""
+    x = _as_interval(x)
+    return _trig(x, 1, 3)._replace(x.is_valid != TRUE, x.is_valid, -1, 1)
+
+
+def cos(x):
+    """Evaluates the cosine of an array of intervals."""
+    np = import_module('numpy')
+    x = _as_interval(x)
+    return _trig(x, 0, 2)._replace(
+        ~(np.isfinite(x.start) & np.isfinite(x.end)), x.is_valid, -1, 1)
+
+
+def tan(x):
+    """Evaluates the tangent of an array of intervals."""
+    return sin(x) / cos(x)
+
+
+def sqrt(x):
+    """Evaluates the square root of an array of intervals."""
+    np = import_module('numpy')
+    x = _as_interval(x)
+    result = IntervalArray(np.sqrt(np.maximum(x.start, 0)),
+        np.sqrt(np.maximum(x.end, 0)), x.is_valid)
+    result = result._replace(x.start < 0, NONE)
+    return result._replace(x.end < 0, FALSE)
+
+
+def _extremum(args, func):
+    np = import_module('numpy')
+    args = [_as_interval(a) for a in args]
+    valid = np.array(np.broadcast_arrays(*[a.is_valid for a in args]))
+    ok = valid == TRUE
+    fill = np.inf if func is np.min else -np.inf
+    starts = np.array(np.broadcast_arrays(*[a.start for a in args]))
+    ends = np.array(np.broadcast_arrays(*[a.end for a in args]))
+    result = IntervalArray(func(np.where(ok, starts, fill), axis=0),
+        func(np.where(ok, ends, fill), axis=0))
+    result = result._replace(~ok.any(axis=0), NONE)
+    return result._replace((valid == FALSE).all(axis=0), FALSE)
+
+
+def imin(*args):
+    """Evaluates the minimum of a list of arrays of intervals."""
+    np = import_module('numpy')
+    return _extremum(args, np.min)
+
+
+def imax(*args):
+    """Evaluates the maximum of a list of arrays of intervals."""
+    np = import_module('numpy')
+    return _extremum(args, np.max)
+
+
+def cosh(x):
+    """Evaluates the hyperbolic cosine of an array of intervals."""
+    np = import_module('numpy')
+    x = _as_interval(x)
+    across_zero = (x.start < 0) & (x.end > 0)
+    start, end = np.cosh(x.start), np.cosh(x.end)
+    return IntervalArray(np.where(across_zero, 1, start),
+        np.where(across_zero, np.maximum(start, end), end), x.is_valid)
+
+
+def _bounded_domain(x, func, lower, upper, strict):
+    """Evaluates a monotonic function defined over ``[lower, upper]``
+    (or ``(lower, upper)`` if ``strict=True``)."""
+    np = import_module('numpy')
+    x = _as_interval(x)
+    start = np.clip(x.start, lower, upper)
+    end = np.clip(x.end, lower, upper)
+    result = IntervalArray(func(start), func(end), x.is_valid)
+    if strict:
+        outside = (x.start >= upper) | (x.end <= lower)
+        partial = (x.start <= lower) | (x.end >= upper)
+    else:
+        outside = (x.start > upper) | (x.end < lower)
+        partial = (x.start < lower) | (x.end > upper)
+    result = result._replace(partial, NONE)
+    return result._replace(outside | (x.is_valid == FALSE), FALSE)
+
+
+def asin(x):
+    """Evaluates the inverse sine of an array of intervals."""
+    np = import_module('numpy')
+    return _bounded_domain(x, np.arcsin, -1, 1, False)
+
+
+def acos(x):
+    """Evaluates the inverse cosine of an array of intervals."""
+    np = import_module('numpy')
+    return _bounded_domain(x, np.arccos, -1, 1, False)
+
+
+def atanh(x):
+    """Evaluates the inverse hyperbolic tangent of an array of intervals."""
+    np = import_module('numpy')
+    return _bounded_domain(x, np.arctanh, -1, 1, True)
+
+
+def acosh(x):
+    """Evaluates the inverse hyperbolic cosine of an array of intervals."""
+    np = import_module('numpy')
+    x = _as_interval(x)
+    result = IntervalArray(np.arccosh(np.maximum(x.start, 1)),
+        np.arccosh(np.maximum(x.end, 1)), x.is_valid)
+    result = result._replace(x.start < 1, NONE)
+    return result._replace(x.end < 1, FALSE)
+
+
+def _rounding(x, func):
+    np = import_module('numpy')
+    x = _as_interval(x)
+    start, end = func(x.start), func(x.end)
+    result = IntervalArray(start, end,
+        np.where(start == end, x.is_valid, NONE))
+    return result._replace(x.is_valid == FALSE, FALSE)
+
+
+def ceil(x):
+    """Evaluates the ceiling of an array of intervals."""
+    np = import_module('numpy')
+    return _rounding(x, np.ceil)
+
+
+def floor(x):
+    """Evaluates the floor of an array of intervals."""
+    np = import_module('numpy')
+    return _rounding(x, np.floor)
+
+
+def And(*args):
+    """Three-valued ``And`` of interval membership arrays."""
+    return reduce(lambda a, b: a & b, args)
+
+
+def Or(*args):
+    """Three-valued ``Or`` of interval membership arrays."""
+    return reduce(lambda a, b: a | b, args)
+
+
+def Not(arg):
+    """Three-valued ``Not`` of an interval membership array."""
+    return ~arg
+
+
+# functions used by ``lambdify`` to evaluate an expression with interval
+# arithmetic
+interval_functions = {
+    "Abs": Abs, "exp": exp, "log": log, "log10": log10, "atan": atan,
+    "sin": sin, "cos": cos, "tan": tan, "sqrt": sqrt, "imin": imin,
+    "imax": imax, "sinh": sinh, "cosh": cosh, "tanh": tanh, "asin": asin,
+    "acos": acos, "ceil": ceil, "floor": floor, "acosh": acosh,
+    "asinh": asinh, "atanh": atanh, "And": And, "Or": Or, "Not": Not,
+}
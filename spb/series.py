@@ -1,25 +1,36 @@
 from spb.defaults import cfg
 from sympy import latex
 from sympy.core.containers import Tuple
-from sympy.core.symbol import symbols
+from sympy.core.singleton import S
 from sympy.core.sympify import sympify
-from sympy.solvers.solvers import solve
 from sympy.core.expr import Expr
+from sympy.functions.elementary.complexes import re, im
 from sympy.geometry import (
     Plane, Polygon, Circle, Ellipse, Segment, Ray,
-    Curve, Point2D, Point3D,
+    Curve, Point2D, Point3D, Segment2D,
 )
 from sympy.geometry.entity import GeometryEntity
 from sympy.geometry.line import LinearEntity2D, LinearEntity3D
+from sympy.calculus.singularities import singularities
+from sympy.calculus.util import periodicity
+from sympy.sets.sets import FiniteSet, Interval
 from sympy.core.relational import (
     Equality, GreaterThan, LessThan,
     Relational, StrictLessThan, StrictGreaterThan,
 )
-from sympy.logic.boolalg import BooleanFunction
+from sympy.logic.boolalg import BooleanFunction, And, Or, Not, Xor
 from sympy.utilities.lambdify import lambdify
-from sympy.plotting.intervalmath import interval
+from spb.contouring import marching_squares, marching_cubes, _cells_to_mesh
+from spb.intervalmath import (
+    IntervalArray, IntervalMembershipArray, interval_functions,
+    FALSE, NONE, TRUE
+)
 from sympy.external import import_module
+from functools import partial, reduce, lru_cache
+import operator
 import warnings
+import time
+import os
 
 from sympy.printing.pycode import PythonCodePrinter
 from sympy.printing.precedence import precedence
@@ -41,8 +52,38 @@ class IntervalMathPrinter(PythonCodePrinter):
                 for a in sorted(expr.args, key=default_sort_key))
 
 
+def _get_deadline(timeout):
+    """Convert a time budget (in seconds) to an absolute deadline, which
+    can be compared with ``time.monotonic()``. Return None if there is no
+    time budget.
+    """
+    if timeout is None:
+        return None
+    if timeout <= 0:
+        raise ValueError("`timeout` must be a positive number.")
+    return time.monotonic() + timeout
+
+
+def _deadline_exceeded(deadline):
+    return (deadline is not None) and (time.monotonic() > deadline)
+
+
+def _warn_timeout(timeout, msg):
+    warnings.warn(
+        "The numerical evaluation exceeded the time budget of "
+        "{} seconds. {}".format(timeout, msg)
+    )
+
+
+# Approximate number of bytes per point allocated by ``np.vectorize`` inside
+# ``_uniform_eval``: an array of Python complex objects (pointer + object)
+# plus the resulting complex array.
+_VECTORIZE_BYTES_PER_POINT = 64
+
+
 def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
-        modules=None, adaptive_goal=None, loss_fn=None):
+        modules=None, adaptive_goal=None, loss_fn=None, timeout=None,
+        max_points=None, executor=None, batch_size=None, triangulate=False):
     """Numerical evaluation of a symbolic expression with an adaptive
     algorithm [#fn1]_.
 
@@ -95,6 +136,39 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
         * callable : look at adaptive.learner.learner1D or
           adaptive.learner.learnerND to find more loss functions.
 
+    timeout : int, float or None
+        The time budget (in seconds) of the evaluation. If the goal is not
+        reached within this time, the learner stops requesting new points
+        and the points evaluated so far are returned, with a warning.
+        Default to None (no time budget).
+
+    max_points : int or None
+        The maximum number of evaluation points. If the goal is not reached
+        with this number of points, the points evaluated so far are
+        returned. Default to None (no limit).
+
+    executor : str, Executor or None
+        Evaluate the points requested by the learner in parallel.
+        Possible values:
+
+        * ``None`` (default): serial evaluation.
+        * ``"threads"``: a thread pool, which is beneficial only if the
+          evaluation releases the GIL.
+        * ``"processes"``: a pool of processes provided by the ``loky``
+          module, which is able to serialize the lambda functions.
+        * an instance of ``concurrent.futures.Executor``, or any object
+          exposing a compatible ``map`` method.
+
+    batch_size : int or None
+        The number of points requested to the learner at once. Default to
+        1 for serial evaluations, otherwise to the number of CPUs.
+
+    triangulate : bool
+        Only used with multivariate functions. If False (default), the
+        results are interpolated over a uniform grid, whose size depends on
+        the smallest simplex of the learner. If True, the triangulation of
+        the learner is returned instead.
+
     Returns
     =======
 
@@ -106,6 +180,12 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
         No matter the evaluation ``modules``, the array type is going to be
         complex.
 
+    For multivariate functions, ``xs, ys, z`` are returned: the meshgrids
+    and the interpolated results. If ``triangulate=True``, ``points, values,
+    simplices`` are returned instead, where ``points`` [Nx2] are the
+    evaluation points, ``values`` [N] the results and ``simplices`` [Mx3]
+    the indices of the vertices of each triangle.
+
     References
     ==========
 
@@ -116,7 +196,6 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
         'adaptive',
         import_kwargs={'fromlist': ['runner', 'learner']},
         min_module_version='0.12.0')
-    simple = adaptive.runner.simple
     Learner1D = adaptive.learner.learner1D.Learner1D
     LearnerND = adaptive.learner.learnerND.LearnerND
     default_loss_1d = adaptive.learner.learner1D.default_loss
@@ -138,6 +217,19 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
         if callable(adaptive_goal):
             goal = adaptive_goal
 
+    # Cooperative time budget: the learner is stopped as soon as the deadline
+    # is exceeded, provided that there are enough points to build the output.
+    deadline = _get_deadline(timeout)
+    min_points = 2 if one_d else 2 ** len(bounds)
+    timed_out = []
+    user_goal = goal
+
+    def goal_with_deadline(l):
+        if (l.npoints >= min_points) and _deadline_exceeded(deadline):
+            timed_out.append(True)
+            return True
+        return user_goal(l)
+
     lf = default_loss_1d if one_d else default_loss_nd
     if loss_fn is not None:
         lf = loss_fn
@@ -146,10 +238,32 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
 
     Learner = Learner1D if one_d else LearnerND
 
+    pool, shutdown = _get_executor(executor)
+    if batch_size is None:
+        batch_size = 1 if pool is None else (os.cpu_count() or 1)
+
+    def run(learner):
+        # Equivalent to adaptive.runner.simple, but the points are requested
+        # in batches and the number of points is limited.
+        while not goal_with_deadline(learner):
+            n = batch_size
+            if max_points is not None:
+                n = min(n, max_points - learner.npoints)
+                if n <= 0:
+                    break
+            points, _ = learner.ask(n)
+            if len(points) == 0:
+                break
+            if pool is None:
+                values = [learner.function(p) for p in points]
+            else:
+                values = list(pool.map(learner.function, points))
+            learner.tell_many(points, values)
+
     try:
         f = lambdify(free_symbols, expr, modules=modules)
         learner = Learner(partial(wrapper_func, f, *args), bounds=bounds, **d)
-        simple(learner, goal)
+        run(learner)
     except Exception as err:
         warnings.warn(
             "The evaluation with %s failed.\n" % (
@@ -160,11 +274,32 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
         )
         f = lambdify(free_symbols, expr, modules="sympy")
         learner = Learner(partial(wrapper_func, f, *args), bounds=bounds, **d)
-        simple(learner, goal)
+        run(learner)
+    finally:
+        if shutdown:
+            pool.shutdown()
+
+    if timed_out:
+        _warn_timeout(timeout,
+            "The adaptive algorithm has been stopped after evaluating "
+            "{} points: the results might be inaccurate.".format(
+                learner.npoints))
 
     if one_d:
         return learner.to_numpy()
 
+    if triangulate:
+        # The cost is proportional to the number of evaluated points,
+        # without resampling the results over a (potentially huge) grid.
+        tri = learner.tri
+        if tri is None:
+            return (np.empty((0, 2)), np.empty(0),
+                np.empty((0, 3), dtype=int))
+        vertices = tri.vertices
+        values = np.array([learner.data[v] for v in vertices], dtype=float)
+        simplices = np.array(sorted(tri.simplices), dtype=int)
+        return np.array(vertices, dtype=float), values, simplices
+
     # For multivariate functions, create a meshgrid where to interpolate the
     # results. Taken from adaptive.learner.learnerND.plot
     x, y = learner._bbox
@@ -179,7 +314,362 @@ def adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
     return xs, ys, np.rot90(z)
 
 
-def uniform_eval(free_symbols, expr, *args, modules=None):
+def _get_executor(executor):
+    """Return the executor used to evaluate the points of the adaptive
+    learners, and whether it must be shut down after the evaluation.
+    """
+    if (executor is None) or hasattr(executor, "map"):
+        return executor, False
+    if executor == "threads":
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor(), True
+    if executor == "processes":
+        # lambda functions can't be serialized by the standard library
+        loky = import_module('loky')
+        if loky is None:
+            raise ValueError(
+                "`executor='processes'` requires the loky module.")
+        # the pool is reused by consecutive evaluations
+        return loky.get_reusable_executor(), False
+    raise ValueError(
+        "`executor` must be None, 'threads', 'processes' or an object "
+        "exposing a `map` method. Received: {}".format(executor))
+
+
+# number of points of the initial grid of the built-in adaptive sampler
+_ADAPTIVE_N_INIT = 62
+
+
+def adaptive_sampling_1d(evaluate, start, end, adaptive_goal=None,
+    max_points=None, scale="linear", timeout=None, n_init=_ADAPTIVE_N_INIT,
+    max_depth=16):
+    """Adaptive sampling of a function of one variable, which doesn't
+    require the ``adaptive`` module.
+
+    Starting from a uniform grid, every interval is bisected if the value
+    of the function at its midpoint deviates from the linear interpolation
+    of its ends. The midpoints of all the intervals to be refined are
+    evaluated with a single call to ``evaluate``. The intervals are split
+    at random positions close to their midpoints, with a fixed seed.
+
+    Parameters
+    ==========
+
+    evaluate : callable
+        A function accepting a 1D array of points and returning a list of
+        1D arrays (possibly complex), one for each component of the curve.
+
+    start, end : float
+        The bounds of the sampling.
+
+    adaptive_goal : float or None
+        Controls the "smoothness" of the evaluation: an interval is
+        bisected if the deviation at its midpoint is greater than
+        ``adaptive_goal / 10`` times the range of the values of the
+        function over the initial grid. The lower the number, the more
+        evaluation points. Default to 0.01, which gives lines with an error
+        of about 0.1% of the size of the plot.
+
+    max_points : int or None
+        The maximum number of evaluation points. When the budget is not
+        sufficient, the intervals with the greatest deviations are
+        refined first. Default to None (no limit).
+
+    scale : str
+        Discretization strategy, either ``"linear"`` or ``"log"``.
+
+    timeout : int, float or None
+        The time budget (in seconds) of the evaluation. If it is exceeded,
+        the refinement stops and the points evaluated so far are returned,
+        with a warning. Default to None (no time budget).
+
+    n_init : int
+        Number of points of the initial uniform grid. The default value
+        gives a prime number of intervals, so that the grid doesn't hit
+        the poles located at simple fractions of the range.
+
+    max_depth : int
+        Maximum number of bisections of the intervals of the initial grid.
+        It limits the refinement around discontinuities.
+
+    Returns
+    =======
+
+    x : np.ndarray [N]
+        The sorted evaluation points.
+
+    values : list
+        The components of the curve evaluated at ``x``.
+    """
+    np = import_module('numpy')
+    goal = 0.01 if adaptive_goal is None else adaptive_goal
+    budget = np.inf if max_points is None else max(int(max_points), 2)
+
+    # intervals are split close to their midpoint, at random positions:
+    # this prevents periodic functions from fooling the refinement criterion
+    rng = np.random.default_rng(0)
+
+    def midpoints(a, b, t):
+        if scale == "log":
+            return a * (b / a)**t
+        return a + t * (b - a)
+
+    def evaluate_points(x):
+        return np.array([np.asarray(v, dtype=complex)
+            for v in evaluate(x)])
+
+    x = BaseSeries._discretize(start, end, int(min(n_init, budget)), scale)
+    v = evaluate_points(x)
+    # scale of each component, used to compute relative deviations. Samples
+    # much larger than both their neighbors are excluded: they are likely
+    # located on poles, where rounding errors produce huge values.
+    finite = np.where(np.isfinite(v), v, np.nan)
+    mag = np.nan_to_num(np.abs(finite))
+    neighbors = np.fmax(np.pad(mag[:, :-1], ((0, 0), (1, 0))),
+        np.pad(mag[:, 1:], ((0, 0), (0, 1))))
+    finite[mag > 1e06 * neighbors] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        re_lo, re_hi = np.nanmin(finite.real, axis=1), np.nanmax(finite.real, axis=1)
+        im_lo, im_hi = np.nanmin(finite.imag, axis=1), np.nanmax(finite.imag, axis=1)
+    ranges = np.fmax(re_hi - re_lo, im_hi - im_lo)
+    ranges = np.where(np.isfinite(ranges) & (ranges > 0), ranges, 1)[:, None]
+    # values far away from this range are clipped: the shape of the function
+    # around poles doesn't need to be resolved
+    re_lo, re_hi, im_lo, im_hi = [np.nan_to_num(t)[:, None] for t in
+        [re_lo - 5 * ranges[:, 0], re_hi + 5 * ranges[:, 0],
+        im_lo - 5 * ranges[:, 0], im_hi + 5 * ranges[:, 0]]]
+    clip = lambda t: (np.clip(t.real, re_lo, re_hi) +
+        1j * np.clip(t.imag, im_lo, im_hi))
+    min_width = abs(end - start) / (n_init - 1) / 2**max_depth
+
+    xs, vs = [x], [v]
+    xa, xb, va, vb = x[:-1], x[1:], v[:, :-1], v[:, 1:]
+    # deviation of the parent interval
+    parent = np.zeros(len(xa))
+    npoints = len(x)
+    deadline = _get_deadline(timeout)
+    while (len(xa) > 0) and (npoints < budget):
+        if _deadline_exceeded(deadline):
+            _warn_timeout(timeout,
+                "The adaptive algorithm has been stopped after evaluating "
+                "{} points: the results might be inaccurate.".format(npoints))
+            break
+        if npoints + len(xa) > budget:
+            # not enough points left
+            keep = np.lexsort((xa - xb, -parent))[:int(budget - npoints)]
+            xa, xb, va, vb = xa[keep], xb[keep], va[:, keep], vb[:, keep]
+            parent = parent[keep]
+        t = rng.uniform(0.45, 0.55, len(xa))
+        xm = midpoints(xa, xb, t)
+        vm = evaluate_points(xm)
+        xs.append(xm)
+        vs.append(vm)
+        npoints += len(xm)
+
+        # deviation of the midpoints from the linear interpolation. For
+        # smooth functions, it is about a quarter of the deviation of the
+        # parent interval: if it is much smaller, the midpoint might lie on
+        # the chord by chance. The intervals where the function is defined
+        # only partially are always refined, in order to locate the
+        # boundaries of the domain.
+        with np.errstate(invalid="ignore", over="ignore"):
+            deviation = (np.abs(clip(vm) - clip(va) -
+                t * (clip(vb) - clip(va))) / ranges).max(axis=0)
+        fa, fm, fb = [np.isfinite(t).all(axis=0) for t in [va, vm, vb]]
+        deviation = np.where(fa & fm & fb, deviation,
+            np.where(fa | fm | fb, np.inf, 0))
+        tol = goal / 10
+        refine = (((deviation > tol) | (parent > 16 * tol)) &
+            (np.abs(xb - xa) > 2 * min_width))
+        xa, xb = (np.concatenate([xa[refine], xm[refine]]),
+            np.concatenate([xm[refine], xb[refine]]))
+        va, vb = (np.concatenate([va[:, refine], vm[:, refine]], axis=1),
+            np.concatenate([vm[:, refine], vb[:, refine]], axis=1))
+        parent = np.tile(deviation[refine], 2)
+
+    x = np.concatenate(xs)
+    idx = np.argsort(x, kind="stable")
+    return x[idx], list(np.concatenate(vs, axis=1)[:, idx])
+
+
+def _evaluate_batch(f1, f2, *args, modules=None):
+    """Evaluate a lambda function over 1D arrays of points with a single
+    vectorized call. If the function doesn't support arrays, evaluate it
+    element-wise with ``_uniform_eval``.
+    """
+    np = import_module('numpy')
+    shape = args[0].shape
+    try:
+        with np.errstate(all="ignore"):
+            v = np.asarray(f1(*args), dtype=complex)
+        if v.shape in [(), shape]:
+            return np.broadcast_to(v, shape).copy()
+    except Exception:
+        pass
+    return np.asarray(_uniform_eval(f1, f2, *args, modules=modules),
+        dtype=complex)
+
+
+def _remove_nonfinite_vertices(faces, *arrays):
+    """Remove the vertices of a triangle mesh where any of the ``arrays``
+    is not finite, together with the triangles using them.
+
+    Returns
+    =======
+    faces : np.ndarray [F x 3]
+        The remaining triangles, indexing the remaining vertices.
+    arrays : list
+        The values of ``arrays`` at the remaining vertices.
+    """
+    np = import_module('numpy')
+    finite = np.all([np.isfinite(a) for a in arrays], axis=0)
+    faces = faces[np.all(finite[faces], axis=1)]
+    new_index = np.cumsum(finite) - 1
+    return new_index[faces], [a[finite] for a in arrays]
+
+
+def _find_poles(expr, var, start, end):
+    """Locate the singularities of ``expr`` in the open interval
+    ``(start, end)`` with SymPy's ``singularities``.
+
+    Returns
+    =======
+    poles : np.ndarray or None
+        The sorted locations of the singularities, or None if they can't
+        be determined numerically (for example, if they depend on other
+        symbols).
+    """
+    np = import_module('numpy')
+    try:
+        sing = singularities(expr, var, domain=Interval(start, end))
+        if not isinstance(sing, FiniteSet):
+            sing = sing.intersect(Interval.open(start, end))
+        if sing.is_empty:
+            return np.array([])
+        if not isinstance(sing, FiniteSet):
+            return None
+        poles = [complex(p) for p in sing]
+    except Exception:
+        return None
+    poles = np.array([p.real for p in poles if p.imag == 0])
+    return np.sort(poles[(poles > start) & (poles < end)])
+
+
+@lru_cache(maxsize=128)
+def _find_symmetry(expr, var):
+    """Analyze the expression with respect to ``var``. The result is
+    cached per expression.
+
+    Returns
+    =======
+    period : float or None
+        The period found by SymPy's ``periodicity``, if it is a number.
+    parity : int
+        1 if the expression is even, -1 if it is odd, 0 otherwise.
+    """
+    try:
+        period = periodicity(expr, var)
+        period = (float(period) if (period is not None) and
+            period.is_number and period.is_positive else None)
+    except Exception:
+        period = None
+    reflected = expr.subs(var, -var)
+    parity = 0
+    if (reflected - expr).expand() == 0:
+        parity = 1
+    elif (reflected + expr).expand() == 0:
+        parity = -1
+    return period, parity
+
+
+def _symmetric_discretization(start, end, n, period, parity):
+    """Create a uniform discretization of ``[start, end]`` in which the
+    values of a periodic or symmetric function repeat, using at most ``n``
+    points. If the range covers at least two periods, each one containing
+    at least four points, a period contains an integer number of points.
+    Otherwise, if the function is even or odd and the range is symmetric,
+    the points are symmetric with respect to zero.
+
+    Returns
+    =======
+    x : np.ndarray
+        The discretization, or None if there is nothing to exploit.
+    reduced : np.ndarray
+        The points where the function must be evaluated.
+    index, sign : np.ndarray
+        The values at ``x`` are ``sign * values[index]``, where ``values``
+        are the values at ``reduced``.
+    """
+    np = import_module('numpy')
+    length = end - start
+    h = length / (n - 1) if n > 1 else length
+    # NOTE: with fewer points per period, the samples would alias the
+    # function, for example sin(x) would be sampled only at its zeros.
+    if ((period is not None) and (length >= 2 * period) and (h > 0) and
+        (period >= 4 * h)):
+        # the step can only increase, so that there are at most n points
+        m = int(np.floor(period / h + 1e-09))
+        h = period / m
+        x = start + h * np.arange(int(np.floor(length / h + 1e-09)) + 1)
+        reduced = x[:m]
+        index = np.arange(len(x)) % m
+        if x[-1] < end - 1e-09 * h:
+            x = np.append(x, end)
+            reduced = np.append(reduced, end)
+            index = np.append(index, m)
+        return x, reduced, index, np.ones(len(x))
+    if parity and (n > 2) and np.isclose(start, -end) and (end > 0):
+        h = 2 * end / (n - 1)
+        if n % 2:
+            reduced = np.linspace(0, end, (n + 1) // 2)
+            mirror = np.arange(len(reduced) - 1, 0, -1)
+        else:
+            reduced = np.linspace(h / 2, end, n // 2)
+            mirror = np.arange(len(reduced) - 1, -1, -1)
+        x = np.concatenate([-reduced[mirror], reduced])
+        index = np.concatenate([mirror, np.arange(len(reduced))])
+        sign = np.concatenate([np.full(len(mirror), float(parity)),
+            np.ones(len(reduced))])
+        return x, reduced, index, sign
+    return None, None, None, None
+
+
+def _insert_pole_samples(x, poles, step, levels=5):
+    """Insert the location of the poles into the sorted discretization
+    ``x``, together with samples approaching each pole from both sides at
+    the distances ``step / 2**k``, with ``k = 1, ..., levels``.
+    """
+    np = import_module('numpy')
+    if len(poles) == 0:
+        return x
+    d = step / 2.0 ** np.arange(1, levels + 1)
+    new = (poles[:, None] + np.concatenate([-d, [0], d])[None, :]).flatten()
+    new = new[(new > x[0]) & (new < x[-1])]
+    return np.union1d(x, new)
+
+
+def _z_color_func(x, y, z, *args):
+    """Default coloring of surfaces: color by the z-coordinate."""
+    return z
+
+
+def _lazy_lambdify(free_symbols, expr, modules=None):
+    """Return a function that lambdifies ``expr`` on its first call. Useful
+    for backup functions, which are rarely used: the (possibly expensive)
+    code generation is skipped unless they are actually needed.
+    """
+    func = []
+
+    def wrapper(*args):
+        if len(func) == 0:
+            func.append(lambdify(free_symbols, expr, modules=modules))
+        return func[0](*args)
+    return wrapper
+
+
+def uniform_eval(free_symbols, expr, *args, modules=None, timeout=None,
+    chunk_size=None):
     """Convert the expression to a lambda function using the specified
     module. Perform the evaluation and return the results.
 
@@ -200,6 +690,15 @@ def uniform_eval(free_symbols, expr, *args, modules=None):
         using vectorized operation whenever possible. With other modules,
         the evaluation might be significantly slower.
 
+    timeout : int, float or None
+        The time budget (in seconds) of the evaluation. If it is exceeded,
+        the evaluation stops and the remaining points are set to NaN, with
+        a warning. Default to None (no time budget).
+
+    chunk_size : int or None
+        If an integer is provided, the evaluation is performed on chunks of
+        at most ``chunk_size`` points, reducing the peak memory usage.
+        Default to None (single chunk).
 
     Returns
     =======
@@ -210,13 +709,19 @@ def uniform_eval(free_symbols, expr, *args, modules=None):
         complex.
     """
     # generate two lambda functions: the default one, and the backup in case
-    # of failures with the default one.
+    # of failures with the default one (only compiled if needed).
     f1 = lambdify(free_symbols, expr, modules=modules)
-    f2 = lambdify(free_symbols, expr, modules="sympy")
-    return _uniform_eval(f1, f2, *args, modules=modules)
+    f2 = _lazy_lambdify(free_symbols, expr, modules="sympy")
+    return _uniform_eval(f1, f2, *args, modules=modules, timeout=timeout,
+        chunk_size=chunk_size)
 
 
-def _uniform_eval(f1, f2, *args, modules=None):
+def _uniform_eval(f1, f2, *args, modules=None, timeout=None,
+    chunk_size=None, deadline=None):
+    """Evaluate ``f1`` (or ``f2`` if it fails) over the arrays ``args``.
+    The time budget is either ``timeout`` seconds from now, or the absolute
+    ``deadline`` shared by multiple evaluations, which takes precedence.
+    """
     np = import_module('numpy')
 
     def wrapper_func(func, *args):
@@ -224,10 +729,41 @@ def _uniform_eval(f1, f2, *args, modules=None):
             return complex(func(*args))
         except (ZeroDivisionError, OverflowError):
             return complex(np.nan, np.nan)
-    wrapper_func = np.vectorize(wrapper_func)
+    wrapper_func = np.vectorize(wrapper_func, otypes=[complex])
+
+    if deadline is None:
+        deadline = _get_deadline(timeout)
+
+    def evaluate(func):
+        if (deadline is None) and (chunk_size is None):
+            return wrapper_func(func, *args)
+
+        # Evaluate the function chunk by chunk, checking the deadline
+        # between chunks. The points that couldn't be evaluated in time
+        # are set to NaN.
+        bargs = np.broadcast_arrays(*[np.asarray(a) for a in args])
+        shape = bargs[0].shape if len(bargs) > 0 else ()
+        bargs = [a.flatten() for a in bargs]
+        size = int(np.prod(shape))
+        results = np.full(size, complex(np.nan, np.nan))
+        if chunk_size is None:
+            n_chunks = min(size, 100)
+        else:
+            n_chunks = int(np.ceil(size / max(int(chunk_size), 1)))
+        evaluated = 0
+        for idx in np.array_split(np.arange(size), max(n_chunks, 1)):
+            if _deadline_exceeded(deadline):
+                _warn_timeout(timeout,
+                    "Only {} out of {} points were evaluated: ".format(
+                        evaluated, size) +
+                    "the remaining points have been set to NaN.")
+                break
+            results[idx] = wrapper_func(func, *[a[idx] for a in bargs])
+            evaluated += len(idx)
+        return results.reshape(shape)
 
     try:
-        return wrapper_func(f1, *args)
+        return evaluate(f1)
     except Exception as err:
         warnings.warn(
             "The evaluation with %s failed.\n" % (
@@ -236,7 +772,7 @@ def _uniform_eval(f1, f2, *args, modules=None):
             "Trying to evaluate the expression with Sympy, but it might "
             "be a slow operation."
         )
-        return wrapper_func(f2, *args)
+        return evaluate(f2)
 
 
 class BaseSeries:
@@ -291,13 +827,123 @@ class BaseSeries:
     # If True, the backend will attempt to render it on a polar-projection
     # axis. Only 2D lines support such functionality.
 
+    is_mesh = False
+    # If True, the backend should render the triangles returned by
+    # ``get_mesh``, rather than a structured grid.
+
+    is_streaming = False
+    # If True, new points can be appended to the series, and the backend
+    # is able to push only the new points to the figure.
+
     use_cm = True
     # Some series might use a colormap as default coloring. Setting this
     # attribute to False will inform the backends to use solid color.
 
+    _discretization_attrs = []
+    # Names of the attributes controlling the number of discretization
+    # points along each direction. They can be reduced in order to satisfy
+    # a memory budget.
+
+    _bytes_per_point = 0
+    # Approximate number of bytes per discretization point allocated by the
+    # numerical evaluation: discretized domain, results, real and imaginary
+    # parts and arrays returned by ``get_data``. Subclasses document how
+    # their value is derived, counting 8 bytes for each float64 array and 16
+    # bytes for each complex128 array with one element per point. The
+    # evaluation of one expression usually costs 32 bytes: the complex
+    # results, and their real and imaginary parts.
+
+    _eval_bytes_per_point = _VECTORIZE_BYTES_PER_POINT
+    # Approximate number of bytes per point allocated by the evaluation
+    # function. It doesn't depend on the number of discretization points
+    # if the evaluation is chunked.
+
+    _chunk_size = None
+    # If an integer, the numerical evaluation is performed on chunks of
+    # at most ``_chunk_size`` points.
+
+    _pixels_per_point = 1
+    # Approximate distance (in pixels) between consecutive discretization
+    # points when the number of points is computed from the size of the
+    # plot, with ``n="auto"``.
+
+    _data_fields = []
+    # Names of the arrays that can be requested with
+    # ``get_data(fields=...)``. Series supporting this feature only compute
+    # the requested arrays.
+
+    _default_fields = []
+    # Names of the arrays returned by ``get_data()`` when no fields are
+    # requested.
+
+    _latex_label_value = None
+    # Either a string or a callable returning the LaTeX representation of
+    # the label, see ``_latex_label``.
+
+    _baked_data = None
+    # Numerical data stored by ``bake()``.
+
+    _lambdified_attrs = ["_functions"]
+    # Names of the attributes storing lambdified functions, which can't be
+    # pickled: they are set to None by ``__getstate__`` and generated again
+    # on first use.
+
     def __init__(self, *args, **kwargs):
         super().__init__()
 
+    def __reduce__(self):
+        # NOTE: many series implement ``__new__`` in order to instantiate the
+        # appropriate subclass depending on the arguments. Bypass it when
+        # unpickling.
+        return (object.__new__, (type(self),), self.__getstate__())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # lambdified functions can't be pickled: they are going to be
+        # generated again on first use.
+        for k in self._lambdified_attrs:
+            if state.get(k, None) is not None:
+                state[k] = None
+        state.pop("get_data", None)
+        # executors can't be pickled
+        if hasattr(state.get("executor", None), "map"):
+            state["executor"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._baked_data is not None:
+            self.get_data = self._get_baked_data
+
+    def bake(self):
+        """Evaluate the series and store the numerical data, which is
+        included when the series is pickled. Then, ``get_data`` returns the
+        stored data without evaluating the expressions again, for example in
+        a different process. If an interactive series receives new
+        parameters, the stored data is discarded.
+        """
+        self.unbake()
+        if len(self._data_fields) > 0:
+            self._baked_data = dict(zip(self._data_fields,
+                self.get_data(fields=self._data_fields)))
+        else:
+            self._baked_data = self.get_data()
+        self._baked_params = dict(self.params) if self.is_interactive else None
+        self.get_data = self._get_baked_data
+
+    def unbake(self):
+        """Remove the numerical data stored by ``bake()``."""
+        self._baked_data = None
+        self.__dict__.pop("get_data", None)
+
+    def _get_baked_data(self, fields=None):
+        if self.is_interactive and (self.params != self._baked_params):
+            self.unbake()
+            return self.get_data() if fields is None else self.get_data(fields)
+        if isinstance(self._baked_data, dict):
+            return tuple(self._baked_data[f] for f in self._check_fields(fields))
+        return self._baked_data
+
     def _init_transforms(self, **kwargs):
         self._tx = kwargs.get("tx", None)
         self._ty = kwargs.get("ty", None)
@@ -385,6 +1031,91 @@ class BaseSeries:
         """
         raise NotImplementedError
 
+    def _check_fields(self, fields):
+        """Validate the fields requested to ``get_data``. If ``fields`` is
+        None, return the fields returned by default.
+        """
+        if fields is None:
+            return tuple(self._default_fields)
+        if isinstance(fields, str):
+            fields = [fields]
+        unknown = [f for f in fields if f not in self._data_fields]
+        if len(unknown) > 0:
+            raise ValueError(
+                "Unknown fields: {}. ".format(unknown) +
+                "Possible values are: {}".format(self._data_fields))
+        return tuple(fields)
+
+    def _get_number_of_points(self):
+        """Return the total number of discretization points."""
+        np = import_module('numpy')
+        if len(self._discretization_attrs) == 0:
+            return 0
+        return int(np.prod(
+            [getattr(self, a) for a in self._discretization_attrs]))
+
+    def estimate_memory(self):
+        """Estimate the peak memory (in bytes) required to evaluate the
+        series, based on its discretization. No numerical evaluation is
+        performed.
+
+        Note that the estimate might be inaccurate for series using
+        adaptive algorithms, as the final number of points is not known
+        in advance.
+        """
+        npoints = self._get_number_of_points()
+        chunk = npoints
+        if self._chunk_size is not None:
+            chunk = min(npoints, self._chunk_size)
+        return int(npoints * self._bytes_per_point +
+            chunk * self._eval_bytes_per_point)
+
+    def _reduce_discretization(self, factor):
+        """Reduce the number of discretization points in order to scale the
+        estimated memory by ``factor``, a number between 0 and 1.
+        """
+        n_dir = len(self._discretization_attrs)
+        for a in self._discretization_attrs:
+            n = getattr(self, a)
+            setattr(self, a, max(2, int(n * factor ** (1 / n_dir))))
+
+    def _get_auto_points(self, pixels):
+        """Return a dictionary mapping the discretization attributes to the
+        number of pixels covered by the plot along the respective direction.
+        """
+        width, height = pixels
+        if self.is_3D:
+            # the orientation of a 3D object on the screen is not known
+            size = min(width, height)
+            return {"n": size, "n1": size, "n2": size, "n3": size}
+        return {"n": max(width, height), "n1": width, "n2": height,
+            "n3": max(width, height)}
+
+    def _set_auto_discretization(self, pixels):
+        """Compute the number of discretization points of the attributes
+        set to ``"auto"``, given the size ``(width, height)`` in pixels of the
+        area where the series is going to be rendered.
+        """
+        points = self._get_auto_points(pixels)
+        for a in ["n", "n1", "n2", "n3"]:
+            if isinstance(getattr(self, a, None), str):
+                if getattr(self, a) != "auto":
+                    raise ValueError(
+                        "`%s` must be an integer or 'auto'. " % a +
+                        "Received: %s" % getattr(self, a))
+                setattr(self, a, max(2,
+                    int(round(points[a] / self._pixels_per_point))))
+
+    def _resolve_auto_discretization(self):
+        """If the series is evaluated without being added to a plot, compute
+        the number of discretization points still set to ``"auto"`` from the
+        default size of the plotting area.
+        """
+        if any(isinstance(getattr(self, a, None), str)
+                for a in ["n", "n1", "n2", "n3"]):
+            from spb.backends.base_backend import Plot
+            self._set_auto_discretization(Plot._default_pixel_size)
+
     def _get_wrapped_label(self, label, wrapper):
         """Given a latex representation of an expression, label, wrap it inside
         some characters. Matplotlib needs $%s%, K3D-Jupyter needs "%s".
@@ -395,6 +1126,20 @@ class BaseSeries:
         """Return the expression (or expressions) of the series."""
         return self.expr
 
+    @property
+    def _latex_label(self):
+        """LaTeX representation of the label. ``latex()`` can be expensive on
+        large expressions: if a callable was set, it is evaluated on first
+        access and its result is memoized.
+        """
+        if callable(self._latex_label_value):
+            self._latex_label_value = self._latex_label_value()
+        return self._latex_label_value
+
+    @_latex_label.setter
+    def _latex_label(self, value):
+        self._latex_label_value = value
+
     def get_label(self, use_latex=False, wrapper="$%s$"):
         """Return the label to be used to display the expression.
 
@@ -467,6 +1212,10 @@ class Line2DBaseSeries(BaseSeries):
     """A base class for 2D lines."""
 
     is_2Dline = True
+    _discretization_attrs = ["n"]
+    # domain (8) + evaluation of the expression (32) + y-coordinates
+    # returned by ``get_data``, where the non-real values are NaN (8)
+    _bytes_per_point = 48
 
     def __init__(self, **kwargs):
         super().__init__()
@@ -478,9 +1227,20 @@ class Line2DBaseSeries(BaseSeries):
         self.scale = kwargs.get("xscale", "linear")
         self.n = kwargs.get("n", 1000)
         self.modules = kwargs.get("modules", None)
+        self.timeout = kwargs.get("timeout", cfg["evaluation"]["timeout"])
         self.adaptive = kwargs.get("adaptive", True)
         self.adaptive_goal = kwargs.get("adaptive_goal", cfg["adaptive"]["goal"])
         self.loss_fn = kwargs.get("loss_fn", None)
+        # "native" uses the built-in batched sampler, "adaptive" the
+        # learners of the adaptive module
+        self.adaptive_sampler = kwargs.get("adaptive_sampler",
+            cfg["adaptive"]["sampler"])
+        self.max_points = kwargs.get("max_points",
+            cfg["adaptive"]["max_points"])
+        # parallel evaluation of the points requested by the learners of the
+        # adaptive module
+        self.executor = kwargs.get("executor", None)
+        self.batch_size = kwargs.get("batch_size", None)
         self._rendering_kw = kwargs.get("line_kw", dict())
         self.use_cm = kwargs.get("use_cm", True)
         self.color_func = kwargs.get("color_func", None)
@@ -509,6 +1269,7 @@ class Line2DBaseSeries(BaseSeries):
         """
         np = import_module('numpy')
 
+        self._resolve_auto_discretization()
         points = self.get_points()
         points = self._apply_transform(*points)
 
@@ -528,17 +1289,104 @@ class Line2DBaseSeries(BaseSeries):
                 points = (x, y, z, points[3])
         return points
 
+    def _use_native_sampler(self):
+        """Return True if the adaptive sampling is performed by
+        ``adaptive_sampling_1d``. The learners of the adaptive module are
+        used if requested, or if the options are specific to them (a loss
+        function or a callable goal).
+        """
+        if self.adaptive_sampler not in ["native", "adaptive"]:
+            raise ValueError(
+                "`adaptive_sampler` must be either 'native' or 'adaptive'. "
+                "Received: {}".format(self.adaptive_sampler))
+        return ((self.adaptive_sampler == "native") and
+            (self.loss_fn is None) and (not callable(self.adaptive_goal)))
+
+    def _native_adaptive_sampling(self, exprs, start, end, offset=None):
+        """Evaluate the expressions with the built-in adaptive sampler.
+        If ``offset`` is not None, the expressions are evaluated at the
+        complex points ``x + offset``, where ``x`` are the real sampling
+        points.
+
+        Returns
+        =======
+
+        x : np.ndarray
+        values : list
+            Complex results of the evaluation of each expression.
+        """
+        funcs = [(lambdify([self.var], e, modules=self.modules),
+            _lazy_lambdify([self.var], e, modules="sympy")) for e in exprs]
+
+        def evaluate(x):
+            xx = x if offset is None else x + complex(offset)
+            return [_evaluate_batch(f1, f2, xx, modules=self.modules)
+                for f1, f2 in funcs]
+
+        return adaptive_sampling_1d(evaluate, start, end,
+            adaptive_goal=self.adaptive_goal, max_points=self.max_points,
+            scale=self.scale, timeout=self.timeout)
+
+
+def _as_1d_array(data):
+    """Convert a list of coordinates to a 1D NumPy array, avoiding copies
+    whenever possible.
+
+    Parameters
+    ==========
+
+    data : list, tuple, np.ndarray, str, os.PathLike
+        NumPy arrays (including views and ``np.memmap``) and objects
+        supporting the buffer protocol or the array interface are used
+        as they are, preserving their numeric dtype. Paths to ``.npy`` files
+        are memory-mapped in read-only mode. Lists and tuples are converted
+        to arrays of floats.
+
+    Returns
+    =======
+
+    arr : np.ndarray
+    """
+    np = import_module('numpy')
+
+    if isinstance(data, os.PathLike) or isinstance(data, str):
+        arr = np.load(data, mmap_mode="r")
+    elif isinstance(data, np.ndarray):
+        arr = data
+    elif hasattr(data, "__array__") or hasattr(data, "__array_interface__"):
+        arr = np.asarray(data)
+    else:
+        try:
+            arr = np.asarray(memoryview(data))
+        except TypeError:
+            return np.array(data, dtype=np.float64).reshape(-1)
+    if arr.dtype.kind not in "biuf":
+        # for example, lists of SymPy's numbers
+        arr = arr.astype(np.float64)
+    return arr.reshape(-1)
+
 
 class List2DSeries(Line2DBaseSeries):
-    """Representation for a line consisting of list of points."""
+    """Representation for a line consisting of list of points.
+
+    The coordinates are stored without copies when they are provided with
+    NumPy arrays (or memory-mapped ``.npy`` files, or objects supporting the
+    buffer protocol), preserving their dtype.
+    """
+
+    _discretization_attrs = []
+    _eval_bytes_per_point = 0
+
+    @property
+    def _bytes_per_point(self):
+        # the coordinates, with their own dtype
+        return self.list_x.itemsize + self.list_y.itemsize
 
     def __init__(self, list_x, list_y, label="", **kwargs):
         super().__init__(**kwargs)
-        np = import_module('numpy')
-
-        self.list_x = np.array(list_x, dtype=np.float64)
-        self.list_y = np.array(list_y, dtype=np.float64)
-        if len(list_x) != len(list_y):
+        self.list_x = _as_1d_array(list_x)
+        self.list_y = _as_1d_array(list_y)
+        if len(self.list_x) != len(self.list_y):
             raise ValueError(
                 "The two lists of coordinates must have the same "
                 "number of elements.\n"
@@ -555,14 +1403,127 @@ class List2DSeries(Line2DBaseSeries):
     def __str__(self):
         return "list plot"
 
+    def _get_number_of_points(self):
+        return len(self.list_x)
+
+    def get_points(self):
+        return self.list_x, self.list_y
+
+
+class StreamingList2DSeries(List2DSeries):
+    """Representation for a line consisting of a list of points which grows
+    over time, for example to monitor live data.
+
+    New points are added with ``append``. If ``window`` is an integer, only
+    the most recent ``window`` points are kept in a ring buffer, otherwise
+    the buffer grows as needed. In both cases, the cost of ``append`` is
+    proportional to the number of new points, and ``list_x, list_y`` are
+    views of the buffer (no copies).
+    """
+
+    is_streaming = True
+
+    def __init__(self, list_x=[], list_y=[], label="", window=None, **kwargs):
+        super().__init__(list_x, list_y, label, **kwargs)
+        np = import_module('numpy')
+
+        if (window is not None) and (int(window) < 1):
+            raise ValueError("`window` must be a positive integer.")
+        self.window = None if window is None else int(window)
+        # NOTE: with a rolling window, every point is written twice
+        # (mirrored ring buffer), so that the window is always a contiguous
+        # slice of the buffer.
+        n = len(self.list_x)
+        capacity = (2 * self.window if self.window is not None
+            else max(2 * n, 1024))
+        dtype = lambda a: a.dtype if a.dtype.kind == "f" else np.float64
+        self._buf_x = np.empty(capacity, dtype=dtype(self.list_x))
+        self._buf_y = np.empty(capacity, dtype=dtype(self.list_y))
+        # number of points in the buffer, position of the next point
+        self._count, self._end = 0, 0
+        # number of points appended since the last call to _get_new_points
+        self._n_new = 0
+        self.append(self.list_x, self.list_y)
+
+    def append(self, x, y):
+        """Append new points to the series.
+
+        Parameters
+        ==========
+
+        x, y : float, list or np.ndarray
+            Coordinates of the new points.
+        """
+        np = import_module('numpy')
+
+        x = np.atleast_1d(np.asarray(x)).reshape(-1)
+        y = np.atleast_1d(np.asarray(y)).reshape(-1)
+        if len(x) != len(y):
+            raise ValueError(
+                "The two lists of coordinates must have the same "
+                "number of elements.\n"
+                "Received: len(x) = {} and len(y) = {}".format(len(x), len(y)))
+        m = len(x)
+        self._n_new += m
+
+        if self.window is None:
+            if self._count + m > len(self._buf_x):
+                # amortized O(1) growth
+                capacity = max(2 * len(self._buf_x), self._count + m)
+                for name in ["_buf_x", "_buf_y"]:
+                    buf = getattr(self, name)
+                    new_buf = np.empty(capacity, dtype=buf.dtype)
+                    new_buf[:self._count] = buf[:self._count]
+                    setattr(self, name, new_buf)
+            self._buf_x[self._count:self._count + m] = x
+            self._buf_y[self._count:self._count + m] = y
+            self._count += m
+            self.list_x = self._buf_x[:self._count]
+            self.list_y = self._buf_y[:self._count]
+            return
+
+        w = self.window
+        if m >= w:
+            x, y, m = x[-w:], y[-w:], w
+        idx = (self._end + np.arange(m)) % w
+        for buf, v in [(self._buf_x, x), (self._buf_y, y)]:
+            buf[idx] = v
+            buf[idx + w] = v
+        self._end = (self._end + m) % w
+        self._count = min(self._count + m, w)
+        start = (self._end - self._count) % w
+        self.list_x = self._buf_x[start:start + self._count]
+        self.list_y = self._buf_y[start:start + self._count]
+
     def get_points(self):
+        # the backend is going to render all the points
+        self._n_new = 0
         return self.list_x, self.list_y
 
+    def _get_new_points(self):
+        """Return the coordinates of the points appended since the last
+        call to this method or to ``get_points`` (only the ones which are
+        still in the window), after applying the transformations.
+        """
+        m = min(self._n_new, self._count)
+        self._n_new = 0
+        return self._apply_transform(
+            self.list_x[len(self.list_x) - m:],
+            self.list_y[len(self.list_y) - m:])
+
+    def __str__(self):
+        return "streaming list plot"
+
 
 class LineOver1DRangeSeries(Line2DBaseSeries):
     """Representation for a line consisting of a SymPy expression over a
     real range."""
 
+    _uniform_sampling_cache = None
+    # Results of the uniform sampling computed in advance (for example, by
+    # ``plot_piecewise``), stored as ``(key, (x, real, imag))``. They are
+    # used as long as ``key`` matches the output of ``_get_sampling_key``.
+
     def __new__(cls, *args, **kwargs):
         if kwargs.get("absarg", False):
             return super().__new__(AbsArgLineSeries)
@@ -574,7 +1535,7 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         super().__init__(**kwargs)
         self.expr = sympify(expr)
         self.label = label
-        self._latex_label = label if str(expr) != label else latex(expr)
+        self._latex_label = label if str(expr) != label else partial(latex, expr)
         self.var = sympify(var_start_end[0])
         # NOTE: even though this class represents a line over a real range,
         # this class serves as a base class for AbsArgLineSeries, which is
@@ -589,6 +1550,8 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         self.is_polar = kwargs.get("is_polar", False)
         self.detect_poles = kwargs.get("detect_poles", False)
         self.eps = kwargs.get("eps", 0.01)
+        self.exploit_symmetry = kwargs.get("exploit_symmetry", False)
+        self._poles_cache = None
 
     def __str__(self):
         return "cartesian line: %s for %s over %s" % (
@@ -600,6 +1563,12 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
     def _adaptive_sampling(self):
         np = import_module('numpy')
 
+        if self._use_native_sampler():
+            x, (v, ) = self._native_adaptive_sampling([self.expr],
+                self.start.real, self.end.real,
+                1j * self.start.imag if self.is_complex else None)
+            return x, np.real(v), np.imag(v)
+
         def func(f, imag, x):
             try:
                 w = complex(f(x + 1j * imag))
@@ -612,14 +1581,62 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
             [self.start.real, self.end.real],
             self.start.imag,
             modules=self.modules,
+            timeout=self.timeout,
             adaptive_goal=self.adaptive_goal,
-            loss_fn=self.loss_fn)
+            loss_fn=self.loss_fn,
+            max_points=self.max_points,
+            executor=self.executor,
+            batch_size=self.batch_size)
         return data[:, 0], data[:, 1], data[:, 2]
 
+    def _get_sampling_key(self):
+        return (self.expr, self.modules, self.start, self.end, self.n,
+            self.scale, self.only_integers, self.detect_poles,
+            self.exploit_symmetry)
+
+    def _get_poles(self):
+        """Return the singularities of the expression found by SymPy when
+        ``detect_poles="symbolic"``, otherwise None. They are computed once
+        and cached.
+        """
+        if (self.detect_poles != "symbolic") or self.is_complex:
+            return None
+        key = (self.expr, self.var, self.start, self.end)
+        if (self._poles_cache is None) or (self._poles_cache[0] != key):
+            self._poles_cache = (key, _find_poles(self.expr, self.var,
+                self.start.real, self.end.real))
+        return self._poles_cache[1]
+
+    def _get_pole_step(self):
+        """Distance from the poles within which the steep segments are not
+        removed by ``_detect_poles``: the spacing of the uniform grid, or
+        of the initial grid of the adaptive algorithm.
+        """
+        n = _ADAPTIVE_N_INIT - 1 if self.adaptive else self.n
+        return (self.end.real - self.start.real) / n
+
     def _uniform_sampling(self):
         np = import_module('numpy')
 
+        cache = self._uniform_sampling_cache
+        if (cache is not None) and (cache[0] == self._get_sampling_key()):
+            return cache[1]
+
         x = xx = self._discretize(self.start.real, self.end.real, self.n, scale=self.scale, only_integers=self.only_integers)
+        poles = self._get_poles()
+        if (poles is not None) and (not self.only_integers):
+            x = xx = _insert_pole_samples(x, poles, self._get_pole_step())
+
+        index = None
+        if (self.exploit_symmetry and (poles is None) and
+            (self.scale == "linear") and (not self.only_integers) and
+            (not self.is_complex)):
+            # evaluate one period or one half, then tile or mirror
+            x_sym, reduced, index, sign = _symmetric_discretization(
+                self.start.real, self.end.real, self.n,
+                *_find_symmetry(self.expr, self.var))
+            if x_sym is not None:
+                x, xx = x_sym, reduced
 
         if self.is_complex:
             xx = xx + 1j * self.start.imag
@@ -634,13 +1651,16 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
             # as expected.
             xx = xx.astype(object)
 
-        data = uniform_eval([self.var], self.expr, xx, modules=self.modules)
+        data = uniform_eval([self.var], self.expr, xx, modules=self.modules,
+            timeout=self.timeout, chunk_size=self._chunk_size)
         _re, _im = np.real(data), np.imag(data)
 
         # with uniform sampling, if self.expr is a constant then only one
         # value will be returned, no matter the shape of x.
-        _re = self._correct_size(_re, x)
-        _im = self._correct_size(_im, x)
+        _re = self._correct_size(_re, xx)
+        _im = self._correct_size(_im, xx)
+        if index is not None:
+            _re, _im = sign * _re[index], sign * _im[index]
         return x, _re, _im
 
     def _get_real_imag(self):
@@ -653,20 +1673,38 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         return self._uniform_sampling()
 
     @staticmethod
-    def _detect_poles(x, y, eps=0.01):
+    def _detect_poles(x, y, eps=0.01, poles=None, step=0):
         """Compute the steepness of each segment. If it's greater than a
         threshold, set the right-point y-value non NaN.
+
+        If the locations of the ``poles`` are known, the lines are broken
+        there, inserting the points if necessary. The steep segments with
+        an end within a distance ``step`` from the poles are kept.
         """
         np = import_module('numpy')
 
         yy = y.copy()
         threshold = np.pi / 2 - eps
-        for i in range(len(x) - 1):
-            dx = x[i + 1] - x[i]
-            dy = abs(y[i + 1] - y[i])
-            angle = np.arctan(dy / dx)
-            if angle >= threshold:
-                yy[i + 1] = np.nan
+        with np.errstate(divide="ignore", invalid="ignore"):
+            angle = np.arctan(np.abs(np.diff(y)) / np.diff(x))
+        steep = angle >= threshold
+        if (poles is not None) and (len(poles) > 0):
+            idx = np.searchsorted(poles, x)
+            dist = np.minimum(
+                np.abs(x - poles[np.maximum(idx - 1, 0)]),
+                np.abs(x - poles[np.minimum(idx, len(poles) - 1)]))
+            near = dist <= step
+            steep &= np.invert(near[:-1] | near[1:])
+            yy[1:][steep] = np.nan
+            # break the lines at the poles
+            missing = poles[np.invert(np.isin(poles, x))]
+            missing = missing[(missing > x[0]) & (missing < x[-1])]
+            pos = np.searchsorted(x, missing)
+            x = np.insert(x, pos, missing)
+            yy = np.insert(yy, pos, np.nan)
+            yy[np.isin(x, poles)] = np.nan
+            return x, yy
+        yy[1:][steep] = np.nan
         return x, yy
 
     def get_points(self):
@@ -691,7 +1729,8 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
 
         if self.detect_poles:
-            return self._detect_poles(x, _re, self.eps)
+            return self._detect_poles(x, _re, self.eps, self._get_poles(),
+                self._get_pole_step())
         return x, _re
 
 
@@ -768,6 +1807,9 @@ class AbsArgLineSeries(LineOver1DRangeSeries):
 
 class ParametricLineBaseSeries(Line2DBaseSeries):
     is_parametric = True
+    # parameter (8) + evaluation of the two components (2 * 32) + x, y
+    # coordinates returned by ``get_data`` (16) + color values (8)
+    _bytes_per_point = 96
 
     def _set_parametric_line_label(self, label):
         """Logic to set the correct label to be shown on the plot.
@@ -780,10 +1822,10 @@ class ParametricLineBaseSeries(Line2DBaseSeries):
             label passed in by the pre-processor or the user
         """
         self.label = label
-        self._latex_label = label if str(self.var) != label else latex(self.var)
+        self._latex_label = label if str(self.var) != label else partial(latex, self.var)
         if (self.use_cm is False) and (label == str(self.var)):
             self.label = str(self.get_expr())
-            self._latex_label = latex(self.get_expr())
+            self._latex_label = partial(latex, self.get_expr())
 
     def _eval_component(self, expr, param):
         """Evaluate the specified expression over a predefined
@@ -791,7 +1833,8 @@ class ParametricLineBaseSeries(Line2DBaseSeries):
         """
         np = import_module('numpy')
 
-        v = uniform_eval([self.var], expr, param, modules=self.modules)
+        v = uniform_eval([self.var], expr, param, modules=self.modules,
+            timeout=self.timeout, chunk_size=self._chunk_size)
         re_v, im_v = np.real(v), np.imag(v)
         re_v = self._correct_size(re_v, param)
         im_v = self._correct_size(im_v, param)
@@ -801,6 +1844,16 @@ class ParametricLineBaseSeries(Line2DBaseSeries):
     def _adaptive_sampling(self):
         np = import_module('numpy')
 
+        if self._use_native_sampler():
+            param, values = self._native_adaptive_sampling(
+                self.get_expr(), self.start, self.end)
+            results = []
+            for v in values:
+                re_v, im_v = np.real(v), np.imag(v)
+                re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
+                results.append(re_v)
+            return (*results, param)
+
         def func(f, is_2Dline, x):
             try:
                 w = [complex(t) for t in f(x)]
@@ -817,8 +1870,12 @@ class ParametricLineBaseSeries(Line2DBaseSeries):
             [self.start, self.end],
             self.is_2Dline,
             modules=self.modules,
+            timeout=self.timeout,
             adaptive_goal=self.adaptive_goal,
-            loss_fn=self.loss_fn)
+            loss_fn=self.loss_fn,
+            max_points=self.max_points,
+            executor=self.executor,
+            batch_size=self.batch_size)
 
         if self.is_2Dline:
             return data[:, 1], data[:, 2], data[:, 0]
@@ -905,6 +1962,10 @@ class Parametric3DLineSeries(ParametricLineBaseSeries):
 
     is_2Dline = False
     is_3Dline = True
+    # parameter (8) + evaluation of the three components (3 * 32) + x, y, z
+    # coordinates returned by ``get_data`` (24); the color values are the
+    # parameter itself
+    _bytes_per_point = 128
 
     def __init__(self, expr_x, expr_y, expr_z, var_start_end, label="", **kwargs):
         super().__init__(**kwargs)
@@ -938,6 +1999,11 @@ class SurfaceBaseSeries(BaseSeries):
     """A base class for 3D surfaces."""
 
     is_3Dsurface = True
+    _discretization_attrs = ["n1", "n2"]
+    # meshes x, y (16) + evaluation of the expression (32); the z
+    # coordinates returned by ``get_data`` are the real part
+    _bytes_per_point = 48
+    _pixels_per_point = 4
 
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -949,16 +2015,21 @@ class SurfaceBaseSeries(BaseSeries):
         self.adaptive = kwargs.get("adaptive", False)
         self.adaptive_goal = kwargs.get("adaptive_goal", cfg["adaptive"]["goal"])
         self.loss_fn = kwargs.get("loss_fn", None)
+        self.max_points = kwargs.get("max_points",
+            cfg["adaptive"]["max_points"])
+        self.executor = kwargs.get("executor", None)
+        self.batch_size = kwargs.get("batch_size", None)
         self.modules = kwargs.get("modules", None)
+        self.timeout = kwargs.get("timeout", cfg["evaluation"]["timeout"])
         self._rendering_kw = kwargs.get("surface_kw", dict())
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
         self.is_polar = kwargs.get("is_polar", False)
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _z_color_func)
         self._init_transforms(**kwargs)
 
     def _set_surface_label(self, label):
         self.label = label
-        self._latex_label = label if str(self.get_expr()) != label else latex(self.get_expr())
+        self._latex_label = label if str(self.get_expr()) != label else partial(latex, self.get_expr())
 
     def _discretize(self, s1, e1, s2, e2):
         np = import_module('numpy')
@@ -969,13 +2040,38 @@ class SurfaceBaseSeries(BaseSeries):
             self.yscale, self.only_integers)
         return np.meshgrid(mesh_x, mesh_y)
 
+    def get_mesh(self):
+        """Return the triangle mesh computed by the adaptive algorithm,
+        which is available when ``is_mesh`` is True. Its size is
+        proportional to the number of evaluated points. Vertices with
+        non-finite coordinates are not included.
+
+        Returns
+        =======
+        vertices : np.ndarray [V x 3]
+            Coordinates of the vertices of the triangles.
+        faces : np.ndarray [F x 3]
+            Indices of the vertices of each triangle.
+        """
+        np = import_module('numpy')
+        if not self.is_mesh:
+            raise ValueError(
+                "`get_mesh` is only available when the adaptive algorithm "
+                "returns a triangle mesh.")
+        x, y, z, faces = self.get_data(fields=("x", "y", "z", "faces"))
+        return np.column_stack([x, y, z]), faces
+
 
 class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
     """Representation for a 3D surface consisting of a sympy expression and 2D
     range."""
 
+    _default_fields = ["x", "y", "z"]
+
     def __init__(self, expr, var_start_end_x, var_start_end_y, label="", **kwargs):
         super().__init__(**kwargs)
+        self.triangulate = kwargs.get("triangulate", False)
+        self.exploit_symmetry = kwargs.get("exploit_symmetry", False)
         self.expr = sympify(expr)
         self.var_x = sympify(var_start_end_x[0])
         self.start_x = float(var_start_end_x[1])
@@ -992,6 +2088,16 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
             str(self.var_y), str((self.start_y, self.end_y)),
         )
 
+    @property
+    def is_mesh(self):
+        """True if the adaptive algorithm returns its triangulation."""
+        return self.adaptive and self.triangulate and self.is_3Dsurface
+
+    @property
+    def _data_fields(self):
+        fields = ["x", "y", "z", "x1d", "y1d"]
+        return fields + ["faces"] if self.is_mesh else fields
+
     def _adaptive_sampling(self):
         np = import_module('numpy')
 
@@ -1005,28 +2111,73 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
             func, [self.var_x, self.var_y], self.expr,
             [(self.start_x, self.end_x), (self.start_y, self.end_y)],
             modules=self.modules,
+            timeout=self.timeout,
             adaptive_goal=self.adaptive_goal,
-            loss_fn=self.loss_fn)
+            loss_fn=self.loss_fn,
+            max_points=self.max_points,
+            executor=self.executor,
+            batch_size=self.batch_size,
+            triangulate=self.is_mesh)
 
     def _uniform_sampling(self):
+        """Evaluate the expression over a uniform grid. Return the 1D
+        discretizations along x and y, and the results of the evaluation.
+        The meshes are not created: the evaluation uses broadcasting.
+        """
         np = import_module('numpy')
 
-        mesh_x, mesh_y = self._discretize(self.start_x, self.end_x,
-            self.start_y, self.end_y)
+        x = super(SurfaceBaseSeries, self)._discretize(self.start_x,
+            self.end_x, self.n1, self.xscale, self.only_integers)
+        y = super(SurfaceBaseSeries, self)._discretize(self.start_y,
+            self.end_y, self.n2, self.yscale, self.only_integers)
+
+        # evaluate one period or one half along each direction, then tile
+        # or mirror the results
+        xr, yr, ix, iy, sx, sy = x, y, None, None, 1, 1
+        if self.exploit_symmetry and (not self.only_integers):
+            if self.xscale == "linear":
+                x_sym, reduced, index, sign = _symmetric_discretization(
+                    self.start_x, self.end_x, self.n1,
+                    *_find_symmetry(self.expr, self.var_x))
+                if x_sym is not None:
+                    x, xr, ix, sx = x_sym, reduced, index, sign[None, :]
+            if self.yscale == "linear":
+                y_sym, reduced, index, sign = _symmetric_discretization(
+                    self.start_y, self.end_y, self.n2,
+                    *_find_symmetry(self.expr, self.var_y))
+                if y_sym is not None:
+                    y, yr, iy, sy = y_sym, reduced, index, sign[:, None]
+        ref = np.empty((len(yr), len(xr)))
 
         v = uniform_eval([self.var_x, self.var_y], self.expr,
-            mesh_x, mesh_y, modules=self.modules)
+            xr[None, :], yr[:, None], modules=self.modules,
+            timeout=self.timeout, chunk_size=self._chunk_size)
         re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_size(re_v, mesh_x)
-        im_v = self._correct_size(im_v, mesh_x)
+        re_v = self._correct_size(re_v, ref)
+        im_v = self._correct_size(im_v, ref)
         re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
-        return mesh_x, mesh_y, re_v
+        if ix is not None:
+            re_v = re_v[:, ix]
+        if iy is not None:
+            re_v = re_v[iy, :]
+        return x, y, sx * sy * re_v
 
-    def get_data(self):
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting. Depending on the
         `adaptive` option, this function will either use an adaptive algorithm
         or it will uniformly sample the expression over the provided range.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "z", "x1d", "y1d"``, where ``"x1d", "y1d"`` are
+            the first row of ``mesh_x`` and the first column of ``mesh_y``,
+            respectively. Only the requested arrays are computed. If None
+            (default), return ``mesh_x, mesh_y, z``. If ``adaptive=True``
+            and ``triangulate=True``, ``"faces"`` is also available.
+
         Returns
         =======
 
@@ -1038,21 +2189,47 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
 
         z : np.ndarray [n2 x n1]
             Results of the evaluation.
+
+        If ``adaptive=True`` and ``triangulate=True``, ``x, y, z`` are 1D
+        arrays with the coordinates of the finite vertices of the
+        triangulation computed by the adaptive algorithm: ``"x1d", "y1d"``
+        are equal to ``x, y``. Use ``get_mesh`` to also get the triangles.
         """
         np = import_module('numpy')
 
-        if self.adaptive:
-            res = self._adaptive_sampling()
+        self._resolve_auto_discretization()
+        requested = self._check_fields(fields)
+
+        faces = None
+        if self.is_mesh:
+            points, z, faces = self._adaptive_sampling()
+            x, y = points[:, 0], points[:, 1]
+        elif self.adaptive:
+            x, y, z = self._adaptive_sampling()
         else:
-            res = self._uniform_sampling()
+            x, y, z = self._uniform_sampling()
+            if self.is_polar or ("x" in requested) or ("y" in requested):
+                x, y = np.meshgrid(x, y)
 
-        x, y, z = res
-        r = x.copy()
         if self.is_polar:
+            r = x.copy()
             x = r * np.cos(y)
             y = r * np.sin(y)
 
-        return self._apply_transform(x, y, z)
+        t = lambda v, transform: v if transform is None else transform(v)
+        data = {"z": t(z, self._tz), "faces": faces}
+        if faces is not None:
+            data["faces"], (data["x"], data["y"], data["z"]) = \
+                _remove_nonfinite_vertices(faces, t(x, self._tx),
+                    t(y, self._ty), data["z"])
+            data["x1d"], data["y1d"] = data["x"], data["y"]
+        elif x.ndim == 2:
+            data["x"], data["y"] = t(x, self._tx), t(y, self._ty)
+            data["x1d"], data["y1d"] = data["x"][0, :], data["y"][:, 0]
+        else:
+            data["x1d"], data["y1d"] = t(x, self._tx), t(y, self._ty)
+        return tuple(data[f] for f in requested)
+
 
 
 class ParametricSurfaceSeries(SurfaceBaseSeries):
@@ -1060,6 +2237,10 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
     expressions and a range."""
 
     is_parametric = True
+    _default_fields = ["x", "y", "z", "u", "v"]
+    # meshes u, v (16) + evaluation of the three components (3 * 32); the
+    # coordinates returned by ``get_data`` are the real parts
+    _bytes_per_point = 112
 
     def __init__(self, expr_x, expr_y, expr_z,
         var_start_end_u, var_start_end_v, label="", **kwargs
@@ -1075,18 +2256,25 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
         self.start_v = float(var_start_end_v[1])
         self.end_v = float(var_start_end_v[2])
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
-        self.color_func = kwargs.get("color_func", lambda x, y, z, u, v: z)
+        self.color_func = kwargs.get("color_func", _z_color_func)
         self._set_surface_label(label)
-
         if self.adaptive:
-            # NOTE: turns out that it is difficult to interpolate over 3
-            # parameters in order to get a uniform grid out of the adaptive
-            # results. As a consequence, let's not implement adaptive for this
-            # class.
-            warnings.warn(
-                "ParametricSurfaceSeries does not support adaptive algorithm. "
-                "Automatically switching to a uniform spacing algorithm.")
-            self.adaptive = False
+            # the uniform grid is only the starting point of the refinement
+            self.n1 = kwargs.get("n1", 20)
+            self.n2 = kwargs.get("n2", 20)
+        # maximum number of subdivisions of the cells of the quadtree, used
+        # when adaptive=True
+        self.depth = kwargs.get("depth", 4)
+
+    @property
+    def is_mesh(self):
+        """True if the adaptive algorithm returns a triangle mesh."""
+        return self.adaptive
+
+    @property
+    def _data_fields(self):
+        fields = ["x", "y", "z", "u", "v"]
+        return fields + ["faces"] if self.is_mesh else fields
 
     def get_expr(self):
         return (self.expr_x, self.expr_y, self.expr_z)
@@ -1108,18 +2296,197 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
         np = import_module('numpy')
 
         v = uniform_eval([self.var_u, self.var_v], expr, *args,
-            modules=self.modules)
+            modules=self.modules, timeout=self.timeout,
+            chunk_size=self._chunk_size)
         re_v, im_v = np.real(v), np.imag(v)
         re_v = self._correct_size(re_v, args[0])
         im_v = self._correct_size(im_v, args[0])
         re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
         return re_v
 
-    def get_data(self):
+    def _adaptive_sampling(self):
+        """Evaluate the expressions over a quadtree in the (u, v) plane.
+        Starting from the uniform grid of ``n1, n2`` points, a cell is
+        subdivided into four if the point of the surface at its center
+        deviates from the mean of its corners by more than
+        ``adaptive_goal / 10`` times the size of the surface. This
+        deviation is proportional to the curvature times the squared size
+        of the cell. At each level, the new points are evaluated with a
+        single vectorized call per component.
+
+        The leaves of the quadtree are triangulated with a fan around
+        their centers, which includes the vertices of the smaller adjacent
+        cells: the mesh has no cracks.
+
+        Returns
+        =======
+        x, y, z, u, v : np.ndarray [N]
+            Coordinates and parameters of the vertices.
+        faces : np.ndarray [F x 3]
+            Indices of the vertices of each triangle.
+        """
+        np = import_module('numpy')
+
+        depth = self.depth
+        n = np.array([self.n1, self.n2])
+        # lattice of the centers of the smallest cells: a cell of level l
+        # has size 2**(depth + 1 - l) on this lattice
+        shape = (n - 1) * 2 ** (depth + 1) + 1
+        fine = [BaseSeries._discretize(s, e, m, scale)
+            for s, e, m, scale in zip([self.start_u, self.start_v],
+                [self.end_u, self.end_v], shape, [self.xscale, self.yscale])]
+        params = [self.var_u, self.var_v]
+        funcs = [(lambdify(params, e, modules=self.modules),
+            _lazy_lambdify(params, e, modules="sympy"))
+            for e in self.get_expr()]
+
+        keys, coords = [], []
+
+        def evaluate(ij):
+            # evaluate the surface at the (unique) lattice points ij
+            u, v = fine[0][ij[:, 0]], fine[1][ij[:, 1]]
+            xyz = np.column_stack([
+                _evaluate_batch(f1, f2, u, v, modules=self.modules)
+                for f1, f2 in funcs])
+            xyz = np.where(np.isclose(xyz.imag, 0), xyz.real, np.nan)
+            keys.append(np.ravel_multi_index(tuple(ij.T), shape))
+            coords.append(xyz)
+            return xyz
+
+        # level 0: the uniform grid and the centers of its cells
+        size = 2 ** (depth + 1)
+        grid = np.array(np.meshgrid(*[np.arange(m) for m in n],
+            indexing="ij")).reshape(2, -1).T
+        ij = (grid.reshape(n[0], n[1], 2)[:-1, :-1] * size).reshape(-1, 2)
+        xyz = evaluate(np.concatenate([grid * size, ij + size // 2]))
+        corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+        g = xyz[:len(grid)].reshape(n[0], n[1], 3)
+        values = np.stack([g[c0:n[0]-1+c0, c1:n[1]-1+c1].reshape(-1, 3)
+            for c0, c1 in corners], axis=1)
+        center = xyz[len(grid):]
+
+        finite = np.isfinite(xyz).all(axis=1)
+        scale = (np.linalg.norm(np.ptp(xyz[finite], axis=0))
+            if finite.any() else 1)
+        goal = self.adaptive_goal
+        tol = (0.01 if not isinstance(goal, (int, float)) else goal) / 10
+        tol *= scale if scale > 0 else 1
+
+        def deviation(values, center):
+            with np.errstate(invalid="ignore"):
+                d = np.linalg.norm(center - values.mean(axis=1), axis=1)
+            # refine the cells crossing the boundary of the domain
+            nan = np.isnan(d)
+            mixed = np.isfinite(np.concatenate(
+                [values, center[:, None]], axis=1)).any(axis=(1, 2))
+            d[nan] = np.where(mixed[nan], np.inf, 0)
+            return d
+
+        leaves = []
+        dev = deviation(values, center)
+        budget = np.inf if self.max_points is None else self.max_points
+        n_points = len(xyz)
+        deadline = _get_deadline(self.timeout)
+        for level in range(depth):
+            split = dev > tol
+            if _deadline_exceeded(deadline) and split.any():
+                _warn_timeout(self.timeout,
+                    "The adaptive refinement has been stopped with "
+                    "{} levels left: the results might be coarse.".format(
+                        depth - level))
+                split[:] = False
+            # each subdivision evaluates at most 8 new points: give the
+            # priority to the cells with the largest deviation
+            n_split = int(min(split.sum(), (budget - n_points) // 8))
+            if n_split < split.sum():
+                order = np.argsort(-dev)
+                split[:] = False
+                split[order[:max(n_split, 0)]] = True
+            leaves.append((level, ij[~split]))
+            if not split.any():
+                break
+            ij, values, center = ij[split], values[split], center[split]
+            s = size // 2 ** level
+            h = s // 2
+            # midpoints of the edges, shared by adjacent cells, and the
+            # centers of the subcells
+            mid_offsets = np.array([[h, 0], [s, h], [h, s], [0, h]])
+            sub = np.array([[0, 0], [h, 0], [h, h], [0, h]])
+            new = np.concatenate([
+                (ij[:, None, :] + mid_offsets).reshape(-1, 2),
+                (ij[:, None, :] + sub + h // 2).reshape(-1, 2)])
+            linear = np.ravel_multi_index(tuple(new.T), shape)
+            unique, inverse = np.unique(linear, return_inverse=True)
+            xyz = evaluate(np.column_stack(np.unravel_index(unique, shape)))
+            n_points += len(unique)
+            xyz = xyz[inverse]
+            mid = xyz[:4 * len(ij)].reshape(-1, 4, 3)
+            sub_center = xyz[4 * len(ij):].reshape(-1, 4, 3)
+            # corners of the subcells, ordered as ``sub``
+            c, m = values, mid
+            values = np.stack([
+                np.stack([c[:, 0], m[:, 0], center, m[:, 3]], axis=1),
+                np.stack([m[:, 0], c[:, 1], m[:, 1], center], axis=1),
+                np.stack([center, m[:, 1], c[:, 2], m[:, 2]], axis=1),
+                np.stack([m[:, 3], center, m[:, 2], c[:, 3]], axis=1),
+            ], axis=1).reshape(-1, 4, 3)
+            center = sub_center.reshape(-1, 3)
+            ij = (ij[:, None, :] + sub).reshape(-1, 2)
+            dev = deviation(values, center)
+        else:
+            leaves.append((depth, ij))
+
+        keys = np.concatenate(keys)
+        keys, idx = np.unique(keys, return_index=True)
+        coords = np.concatenate(coords)[idx]
+
+        faces = []
+        for level, ij in leaves:
+            if len(ij) == 0:
+                continue
+            s = size // 2 ** level
+            # the boundary of the cells, counterclockwise: only the existing
+            # vertices are used
+            t = np.arange(s)
+            boundary = np.concatenate([
+                np.column_stack([t, np.zeros(s, dtype=int)]),
+                np.column_stack([np.full(s, s), t]),
+                np.column_stack([s - t, np.full(s, s)]),
+                np.column_stack([np.zeros(s, dtype=int), s - t])])
+            b = np.ravel_multi_index(
+                tuple((ij[:, None, :] + boundary).reshape(-1, 2).T), shape)
+            b = b.reshape(len(ij), -1)
+            pos = np.minimum(np.searchsorted(keys, b), len(keys) - 1)
+            rows, cols = np.nonzero(keys[pos] == b)
+            start = np.concatenate([[0], np.flatnonzero(np.diff(rows)) + 1])
+            end = np.append(start[1:], len(rows)) - 1
+            nxt = np.arange(1, len(rows) + 1)
+            nxt[end] = start
+            centers = np.searchsorted(keys,
+                np.ravel_multi_index(tuple((ij + s // 2).T), shape))
+            faces.append(np.column_stack([centers[rows],
+                pos[rows, cols], pos[rows[nxt], cols[nxt]]]))
+        faces = np.concatenate(faces)
+
+        u, v = np.unravel_index(keys, shape)
+        faces, data = _remove_nonfinite_vertices(faces, *coords.T,
+            fine[0][u], fine[1][v])
+        return (*data, faces)
+
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting. Depending on the
         `adaptive` option, this function will either use an adaptive algorithm
         or it will uniformly sample the expression over the provided range.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "z", "u", "v"``. Only the requested components
+            are evaluated. If None (default), return ``x, y, z, mesh_u,
+            mesh_v``. If ``adaptive=True``, ``"faces"`` is also available.
+
         Returns
         =======
 
@@ -1133,13 +2500,25 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
             Discretized u range.
         mesh_v : np.ndarray [n2 x n1]
             Discretized v range.
+
+        If ``adaptive=True``, these are 1D arrays with the coordinates and
+        the parameters of the vertices of the triangle mesh computed by the
+        adaptive algorithm. Use ``get_mesh`` to also get the triangles.
         """
-        mesh_u, mesh_v = self._discretize(self.start_u, self.end_u,
-            self.start_v, self.end_v)
-        x = self._eval_component(self.expr_x, mesh_u, mesh_v)
-        y = self._eval_component(self.expr_y, mesh_u, mesh_v)
-        z = self._eval_component(self.expr_z, mesh_u, mesh_v)
-        return x, y, z, mesh_u, mesh_v
+        self._resolve_auto_discretization()
+        requested = self._check_fields(fields)
+
+        if self.is_mesh:
+            data = dict(zip(["x", "y", "z", "u", "v", "faces"],
+                self._adaptive_sampling()))
+        else:
+            data = {}
+            data["u"], data["v"] = self._discretize(self.start_u,
+                self.end_u, self.start_v, self.end_v)
+            for k, e in zip(["x", "y", "z"], self.get_expr()):
+                if k in requested:
+                    data[k] = self._eval_component(e, data["u"], data["v"])
+        return tuple(data[f] for f in requested)
 
 
 class ContourSeries(SurfaceOver2DRangeSeries):
@@ -1151,6 +2530,7 @@ class ContourSeries(SurfaceOver2DRangeSeries):
 
     is_3Dsurface = False
     is_contour = True
+    _pixels_per_point = 2
 
     def __str__(self):
         return ("contour: %s for " "%s over %s and %s over %s") % (
@@ -1174,6 +2554,11 @@ class ImplicitSeries(BaseSeries):
     """
 
     is_implicit = True
+    _discretization_attrs = ["n1", "n2"]
+    # meshes x, y (16) + complex results of the expression (16). The
+    # uniform meshing strategy doesn't use np.vectorize.
+    _bytes_per_point = 32
+    _eval_bytes_per_point = 0
 
     def __init__(self, expr, var_start_end_x, var_start_end_y, label="", **kwargs):
         super().__init__()
@@ -1189,17 +2574,21 @@ class ImplicitSeries(BaseSeries):
         self.n1 = kwargs.get("n1", 1000)
         self.n2 = kwargs.get("n2", 1000)
         self.label = label
-        self._latex_label = label if str(expr) != label else latex(expr)
+        self._latex_label = label if str(expr) != label else partial(latex, expr)
         self.adaptive = kwargs.get("adaptive", False)
         self.xscale = kwargs.get("xscale", "linear")
         self.yscale = kwargs.get("yscale", "linear")
         self._rendering_kw = kwargs.get("contour_kw", dict())
+        self.timeout = kwargs.get("timeout", cfg["evaluation"]["timeout"])
 
-        if isinstance(expr, BooleanFunction) and (not self.adaptive):
+        if (isinstance(expr, BooleanFunction) and (not self.adaptive)
+                and expr.has(Equality)):
+            # the uniform mesh evaluates Boolean functions as masks of the
+            # regions, where the curves of equalities are not visible.
             self.adaptive = True
             warnings.warn(
-                "The provided expression contains Boolean functions. "
-                + "In order to plot the expression, the algorithm "
+                "The provided expression contains Boolean functions of "
+                + "equalities. In order to plot the expression, the algorithm "
                 + "automatically switched to an adaptive sampling."
             )
 
@@ -1210,6 +2599,9 @@ class ImplicitSeries(BaseSeries):
         elif depth < 0:
             depth = 0
         self.depth = 4 + depth
+        # seed of the jitter applied to the initial grid of the adaptive
+        # algorithm: a fixed value makes the results reproducible.
+        self.seed = kwargs.get("seed", 0)
 
     def _has_equality(self, expr):
         # Represents whether the expression contains an Equality, GreaterThan
@@ -1248,19 +2640,16 @@ class ImplicitSeries(BaseSeries):
         )
 
     def get_data(self):
+        self._resolve_auto_discretization()
         if self.adaptive:
-            import sympy.plotting.intervalmath.lib_interval as li
-
             user_functions = {}
             printer = IntervalMathPrinter({
                 'fully_qualified_modules': False, 'inline': True,
                 'allow_unknown_functions': True,
                 'user_functions': user_functions})
 
-            keys = [t for t in dir(li) if ("__" not in t) and (t not in ["import_module", "interval"])]
-            vals = [getattr(li, k) for k in keys]
-            d = {k: v for k, v in zip(keys, vals)}
-            func = lambdify((self.var_x, self.var_y), self.expr, modules=[d], printer=printer)
+            func = lambdify((self.var_x, self.var_y), self.expr,
+                modules=[interval_functions], printer=printer)
 
             try:
                 data = self._get_raster_interval(func)
@@ -1288,91 +2677,108 @@ class ImplicitSeries(BaseSeries):
         return self._get_meshes_grid()
 
     def _get_raster_interval(self, func):
-        """Uses interval math to adaptively mesh and obtain the plot"""
+        """Uses interval math to adaptively mesh and obtain the plot.
+
+        At each level of refinement, the undecided cells are evaluated
+        with a single vectorized call of ``func`` and subdivided into four.
+
+        Returns
+        =======
+
+        rectangles : np.ndarray [n x 4]
+            Each row is ``[x_start, x_end, y_start, y_end]``, the bounds of
+            a rectangle in which the expression is satisfied.
+
+        plot_type : str
+            Always ``"fill"``.
+        """
         np = import_module('numpy')
 
         k = self.depth
-        interval_list = []
         # Create initial 32 divisions
         xsample = np.linspace(self.start_x, self.end_x, 33)
         ysample = np.linspace(self.start_y, self.end_y, 33)
 
         # Add a small jitter so that there are no false positives for equality.
         # Ex: y==x becomes True for x interval(1, 2) and y interval(1, 2)
-        # which will draw a rectangle.
-        jitterx = (
-            (np.random.rand(len(xsample)) * 2 - 1)
+        # which will draw a rectangle. The jitter is seeded so that the
+        # results are reproducible.
+        rng = np.random.default_rng(self.seed)
+        xsample += (
+            (rng.random(len(xsample)) * 2 - 1)
             * (self.end_x - self.start_x)
             / 2 ** 20
         )
-        jittery = (
-            (np.random.rand(len(ysample)) * 2 - 1)
+        ysample += (
+            (rng.random(len(ysample)) * 2 - 1)
             * (self.end_y - self.start_y)
             / 2 ** 20
         )
-        xsample += jitterx
-        ysample += jittery
 
-        xinter = [interval(x1, x2) for x1, x2 in zip(xsample[:-1], xsample[1:])]
-        yinter = [interval(y1, y2) for y1, y2 in zip(ysample[:-1], ysample[1:])]
-        interval_list = [[x, y] for x in xinter for y in yinter]
-        plot_list = []
+        i, j = [t.flatten() for t in np.meshgrid(
+            np.arange(32), np.arange(32), indexing="ij")]
+        cells = np.column_stack([xsample[i], xsample[i + 1],
+            ysample[j], ysample[j + 1]])
+
+        def evaluate(cells):
+            """Evaluates the expression over the cells, returning the
+            three-valued logic arrays of the result and of its validity."""
+            with np.errstate(all="ignore"):
+                result = func(IntervalArray(cells[:, 0], cells[:, 1]),
+                    IntervalArray(cells[:, 2], cells[:, 3]))
+            if not isinstance(result, IntervalMembershipArray):
+                raise TypeError(
+                    "Interval arithmetic produced %s." % type(result))
+            value, valid = [np.broadcast_to(t, len(cells)) for t in result]
+            return value, valid
+
+        def subdivide(cells):
+            x1, x2, y1, y2 = cells.T
+            xm, ym = (x1 + x2) / 2, (y1 + y2) / 2
+            return np.concatenate([
+                np.column_stack([x1, xm, y1, ym]),
+                np.column_stack([x1, xm, ym, y2]),
+                np.column_stack([xm, x2, y1, ym]),
+                np.column_stack([xm, x2, ym, y2])])
 
-        # recursive call refinepixels which subdivides the intervals which are
-        # neither True nor False according to the expression.
-        def refine_pixels(interval_list):
-            """Evaluates the intervals and subdivides the interval if the
-            expression is partially satisfied."""
-            temp_interval_list = []
-            plot_list = []
-            for intervals in interval_list:
-
-                # Convert the array indices to x and y values
-                intervalx = intervals[0]
-                intervaly = intervals[1]
-                func_eval = func(intervalx, intervaly)
-                # The expression is valid in the interval. Change the contour
-                # array values to 1.
-                if func_eval[1] is False or func_eval[0] is False:
-                    pass
-                elif func_eval == (True, True):
-                    plot_list.append([intervalx, intervaly])
-                elif func_eval[1] is None or func_eval[0] is None:
-                    # Subdivide
-                    avgx = intervalx.mid
-                    avgy = intervaly.mid
-                    a = interval(intervalx.start, avgx)
-                    b = interval(avgx, intervalx.end)
-                    c = interval(intervaly.start, avgy)
-                    d = interval(avgy, intervaly.end)
-                    temp_interval_list.append([a, c])
-                    temp_interval_list.append([a, d])
-                    temp_interval_list.append([b, c])
-                    temp_interval_list.append([b, d])
-            return temp_interval_list, plot_list
-
-        while k >= 0 and len(interval_list):
-            interval_list, plot_list_temp = refine_pixels(interval_list)
-            plot_list.extend(plot_list_temp)
+        plot_list = []
+        deadline = _get_deadline(self.timeout)
+        while k >= 0 and len(cells):
+            if _deadline_exceeded(deadline):
+                # stop refining: the undecided intervals are going to be
+                # treated as the last level of refinement.
+                _warn_timeout(self.timeout,
+                    "The adaptive refinement has been stopped with "
+                    "{} levels left: the results might be coarse.".format(
+                        k + 1))
+                break
+            value, valid = evaluate(cells)
+            # The expression is satisfied over the whole cell
+            plot_list.append(cells[(value == TRUE) & (valid == TRUE)])
+            # Subdivide the cells where the expression is partially
+            # satisfied, discard the ones where it is not.
+            undecided = ((value != FALSE) & (valid != FALSE) &
+                ((value == NONE) | (valid == NONE)))
+            cells = subdivide(cells[undecided])
             k = k - 1
         # Check whether the expression represents an equality
         # If it represents an equality, then none of the intervals
         # would have satisfied the expression due to floating point
         # differences. Add all the undecided values to the plot.
-        if self.has_equality:
-            for intervals in interval_list:
-                intervalx = intervals[0]
-                intervaly = intervals[1]
-                func_eval = func(intervalx, intervaly)
-                if func_eval[1] and func_eval[0] is not False:
-                    plot_list.append([intervalx, intervaly])
-        return plot_list, "fill"
+        if self.has_equality and len(cells):
+            value, valid = evaluate(cells)
+            plot_list.append(cells[(valid == TRUE) & (value != FALSE)])
+        if len(plot_list) == 0:
+            return np.zeros((0, 4)), "fill"
+        return np.concatenate(plot_list), "fill"
 
     def _get_meshes_grid(self):
         """Generates the mesh for generating a contour.
 
-        In the case of equality, ``contour`` function of matplotlib can
-        be used. In other cases, matplotlib's ``contourf`` is used.
+        In the case of equality, the level curve is extracted with the
+        marching squares algorithm and returned as NaN-separated polylines,
+        ``x, y, "lines"``. In other cases, matplotlib's ``contourf`` is
+        used.
         """
         np = import_module('numpy')
 
@@ -1380,20 +2786,41 @@ class ImplicitSeries(BaseSeries):
         xarray = self._discretize(self.start_x, self.end_x, self.n1, self.xscale)
         yarray = self._discretize(self.start_y, self.end_y, self.n2, self.yscale)
         x_grid, y_grid = np.meshgrid(xarray, yarray)
+        if isinstance(expr, BooleanFunction):
+            mask = self._get_boolean_mask(expr, x_grid, y_grid)
+            return xarray, yarray, np.where(mask, 1.0, -1.0), 'contourf'
         func = lambdify((self.var_x, self.var_y), expr)
         z_grid = func(x_grid, y_grid)
         z_grid = self._correct_size(z_grid, x_grid)
+        if equality:
+            xc, yc = marching_squares(xarray, yarray, z_grid)
+            return xc, yc, "lines"
         z_grid[np.ma.where(z_grid < 0)] = -1
         z_grid[np.ma.where(z_grid > 0)] = 1
-        if equality:
-            return xarray, yarray, z_grid, 'contour'
-        else:
-            return xarray, yarray, z_grid, 'contourf'
+        return xarray, yarray, z_grid, 'contourf'
+
+    def _get_boolean_mask(self, expr, x_grid, y_grid):
+        """Evaluate a Boolean combination of relationals over the grid:
+        each relational is lambdified into a NumPy boolean mask, and the
+        masks are combined with ``&``, ``|``, ``~`` and ``^``.
+        """
+        np = import_module('numpy')
+        operators = {And: operator.and_, Or: operator.or_, Xor: operator.xor}
+        if type(expr) in operators:
+            return reduce(operators[type(expr)],
+                [self._get_boolean_mask(a, x_grid, y_grid) for a in expr.args])
+        if isinstance(expr, Not):
+            return ~self._get_boolean_mask(expr.args[0], x_grid, y_grid)
+        func = lambdify((self.var_x, self.var_y), expr)
+        with np.errstate(invalid="ignore"):
+            mask = np.asarray(func(x_grid, y_grid), dtype=bool)
+        return self._correct_size(mask, x_grid)
 
     @staticmethod
     def _preprocess_meshgrid_expression(expr):
         """If the expression is a Relational, rewrite it as a single
-        expression. This method reduces code repetition.
+        expression. Boolean functions are returned unchanged. This method
+        reduces code repetition.
 
         Returns
         =======
@@ -1405,7 +2832,11 @@ class ImplicitSeries(BaseSeries):
             Wheter the original expression was an Equality or not.
         """
         equality = False
-        if isinstance(expr, Equality):
+        if isinstance(expr, BooleanFunction):
+            # evaluated with boolean masks
+            pass
+
+        elif isinstance(expr, Equality):
             expr = expr.lhs - expr.rhs
             equality = True
 
@@ -1424,6 +2855,11 @@ class ImplicitSeries(BaseSeries):
 
 class Implicit3DSeries(SurfaceBaseSeries):
     is_implicit = True
+    _discretization_attrs = ["n1", "n2", "n3"]
+    # meshes x, y, z (24) + evaluation of the expression (32); the values
+    # returned by ``get_data`` are the real part
+    _bytes_per_point = 56
+    _pixels_per_point = 8
 
     def __init__(self, expr, range_x, range_y, range_z, label="", **kwargs):
         super().__init__(**kwargs)
@@ -1443,6 +2879,9 @@ class Implicit3DSeries(SurfaceBaseSeries):
         self.n2 = kwargs.get("n2", 60)
         self.n3 = kwargs.get("n3", 60)
         self.zscale = kwargs.get("zscale", "linear")
+        # maximum number of subdivisions of the cells of the octree, used
+        # when adaptive=True
+        self.depth = kwargs.get("depth", 3)
         self._set_surface_label(label)
 
     def __str__(self):
@@ -1476,24 +2915,174 @@ class Implicit3DSeries(SurfaceBaseSeries):
         mesh_y : np.ndarray [n1 x n2 x n3]
         mesh_z : np.ndarray [n1 x n2 x n3]
         f : np.ndarray [n1 x n2 x n3]
-        """
-        np = import_module('numpy')
-
-        mesh_x, mesh_y, mesh_z = self._discretize(
-            self.start_x, self.end_x,
-            self.start_y, self.end_y,
-            self.start_z, self.end_z)
-        v = uniform_eval([self.var_x, self.var_y, self.var_z], self.expr,
-            mesh_x, mesh_y, mesh_z, modules=self.modules)
-        re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_size(re_v, mesh_x)
-        im_v = self._correct_size(im_v, mesh_x)
-        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
-        return mesh_x, mesh_y, mesh_z, re_v
 
+        If ``adaptive=True``, the sparse block structure computed by
+        ``_adaptive_sampling`` is returned instead.
+        """
+        self._resolve_auto_discretization()
+        if self.adaptive:
+            return self._adaptive_sampling()
+        return self._uniform_sampling()
 
+    def get_mesh(self):
+        """Extract the implicit surface from the data returned by
+        ``get_data`` with a vectorized marching cubes algorithm. The size
+        of the result is proportional to the area of the surface, rather
+        than to the number of discretization points.
 
-class InteractiveSeries(BaseSeries):
+        Returns
+        =======
+        vertices : np.ndarray [V x 3]
+            Coordinates of the vertices of the triangles.
+        faces : np.ndarray [F x 3]
+            Indices of the vertices of each triangle.
+        """
+        np = import_module('numpy')
+        data = self.get_data()
+        if self.adaptive:
+            x, y, z, ijk, values = data
+            if len(ijk) == 0:
+                return np.empty((0, 3)), np.empty((0, 3), dtype=int)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return _cells_to_mesh(x, y, z, ijk, values)
+        mesh_x, mesh_y, mesh_z, v = data
+        return marching_cubes(mesh_x[:, 0, 0], mesh_y[0, :, 0],
+            mesh_z[0, 0, :], v)
+
+    def _real_part(self, v):
+        """Return the real part of the evaluation, setting to NaN the
+        values with a nonzero imaginary part."""
+        np = import_module('numpy')
+        re_v, im_v = np.real(v), np.imag(v)
+        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
+        return re_v
+
+    def _uniform_sampling(self):
+        np = import_module('numpy')
+
+        mesh_x, mesh_y, mesh_z = self._discretize(
+            self.start_x, self.end_x,
+            self.start_y, self.end_y,
+            self.start_z, self.end_z)
+        v = uniform_eval([self.var_x, self.var_y, self.var_z], self.expr,
+            mesh_x, mesh_y, mesh_z, modules=self.modules,
+            timeout=self.timeout, chunk_size=self._chunk_size)
+        re_v = self._real_part(self._correct_size(np.asarray(v), mesh_x))
+        return mesh_x, mesh_y, mesh_z, re_v
+
+    @staticmethod
+    def _may_contain_surface(values):
+        """Return a boolean mask of the cells which might be crossed by
+        the surface: either the sign changes over their corners, or the
+        smallest absolute value is not greater than the variation of the
+        function over the cell.
+        """
+        np = import_module('numpy')
+        flat = values.reshape(len(values), -1)
+        finite = np.isfinite(flat)
+        vmin = np.where(finite, flat, np.inf).min(axis=1)
+        vmax = np.where(finite, flat, -np.inf).max(axis=1)
+        absmin = np.where(finite, np.abs(flat), np.inf).min(axis=1)
+        return finite.any(axis=1) & (absmin <= vmax - vmin)
+
+    def _adaptive_sampling(self):
+        """Evaluate the expression over an octree. Starting from the uniform
+        grid of ``n1, n2, n3`` points, only the cells which might contain
+        the surface are subdivided into eight, up to ``depth`` times. At
+        each level, the new points are evaluated with a single call.
+
+        Returns
+        =======
+        x : np.ndarray [nx]
+        y : np.ndarray [ny]
+        z : np.ndarray [nz]
+            Discretizations of the axis at the finest level, where
+            ``nx = (n1 - 1) * 2**depth + 1``, and so on.
+        ijk : np.ndarray [N x 3]
+            Indices of the cells crossed by the surface: the corners of
+            the cell ``i, j, k`` are ``x[i:i+2], y[j:j+2], z[k:k+2]``.
+        values : np.ndarray [N x 2 x 2 x 2]
+            Values of the expression at the corners of the cells.
+        """
+        np = import_module('numpy')
+
+        depth = self.depth
+        n = np.array([self.n1, self.n2, self.n3])
+        fine = [
+            BaseSeries._discretize(s, e, (m - 1) * 2**depth + 1, scale)
+            for s, e, m, scale in zip(
+                [self.start_x, self.start_y, self.start_z],
+                [self.end_x, self.end_y, self.end_z], n,
+                [self.xscale, self.yscale, self.zscale])]
+        free_symbols = [self.var_x, self.var_y, self.var_z]
+        f1 = lambdify(free_symbols, self.expr, modules=self.modules)
+        f2 = _lazy_lambdify(free_symbols, self.expr, modules="sympy")
+        # the time budget covers all the levels, including the first one
+        deadline = _get_deadline(self.timeout)
+
+        def evaluate(idx, level):
+            # evaluate the expression at the lattice points of a level
+            step = 2 ** (depth - level)
+            args = [fine[a][idx[:, a] * step] for a in range(3)]
+            v = _uniform_eval(f1, f2, *args, modules=self.modules,
+                timeout=self.timeout, chunk_size=self._chunk_size,
+                deadline=deadline)
+            return self._real_part(
+                self._correct_size(np.asarray(v), args[0]))
+
+        # corners of a cell and lattice points of a cell subdivided in eight
+        corners = np.array(np.meshgrid([0, 1], [0, 1], [0, 1],
+            indexing="ij")).reshape(3, -1).T
+        lattice = np.array(np.meshgrid([0, 1, 2], [0, 1, 2], [0, 1, 2],
+            indexing="ij")).reshape(3, -1).T
+        # lattice points which are not corners of the parent cell
+        new = lattice[(lattice % 2).any(axis=1)]
+
+        # level 0: all the cells of the uniform grid
+        idx = np.array(np.meshgrid(*[np.arange(m) for m in n],
+            indexing="ij")).reshape(3, -1).T
+        v = evaluate(idx, 0).reshape(n)
+        ijk = np.array(np.meshgrid(*[np.arange(m - 1) for m in n],
+            indexing="ij")).reshape(3, -1).T
+        values = np.stack([v[tuple((ijk + c).T)] for c in corners],
+            axis=1).reshape(-1, 2, 2, 2)
+
+        level = 0
+        while level < depth:
+            if _deadline_exceeded(deadline):
+                _warn_timeout(self.timeout,
+                    "The adaptive refinement has been stopped with "
+                    "{} levels left: the results might be coarse.".format(
+                        depth - level))
+                break
+            keep = self._may_contain_surface(values)
+            ijk, values = ijk[keep], values[keep]
+            # evaluate the new lattice points only once, even if they are
+            # shared by adjacent cells
+            shape = (n - 1) * 2 ** (level + 1) + 1
+            points = (2 * ijk[:, None, :] + new[None, :, :]).reshape(-1, 3)
+            linear = np.ravel_multi_index(tuple(points.T), shape)
+            unique, inverse = np.unique(linear, return_inverse=True)
+            unique = np.column_stack(np.unravel_index(unique, shape))
+            v = np.empty((len(ijk), 3, 3, 3))
+            v[:, ::2, ::2, ::2] = values
+            v[(slice(None), ) + tuple(new.T)] = evaluate(
+                unique, level + 1)[inverse].reshape(len(ijk), -1)
+            ijk = (2 * ijk[:, None, :] + corners[None, :, :]).reshape(-1, 3)
+            values = np.stack([v[:, a:a+2, b:b+2, c:c+2]
+                for a, b, c in corners], axis=1).reshape(-1, 2, 2, 2)
+            level += 1
+
+        # keep the cells crossed by the surface
+        flat = values.reshape(len(values), -1)
+        crossed = (np.isfinite(flat).all(axis=1) & (flat > 0).any(axis=1)
+            & (flat <= 0).any(axis=1))
+        step = 2 ** (depth - level)
+        x, y, z = [t[::step] for t in fine]
+        return x, y, z, ijk[crossed], values[crossed]
+
+
+class InteractiveSeries(BaseSeries):
     """Base class for interactive series, in which the expressions can be
     either a line, a surface (parametric or not), a vector field, ...
     On top of the usual ranges (x, y or u, v, which must be provided), the
@@ -1510,6 +3099,13 @@ class InteractiveSeries(BaseSeries):
     implemented here.
     """
     is_interactive = True
+    # the number of discretization points is not reduced in order to satisfy
+    # a memory budget.
+    _discretization_attrs = []
+    _functions = None
+    _exprs_to_lambdify = []
+    _ranges = None
+    _ranges_to_discretize = None
 
     def __new__(cls, exprs, ranges, *args, **kwargs):
         nexpr, npar = len(exprs), len(ranges)
@@ -1560,8 +3156,8 @@ class InteractiveSeries(BaseSeries):
         self.n1 = kwargs.get("n1", 250)
         self.n2 = kwargs.get("n2", 250)
         self.n3 = kwargs.get("n3", 250)
-        n = [self.n1, self.n2, self.n3]
         self.modules = kwargs.get("modules", None)
+        self.timeout = kwargs.get("timeout", cfg["evaluation"]["timeout"])
         self.is_polar = kwargs.get("is_polar", False)
         self.xscale = kwargs.get("xscale", "linear")
         self.yscale = kwargs.get("yscale", "linear")
@@ -1589,22 +3185,57 @@ class InteractiveSeries(BaseSeries):
         # NOTE: the expressions must have been sympified earlier.
         self.expr = exprs[0] if len(exprs) == 1 else Tuple(*exprs, sympify=False)
         self.label = label
-        self._latex_label = label if str(self.expr) != label else latex(self.expr)
+        self._latex_label = label if str(self.expr) != label else partial(latex, self.expr)
         self.signature = sorted(self.expr.free_symbols, key=lambda t: t.name)
+        # lambda functions and discretized ranges are created on first use
+        self._exprs_to_lambdify = list(exprs)
+        self._ranges_to_discretize = list(ranges)
 
-        # Generate a list of lambda functions, two for each expression:
-        # 1. the default one.
-        # 2. the backup one, in case of failures with the default one.
-        self.functions = []
-        for e in exprs:
-            self.functions.append([
+    @property
+    def functions(self):
+        """List of lambda functions, two for each expression:
+
+        1. the default one.
+        2. the backup one, in case of failures with the default one. It is
+           only compiled if the default one fails.
+
+        They are generated on first access.
+        """
+        if self._functions is None:
+            self._functions = [[
                 lambdify(self.signature, e, modules=self.modules),
-                lambdify(self.signature, e, modules="sympy"),
-            ])
+                _lazy_lambdify(self.signature, e, modules="sympy")
+            ] for e in self._exprs_to_lambdify]
+        return self._functions
 
-        # Discretize the ranges. In the dictionary self.ranges:
-        #    key: symbol associate to this particular range
-        #    val: the numpy array representing the discretization
+    @functions.setter
+    def functions(self, value):
+        self._functions = value
+
+    @property
+    def ranges(self):
+        """Dictionary of discretized ranges:
+
+        * key: symbol associate to this particular range
+        * val: the numpy array representing the discretization
+
+        The ranges are discretized on first access.
+        """
+        if (self._ranges is None) and (self._ranges_to_discretize is not None):
+            ranges = self._ranges_to_discretize
+            self._ranges_to_discretize = None
+            self._create_discretized_ranges(ranges)
+        return self._ranges
+
+    @ranges.setter
+    def ranges(self, value):
+        self._ranges = value
+        self._ranges_to_discretize = None
+
+    def _create_discretized_ranges(self, ranges):
+        """Discretize the ranges and set the ``ranges`` attribute."""
+        self._resolve_auto_discretization()
+        n = [self.n1, self.n2, self.n3]
         discr_symbols = []
         discretizations = []
         for i, r in enumerate(ranges):
@@ -1636,6 +3267,18 @@ class InteractiveSeries(BaseSeries):
 
         self._set_discretization_ranges(discr_symbols, discretizations)
 
+    @property
+    def _bytes_per_point(self):
+        # discretized ranges, real and imaginary parts of each expression
+        return (8 * len(self.ranges or []) +
+            32 * len(self._exprs_to_lambdify))
+
+    def _get_number_of_points(self):
+        ranges = self.ranges
+        if isinstance(ranges, dict) and (len(ranges) > 0):
+            return list(ranges.values())[0].size
+        return super()._get_number_of_points()
+
     def _set_discretization_ranges(self, discr_symbols, discretizations):
         """Set the discretized ranges that will be used in the numerical
         evaluation.
@@ -1699,24 +3342,33 @@ class InteractiveSeries(BaseSeries):
                 + "Are they ranges or parameters?"
             )
 
-    def _evaluate(self):
+    def _evaluate(self, ranges=None):
         """Evaluate the function based on the current values of the parameters.
+
+        Parameters
+        ==========
+
+        ranges : dict or None
+            Discretized ranges to be used instead of the ``ranges``
+            attribute.
         """
         np = import_module('numpy')
 
+        ranges = self.ranges if ranges is None else ranges
         # discretized ranges all have the same shape. Take the first!
-        discr = list(self.ranges.values())[0]
+        discr = list(ranges.values())[0]
 
         args = []
         for s in self.signature:
             if s in self._params.keys():
                 args.append(self._params[s])
             else:
-                args.append(self.ranges[s])
+                args.append(ranges[s])
 
         results = []
         for f in self.functions:
-            r = _uniform_eval(*f, *args)
+            r = _uniform_eval(*f, *args, modules=self.modules,
+                timeout=self.timeout, chunk_size=self._chunk_size)
             # the evaluation might produce an int/float. Need this correction.
             r = self._correct_size(np.array(r), discr)
             results.append(r)
@@ -1751,6 +3403,31 @@ class LineInteractiveSeries(LineInteractiveBaseSeries, Line2DBaseSeries):
         self.eps = kwargs.get("eps", 0.01)
         self._rendering_kw = kwargs.get("line_kw", dict())
         self.color_func = kwargs.get("color_func", None)
+        self._poles_cache = None
+
+    def _get_poles(self):
+        """Return the singularities of the expression found by SymPy when
+        ``detect_poles="symbolic"``, otherwise None. They are computed once:
+        if they depend on the parameters, None is returned.
+        """
+        if (self.detect_poles != "symbolic") or self.is_complex:
+            return None
+        if self._poles_cache is None:
+            self._poles_cache = (_find_poles(self.expr, self.var,
+                self.start.real, self.end.real), )
+        return self._poles_cache[0]
+
+    def _get_pole_step(self):
+        return (self.end.real - self.start.real) / self.n1
+
+    def _set_discretization_ranges(self, discr_symbols, discretizations):
+        # the samples around the poles are inserted once, so that each
+        # update only requires a few array operations
+        poles = self._get_poles()
+        if (poles is not None) and (not self.only_integers):
+            discretizations = [_insert_pole_samples(discretizations[0],
+                poles, self._get_pole_step())]
+        super()._set_discretization_ranges(discr_symbols, discretizations)
 
     def get_points(self):
         """Return coordinates for plotting the line.
@@ -1772,7 +3449,8 @@ class LineInteractiveSeries(LineInteractiveBaseSeries, Line2DBaseSeries):
         discr = np.real(list(self.ranges.values())[0])
 
         if self.detect_poles:
-            return LineOver1DRangeSeries._detect_poles(discr, _re, self.eps)
+            return LineOver1DRangeSeries._detect_poles(discr, _re, self.eps,
+                self._get_poles(), self._get_pole_step())
 
         return discr, _re
 
@@ -1904,6 +3582,9 @@ class SurfaceInteractiveSeries(InteractiveSeries):
     """Representation for a 3D interactive surface consisting of a sympy
     expression and 2D range."""
     is_3Dsurface = True
+    _data_fields = ["x", "y", "z", "x1d", "y1d"]
+    _default_fields = ["x", "y", "z"]
+    _pixels_per_point = 4
 
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
@@ -1912,11 +3593,20 @@ class SurfaceInteractiveSeries(InteractiveSeries):
         super().__init__(*args, **kwargs)
         self._rendering_kw = kwargs.get("surface_kw", dict())
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _z_color_func)
 
-    def get_data(self):
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "z", "x1d", "y1d"``, where ``"x1d", "y1d"`` are
+            the first row of ``mesh_x`` and the first column of ``mesh_y``,
+            respectively. If None (default), return ``mesh_x, mesh_y, z``.
+
         Returns
         =======
 
@@ -1931,6 +3621,7 @@ class SurfaceInteractiveSeries(InteractiveSeries):
         """
         np = import_module('numpy')
 
+        requested = self._check_fields(fields)
         results = self._evaluate()[0]
         _re, _im = np.real(results), np.imag(results)
         _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
@@ -1940,7 +3631,11 @@ class SurfaceInteractiveSeries(InteractiveSeries):
         if self.is_polar:
             x = r * np.cos(y)
             y = r * np.sin(y)
-        return self._apply_transform(x, y, _re)
+        x, y, z = self._apply_transform(x, y, _re)
+        if fields is None:
+            return x, y, z
+        data = {"x": x, "y": y, "z": z, "x1d": x[0, :], "y1d": y[:, 0]}
+        return tuple(data[f] for f in requested)
 
     def __str__(self):
         return self._str("cartesian surface")
@@ -1949,6 +3644,7 @@ class ContourInteractiveSeries(SurfaceInteractiveSeries):
     """Representation for an interactive contour plot."""
     is_3Dsurface = False
     is_contour = True
+    _pixels_per_point = 2
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1961,10 +3657,12 @@ class ParametricSurfaceInteractiveSeries(SurfaceInteractiveSeries):
     """Representation for a 3D interactive surface consisting of three
     parametric sympy expressions and a range."""
     is_parametric = True
+    _data_fields = []
+    _default_fields = []
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.color_func = kwargs.get("color_func", lambda x, y, z, u, v: z)
+        self.color_func = kwargs.get("color_func", _z_color_func)
 
     def get_data(self):
         """Return arrays of coordinates for plotting.
@@ -2000,11 +3698,29 @@ class ComplexPointSeries(Line2DBaseSeries):
     """Representation for a line in the complex plane consisting of
     list of points."""
 
+    _discretization_attrs = []
+
     def __init__(self, expr, label="", **kwargs):
         self._init_attributes(expr, label, **kwargs)
 
     def _init_attributes(self, expr, label, **kwargs):
-        if isinstance(expr, (list, tuple)):
+        np = import_module('numpy')
+
+        # numerical points provided with NumPy arrays: they are used
+        # without copies
+        self._points = None
+        if isinstance(expr, np.ndarray):
+            self.expr = expr
+            expr = expr.reshape(-1)
+            self._points = (
+                (expr.real, expr.imag) if np.iscomplexobj(expr)
+                else (expr, np.zeros_like(expr, dtype=float)))
+        elif (isinstance(expr, (list, tuple, Tuple)) and (len(expr) == 2)
+            and all(isinstance(e, np.ndarray) for e in expr)):
+            # real and imaginary parts
+            self.expr = tuple(expr)
+            self._points = tuple(e.reshape(-1) for e in expr)
+        elif isinstance(expr, (list, tuple)):
             self.expr = Tuple(*expr)
         elif isinstance(expr, Expr):
             self.expr = Tuple(expr)
@@ -2037,23 +3753,62 @@ class ComplexPointSeries(Line2DBaseSeries):
         y : np.ndarray
             the imaginary part.
         """
+        if self._points is not None:
+            return self._points
         return self._evaluate(self.expr)
 
+    def _str_points(self):
+        if self._points is not None:
+            return "array of %s points" % len(self._points[0])
+        return str(self.expr)
+
     def __str__(self):
-        return "complex points: %s" % self.expr
+        return "complex points: %s" % self._str_points()
 
 
 class ComplexPointInteractiveSeries(LineInteractiveBaseSeries, ComplexPointSeries):
     """Representation for an interactive line in the complex plane
     consisting of list of points."""
 
+    _lambdified_attrs = ["_functions", "_points_func"]
+    _points_func = None
+
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
 
     def __init__(self, expr, label="", **kwargs):
         self._init_attributes(expr, label, **kwargs)
         self._params = kwargs.get("params", dict())
-        self._check_fs(expr, None, label, self._params)
+        if self._points is None:
+            self._check_fs(expr, None, label, self._params)
+            self._split_points()
+
+    def _split_points(self):
+        """Points that don't depend on the parameters are evaluated once,
+        the others are lambdified on first use: parameters updates evaluate
+        all of them with a single function call, instead of substituting the
+        parameters into each point.
+        """
+        np = import_module('numpy')
+
+        keys = set(self._params.keys())
+        self._param_keys = list(self._params.keys())
+        self._dependent = np.array(
+            [len(p.free_symbols.intersection(keys)) > 0 for p in self.expr],
+            dtype=bool)
+        self._values = np.array(
+            [0 if d else complex(p) for p, d in zip(self.expr, self._dependent)],
+            dtype=complex)
+
+    def _get_points_func(self):
+        """Lambdify the points depending on the parameters on first use."""
+        if self._points_func is None:
+            # NOTE: mpmath evaluates real arguments in the complex domain
+            # like evalf does, for example sqrt(-1) = 1j
+            self._points_func = lambdify(self._param_keys,
+                [p for p, d in zip(self.expr, self._dependent) if d],
+                modules="mpmath")
+        return self._points_func
 
     def update_data(self, params):
         self._params = params
@@ -2070,17 +3825,29 @@ class ComplexPointInteractiveSeries(LineInteractiveBaseSeries, ComplexPointSerie
         y : np.ndarray
             the imaginary part.
         """
-        points = Tuple(*[p.evalf(subs=self._params) for p in self.expr])
-        return ComplexPointSeries._evaluate(points)
+        np = import_module('numpy')
+
+        if self._points is not None:
+            return self._points
+        points = self._values.copy()
+        if self._dependent.any():
+            points[self._dependent] = np.array(self._get_points_func()(
+                *[self._params[k] for k in self._param_keys]), dtype=complex)
+        return np.real(points), np.imag(points)
 
     def __str__(self):
         return "interactive complex points: %s with parameters %s" % (
-            self.expr, tuple(self._params.keys()))
+            self._str_points(), tuple(self._params.keys()))
 
 
 class ComplexSurfaceBaseSeries(BaseSeries):
     """Represent a complex function."""
     is_complex = True
+    _discretization_attrs = ["n1", "n2"]
+    # meshes x, y (16) + complex domain (16) + evaluation of the function
+    # (32) + absolute value and argument (16) + arrays returned by
+    # ``get_data`` where the non-finite values are NaN (16)
+    _bytes_per_point = 96
 
     def __new__(cls, *args, **kwargs):
         domain_coloring = kwargs.get("absarg", False)
@@ -2108,12 +3875,13 @@ class ComplexSurfaceBaseSeries(BaseSeries):
 
         self.expr = expr
         self.label = label
-        self._latex_label = label if str(expr) != label else latex(expr)
+        self._latex_label = label if str(expr) != label else partial(latex, expr)
         self.n1 = kwargs.get("n1", 300)
         self.n2 = kwargs.get("n2", 300)
         self.xscale = kwargs.get("xscale", "linear")
         self.yscale = kwargs.get("yscale", "linear")
         self.modules = kwargs.get("modules", None)
+        self.timeout = kwargs.get("timeout", cfg["evaluation"]["timeout"])
         self.only_integers = kwargs.get("only_integers", False)
         self.use_cm = kwargs.get("use_cm", True)
         self.is_polar = kwargs.get("is_polar", False)
@@ -2146,6 +3914,17 @@ class ComplexSurfaceBaseSeries(BaseSeries):
                 str((self.start.imag, self.end.imag)),
             )
 
+    def _get_auto_points(self, pixels):
+        points = super()._get_auto_points(pixels)
+        start, end = getattr(self, "start", None), getattr(self, "end", None)
+        if (not self.is_3D) and (start is not None):
+            # with equal aspect ratio, the image only covers the part of the
+            # plot area having the same aspect ratio of the domain
+            dx, dy = abs(end.real - start.real), abs(end.imag - start.imag)
+            scale = min(pixels[0] / dx, pixels[1] / dy)
+            points["n1"], points["n2"] = dx * scale, dy * scale
+        return points
+
     def _common_eval(self):
         np = import_module('numpy')
 
@@ -2160,7 +3939,8 @@ class ComplexSurfaceBaseSeries(BaseSeries):
         xx, yy = np.meshgrid(x, y)
         domain = xx + 1j * yy
         zz = uniform_eval(self.var, self.expr, domain,
-            modules=self.modules)
+            modules=self.modules, timeout=self.timeout,
+            chunk_size=self._chunk_size)
         zz = self._correct_size(np.array(zz), domain)
         return domain, zz
 
@@ -2172,6 +3952,9 @@ class ComplexSurfaceSeries(ComplexSurfaceBaseSeries):
     is_3Dsurface = True
     is_contour = False
     is_domain_coloring = False
+    _data_fields = ["x", "y", "z"]
+    _default_fields = ["x", "y", "z"]
+    _pixels_per_point = 4
 
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
@@ -2185,20 +3968,33 @@ class ComplexSurfaceSeries(ComplexSurfaceBaseSeries):
         self._init_rendering_kw(**kwargs)
 
     def _init_rendering_kw(self, **kwargs):
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _z_color_func)
         if self.is_3Dsurface:
             self._rendering_kw = kwargs.get("surface_kw", dict())
         else:
             self._rendering_kw = kwargs.get("contour_kw", dict())
 
-    def _correct_output(self, domain, z):
+    def _correct_output(self, domain, z, fields=None):
         np = import_module('numpy')
 
-        return np.real(domain), np.imag(domain), np.real(z)
+        requested = self._check_fields(fields)
+        data = {
+            "x": lambda: np.real(domain),
+            "y": lambda: np.imag(domain),
+            "z": lambda: np.real(z),
+        }
+        return tuple(data[f]() for f in requested)
 
-    def get_data(self):
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "z"``. If None (default), return all of them.
+
         Returns
         =======
 
@@ -2211,8 +4007,9 @@ class ComplexSurfaceSeries(ComplexSurfaceBaseSeries):
         z : np.ndarray [n2 x n1]
             Results of the evaluation.
         """
+        self._resolve_auto_discretization()
         domain, z = self._common_eval()
-        return self._correct_output(domain, z)
+        return self._correct_output(domain, z, fields)
 
 
 class ComplexDomainColoringSeries(ComplexSurfaceBaseSeries):
@@ -2221,6 +4018,17 @@ class ComplexDomainColoringSeries(ComplexSurfaceBaseSeries):
     """
     is_3Dsurface = False
     is_domain_coloring = True
+    # meshes x, y (16) + complex domain and results (32) + absolute value
+    # and argument (16) + HSV and RGB float images (2 * 24) + intermediate
+    # arrays of the coloring algorithm, like lightness and stripes (6 * 8)
+    _bytes_per_point = 160
+    _data_fields = ["x", "y", "abs", "arg", "img", "colors"]
+    _default_fields = _data_fields
+
+    @property
+    def _pixels_per_point(self):
+        # one point per pixel of the image
+        return 4 if self.is_3Dsurface else 1
 
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
@@ -2237,25 +4045,48 @@ class ComplexDomainColoringSeries(ComplexSurfaceBaseSeries):
         else:
             self._rendering_kw = kwargs.get("image_kw", dict())
 
-    def _domain_coloring(self, w):
+    def _domain_coloring(self, w, compute_img=True):
         if isinstance(self.coloring, str):
             from spb.ccomplex.wegert import wegert
             self.coloring = self.coloring.lower()
-            return wegert(self.coloring, w, self.phaseres)
+            return wegert(self.coloring, w, self.phaseres,
+                compute_img=compute_img)
         return self.coloring(w)
 
-    def _correct_output(self, domain, z):
+    def _correct_output(self, domain, z, fields=None):
         np = import_module('numpy')
 
-        return self._apply_transform(
-            np.real(domain), np.imag(domain),
-            np.absolute(z), np.angle(z),
-            *self._domain_coloring(z),
-        )
-
-    def get_data(self):
+        requested = self._check_fields(fields)
+
+        data = {}
+        if "x" in requested:
+            data["x"] = np.real(domain)
+        if "y" in requested:
+            data["y"] = np.imag(domain)
+        if "abs" in requested:
+            data["abs"] = np.absolute(z)
+            if self._tz is not None:
+                data["abs"] = self._tz(data["abs"])
+        if "arg" in requested:
+            data["arg"] = np.angle(z)
+        if ("img" in requested) or ("colors" in requested):
+            data["img"], data["colors"] = self._domain_coloring(z,
+                "img" in requested)
+        return tuple(data[f] for f in requested)
+
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "abs", "arg", "img", "colors"``. Only the
+            requested arrays are computed: for example, the domain coloring
+            image is not computed if ``"img"`` is not requested. If None
+            (default), return all of them.
+
         Returns
         =======
 
@@ -2278,8 +4109,9 @@ class ComplexDomainColoringSeries(ComplexSurfaceBaseSeries):
         colors : np.ndarray [256 x 3]
             Color scale associated to `img`.
         """
+        self._resolve_auto_discretization()
         domain, z = self._common_eval()
-        return self._correct_output(domain, z)
+        return self._correct_output(domain, z, fields)
 
 
 class ComplexInteractiveBaseSeries(InteractiveSeries, ComplexSurfaceBaseSeries):
@@ -2293,20 +4125,17 @@ class ComplexInteractiveBaseSeries(InteractiveSeries, ComplexSurfaceBaseSeries):
         return ComplexSurfaceInteractiveSeries(*args, **kwargs)
 
     def __init__(self, expr, r, label="", **kwargs):
-        np = import_module('numpy')
-
         self._params = kwargs.get("params", dict())
         self._init_attributes(expr, r, label, **kwargs)
         self._check_fs([expr], [r], label, self._params)
 
         self.signature = sorted(self.expr.free_symbols, key=lambda t: t.name)
-        # Two lambda functions:
-        # 1. the default one.
-        # 2. the backup one, in case of failures with the default one.
-        self.functions = [[
-            lambdify(self.signature, self.expr, modules=self.modules),
-            lambdify(self.signature, self.expr, modules="sympy")
-        ]]
+        # lambda functions and discretized domain are created on first use
+        self._exprs_to_lambdify = [self.expr]
+        self._ranges_to_discretize = [r]
+
+    def _create_discretized_ranges(self, ranges):
+        np = import_module('numpy')
 
         x = self._discretize(
             self.start.real, self.end.real, self.n1,
@@ -2350,9 +4179,16 @@ class ComplexSurfaceInteractiveSeries(ComplexInteractiveBaseSeries, ComplexSurfa
             self.is_3Dsurface = False
         self._init_rendering_kw(**kwargs)
 
-    def get_data(self):
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "z"``. If None (default), return all of them.
+
         Returns
         =======
 
@@ -2367,7 +4203,7 @@ class ComplexSurfaceInteractiveSeries(ComplexInteractiveBaseSeries, ComplexSurfa
         """
         domain = list(self.ranges.values())[0]
         results = self._evaluate()[0]
-        return self._correct_output(domain, results)
+        return self._correct_output(domain, results, fields)
 
 
 class ComplexDomainColoringInteractiveSeries(ComplexInteractiveBaseSeries, ComplexDomainColoringSeries):
@@ -2381,9 +4217,18 @@ class ComplexDomainColoringInteractiveSeries(ComplexInteractiveBaseSeries, Compl
         super().__init__(*args, **kwargs)
         self._init_rendering_kw(**kwargs)
 
-    def get_data(self):
+    def get_data(self, fields=None):
         """Return arrays of coordinates for plotting.
 
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "abs", "arg", "img", "colors"``. Only the
+            requested arrays are computed. If None (default), return all of
+            them.
+
         Returns
         =======
 
@@ -2406,15 +4251,9 @@ class ComplexDomainColoringInteractiveSeries(ComplexInteractiveBaseSeries, Compl
         colors : np.ndarray [256 x 3]
             Color scale associated to `img`.
         """
-        np = import_module('numpy')
-
         domain = list(self.ranges.values())[0]
         results = self._evaluate()[0]
-        return self._apply_transform(
-            np.real(domain), np.imag(domain),
-            np.absolute(results), np.angle(results),
-            *self._domain_coloring(results),
-        )
+        return self._correct_output(domain, results, fields)
 
 
 def _set_discretization_points(kwargs, pt):
@@ -2470,7 +4309,7 @@ class VectorBase(BaseSeries):
         self.exprs = exprs
         self.ranges = new_ranges
         self.label = label
-        self._latex_label = label if str(exprs) != label else latex(exprs)
+        self._latex_label = label if str(exprs) != label else partial(latex, exprs)
         self.n1 = kwargs.get("n1", 10)
         self.n2 = kwargs.get("n2", 10)
         self.n3 = kwargs.get("n3", 10)
@@ -2481,6 +4320,7 @@ class VectorBase(BaseSeries):
         self.scales = [self.xscale, self.yscale, self.zscale]
         self.is_streamlines = kwargs.get("streamlines", False)
         self.modules = kwargs.get("modules", None)
+        self.timeout = kwargs.get("timeout", cfg["evaluation"]["timeout"])
         self.only_integers = kwargs.get("only_integers", False)
         self.use_cm = kwargs.get("use_cm", True)
         if self.is_streamlines:
@@ -2500,10 +4340,19 @@ class VectorBase(BaseSeries):
             one_d.append(super()._discretize(r[1], r[2], n, s, self.only_integers))
         return np.meshgrid(*one_d)
 
+    def _reduce_discretization(self, factor):
+        super()._reduce_discretization(factor)
+        self.n = [self.n1, self.n2, self.n3]
+
+    def _set_auto_discretization(self, pixels):
+        super()._set_auto_discretization(pixels)
+        self.n = [self.n1, self.n2, self.n3]
+
     def _eval_component(self, meshes, fs, expr):
         np = import_module('numpy')
 
-        v = uniform_eval(fs, expr, *meshes, modules=self.modules)
+        v = uniform_eval(fs, expr, *meshes, modules=self.modules,
+            timeout=self.timeout, chunk_size=self._chunk_size)
         re_v, im_v = np.real(v), np.imag(v)
         re_v = self._correct_size(re_v, meshes[0])
         im_v = self._correct_size(im_v, meshes[0])
@@ -2547,6 +4396,7 @@ class VectorBase(BaseSeries):
         w : np.ndarray [n2 x n1] (optional)
             Third component of the vector field in the case of Vector3DSeries.
         """
+        self._resolve_auto_discretization()
         meshes = self._discretize()
         free_symbols = [r[0] for r in self.ranges]
         results = []
@@ -2559,6 +4409,17 @@ class Vector2DSeries(VectorBase):
     """Represents a 2D vector field."""
 
     is_2Dvector = True
+    _discretization_attrs = ["n1", "n2"]
+    # meshes x, y (16) + evaluation of the two components (2 * 32) + arrays
+    # returned by ``get_data``: x, y, u, v (32)
+    _bytes_per_point = 112
+    # quivers are spaced apart in order to be readable
+    _pixels_per_point = 25
+    # number of discretization points of the grid that this series shares
+    # with a scalar field (see VectorScalarSeries), and the last evaluation
+    # over a grid.
+    _shared_n = None
+    _grid_cache = None
 
     def __init__(self, u, v, range1, range2, label="", **kwargs):
         kwargs.setdefault("n1", 25)
@@ -2585,12 +4446,267 @@ class Vector2DSeries(VectorBase):
         return "2D vector series: [%s, %s] over %s, %s" % (
             *self.exprs, *self.ranges)
 
+    @staticmethod
+    def _grid_stride(N, n):
+        """Return the stride to be used to extract ``n`` points from a
+        discretization of ``N`` points over the same interval, or None if
+        the ``n`` points are not a subset of the ``N`` points.
+        """
+        if (n < 2) or (N < n) or ((N - 1) % (n - 1) != 0):
+            return None
+        return (N - 1) // (n - 1)
+
+    def _shared_strides(self):
+        """Return the strides to be used along x and y to extract the
+        quivers from the grid shared with a scalar field, or None if this
+        series doesn't share its grid.
+        """
+        if (self._shared_n is None) or self.only_integers:
+            return None
+        strides = [self._grid_stride(N, n) for N, n in
+            zip(self._shared_n, [self.n1, self.n2])]
+        if any(s is None for s in strides):
+            return None
+        return strides
+
+    def _grid_key(self, n1, n2):
+        return (n1, n2, tuple(self.ranges), self.xscale, self.yscale,
+            self.only_integers, tuple(self.exprs), str(self.modules))
+
+    def _grid_discretization(self, n1, n2):
+        (_, sx, ex), (_, sy, ey) = self.ranges
+        x = BaseSeries._discretize(sx, ex, n1, self.xscale,
+            self.only_integers)
+        y = BaseSeries._discretize(sy, ey, n2, self.yscale,
+            self.only_integers)
+        return x, y
+
+    def _evaluate_components(self, x, y):
+        """Evaluate the components of the vector field over the grid
+        generated by the 1D discretizations ``x, y``.
+        """
+        meshes = import_module('numpy').meshgrid(x, y)
+        fs = [r[0] for r in self.ranges]
+        return [self._eval_component(meshes, fs, e) for e in self.exprs]
+
+    def _evaluate_grid(self, n1, n2):
+        """Evaluate the vector field over a grid of ``n2 x n1`` points.
+        The last evaluation is cached, so that the vector series and the
+        scalar field sharing its grid don't evaluate it twice.
+
+        Returns
+        =======
+
+        x : np.ndarray [n1]
+            Discretization along the x-direction.
+
+        y : np.ndarray [n2]
+            Discretization along the y-direction.
+
+        u : np.ndarray [n2 x n1]
+            First component of the vector field.
+
+        v : np.ndarray [n2 x n1]
+            Second component of the vector field.
+        """
+        key = self._grid_key(n1, n2)
+        if (self._grid_cache is not None) and (self._grid_cache[0] == key):
+            return self._grid_cache[1]
+
+        x, y = self._grid_discretization(n1, n2)
+        data = (x, y, *self._evaluate_components(x, y))
+        self._grid_cache = (key, data)
+        return data
+
+    def _get_strided_data(self, s1, s2):
+        np = import_module('numpy')
+
+        x, y, u, v = self._evaluate_grid(*self._shared_n)
+        x, y = np.meshgrid(x[::s1], y[::s2])
+        return self._apply_transform(x, y, u[::s2, ::s1], v[::s2, ::s1])
+
+    def get_data(self):
+        """Return arrays of coordinates for plotting. If a scalar field
+        shares its grid with this series, the quivers are located on a
+        strided subset of that grid and the vector field is evaluated only
+        once.
+
+        Returns
+        =======
+
+        mesh_x : np.ndarray [n2 x n1]
+            Discretized x-domain.
+
+        mesh_y : np.ndarray [n2 x n1]
+            Discretized y-domain.
+
+        u : np.ndarray [n2 x n1]
+            First component of the vector field.
+
+        v : np.ndarray [n2 x n1]
+            Second component of the vector field.
+        """
+        self._resolve_auto_discretization()
+        strides = self._shared_strides()
+        if strides is None:
+            return super().get_data()
+        return self._get_strided_data(*strides)
+
+
+class ComplexVector2DSeries(Vector2DSeries):
+    """Represents the 2D vector field ``[re(f), im(f)]`` of a complex
+    function ``f``.
+
+    Instead of rewriting ``f`` in terms of two real variables, the function
+    is evaluated once over the complex domain ``x + 1j * y``: the components
+    of the vector field are the real and imaginary parts of the results.
+    """
+
+    def __init__(self, expr, r, label="", **kwargs):
+        self.expr = sympify(expr)
+        self.var = sympify(r[0])
+        fs = self.expr.free_symbols.difference([self.var])
+        if len(fs) > 0:
+            raise ValueError(
+                "Too many free symbols. The complex function must only "
+                + "depend on {}, interactive complex ".format(self.var)
+                + "vector fields are not supported. Received the following "
+                + "additional symbols: {}".format(fs)
+            )
+        self.start = complex(r[1])
+        self.end = complex(r[2])
+        kwargs.setdefault("n1", 25)
+        kwargs.setdefault("n2", 25)
+        ranges = [
+            (re(self.var), self.start.real, self.end.real),
+            (im(self.var), self.start.imag, self.end.imag)
+        ]
+        VectorBase.__init__(self, (self.expr, ), ranges, label, **kwargs)
+        self._latex_label = (label if str(self.expr) != label
+            else partial(latex, self.expr))
+        self._set_use_quiver_solid_color(**kwargs)
+
+    def __str__(self):
+        return "complex 2D vector series: [re(%s), im(%s)] over %s, %s" % (
+            self.expr, self.expr, *self.ranges)
+
+    def get_expr(self):
+        return self.expr
+
+    def _evaluate_components(self, x, y):
+        """Evaluate the complex function over the complex domain generated
+        by the 1D discretizations ``x, y``: return its real and imaginary
+        parts.
+        """
+        np = import_module('numpy')
+
+        domain = x[None, :] + 1j * y[:, None]
+        w = uniform_eval(self.var, self.expr, domain, modules=self.modules,
+            timeout=self.timeout, chunk_size=self._chunk_size)
+        w = self._correct_size(np.array(w), domain)
+        return [np.real(w), np.imag(w)]
+
+    def get_data(self):
+        """Return arrays of coordinates for plotting. If a scalar field
+        shares its grid with this series, the quivers are located on a
+        strided subset of that grid and no new evaluation is performed.
+
+        Returns
+        =======
+
+        mesh_x : np.ndarray [n2 x n1]
+            Discretized real part of the domain.
+
+        mesh_y : np.ndarray [n2 x n1]
+            Discretized imaginary part of the domain.
+
+        u : np.ndarray [n2 x n1]
+            Real part of the complex function.
+
+        v : np.ndarray [n2 x n1]
+            Imaginary part of the complex function.
+        """
+        np = import_module('numpy')
+
+        self._resolve_auto_discretization()
+        strides = self._shared_strides()
+        if strides is not None:
+            return self._get_strided_data(*strides)
+        x, y, u, v = self._evaluate_grid(self.n1, self.n2)
+        x, y = np.meshgrid(x, y)
+        return self._apply_transform(x, y, u, v)
+
+
+def _shared_grid_points(N, n):
+    """Return the number of points closest to ``N`` such that a
+    discretization of ``n`` points is a strided subset of it.
+    """
+    if n < 2:
+        return N
+    return max(1, int(round((N - 1) / (n - 1)))) * (n - 1) + 1
+
+
+class VectorScalarSeries(ContourSeries):
+    """Represents a scalar field computed from the components of a 2D vector
+    field: its magnitude (``kind="abs"``) or its angle with respect to the
+    x-axis (``kind="arg"``).
+
+    The number of discretization points is adjusted so that the grid of the
+    vector series is a strided subset of the grid of this series: the
+    vector field is evaluated only once, over the finer grid.
+    """
+
+    def __init__(self, vector, expr, label="", kind="abs", **kwargs):
+        if kind not in ["abs", "arg"]:
+            raise ValueError(
+                "`kind` must be either 'abs' or 'arg'. "
+                "Received: %s" % kind)
+        kwargs["adaptive"] = False
+        kwargs["xscale"] = vector.xscale
+        kwargs["yscale"] = vector.yscale
+        kwargs["only_integers"] = vector.only_integers
+        super().__init__(expr, *vector.ranges, label, **kwargs)
+        self.kind = kind
+        self._vector = vector
+        self._share_grid()
+
+    def _share_grid(self):
+        """Adjust the number of discretization points so that the grid of
+        the vector series is a strided subset of the grid of this series.
+        """
+        v = self._vector
+        if any(isinstance(n, str) for n in [self.n1, self.n2, v.n1, v.n2]):
+            # n="auto": the grid is going to be shared once the number of
+            # discretization points is known.
+            return
+        self.n1 = _shared_grid_points(self.n1, v.n1)
+        self.n2 = _shared_grid_points(self.n2, v.n2)
+        v._shared_n = (self.n1, self.n2)
+
+    def _set_auto_discretization(self, pixels):
+        self._vector._set_auto_discretization(pixels)
+        BaseSeries._set_auto_discretization(self, pixels)
+        self._share_grid()
+
+    def _uniform_sampling(self):
+        np = import_module('numpy')
+
+        x, y, u, v = self._vector._evaluate_grid(self.n1, self.n2)
+        if self.kind == "arg":
+            return x, y, np.arctan2(v, u)
+        return x, y, np.hypot(u, v)
+
 
 class Vector3DSeries(VectorBase):
     """Represents a 3D vector field."""
 
     is_3D = True
     is_3Dvector = True
+    _discretization_attrs = ["n1", "n2", "n3"]
+    # meshes x, y, z (24) + evaluation of the three components (3 * 32) +
+    # arrays returned by ``get_data``: x, y, z, u, v, w (48)
+    _bytes_per_point = 168
+    _pixels_per_point = 48
 
     def __init__(self, u, v, z, range1, range2, range3, label="", **kwargs):
         super().__init__((u, v, z), (range1, range2, range3), label, **kwargs)
@@ -2639,9 +4755,109 @@ class VectorInteractiveBaseSeries(InteractiveSeries):
 
 class Vector2DInteractiveSeries(VectorInteractiveBaseSeries, Vector2DSeries):
     """Represents an interactive 2D vector field."""
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, exprs, ranges, label="", **kwargs):
+        super().__init__(exprs, ranges, label, **kwargs)
         self._set_use_quiver_solid_color(**kwargs)
+        # the ranges, to be discretized with a different number of points
+        # when the grid is shared with a scalar field
+        self._grid_ranges = [(r[0], float(r[1]), float(r[2])) for r in ranges]
+
+    def _grid_key(self, n1, n2):
+        return (n1, n2, tuple(self._grid_ranges), self.xscale, self.yscale,
+            self.only_integers, self.expr, str(self.modules),
+            tuple((k, str(v)) for k, v in self._params.items()))
+
+    def _grid_discretization(self, n1, n2):
+        (_, sx, ex), (_, sy, ey) = self._grid_ranges
+        x = BaseSeries._discretize(sx, ex, n1, self.xscale,
+            self.only_integers)
+        y = BaseSeries._discretize(sy, ey, n2, self.yscale,
+            self.only_integers)
+        return x, y
+
+    def _evaluate_components(self, x, y):
+        np = import_module('numpy')
+
+        meshes = np.meshgrid(x, y)
+        ranges = {r[0]: m for r, m in zip(self._grid_ranges, meshes)}
+        results = self._evaluate(ranges)
+        for i, r in enumerate(results):
+            re_v, im_v = np.real(r), np.imag(r)
+            re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
+            results[i] = re_v
+        return results
+
+    def get_data(self):
+        self._resolve_auto_discretization()
+        strides = self._shared_strides()
+        if strides is None:
+            return super().get_data()
+        return self._get_strided_data(*strides)
+
+
+class VectorScalarInteractiveSeries(ContourInteractiveSeries):
+    """Represents an interactive scalar field computed from the components
+    of a 2D interactive vector field. See ``VectorScalarSeries``.
+    """
+
+    def __init__(self, vector, expr, label="", kind="abs", **kwargs):
+        if kind not in ["abs", "arg"]:
+            raise ValueError(
+                "`kind` must be either 'abs' or 'arg'. "
+                "Received: %s" % kind)
+        kwargs["xscale"] = vector.xscale
+        kwargs["yscale"] = vector.yscale
+        kwargs["only_integers"] = vector.only_integers
+        super().__init__([expr], vector._grid_ranges, label, **kwargs)
+        self.kind = kind
+        self._vector = vector
+        self._share_grid()
+
+    def _share_grid(self):
+        VectorScalarSeries._share_grid(self)
+
+    def _set_auto_discretization(self, pixels):
+        VectorScalarSeries._set_auto_discretization(self, pixels)
+
+    @property
+    def params(self):
+        """Get or set the current parameters dictionary.
+
+        Parameters
+        ==========
+
+        p : dict
+            key: symbol associated to the parameter
+            val: the value
+        """
+        return self._params
+
+    @params.setter
+    def params(self, p):
+        self._params = p
+        # the vector series might be updated after this series
+        self._vector.params = p
+
+    def get_data(self, fields=None):
+        """Return arrays of coordinates for plotting.
+
+        Parameters
+        ==========
+
+        fields : tuple or None
+            The names of the arrays to be returned, in order. Possible values
+            are ``"x", "y", "z", "x1d", "y1d"``. If None (default), return
+            ``mesh_x, mesh_y, z``.
+        """
+        np = import_module('numpy')
+
+        self._resolve_auto_discretization()
+        requested = self._check_fields(fields)
+        x, y, z = VectorScalarSeries._uniform_sampling(self)
+        x, y = np.meshgrid(x, y)
+        x, y, z = self._apply_transform(x, y, z)
+        data = {"x": x, "y": y, "z": z, "x1d": x[0, :], "y1d": y[:, 0]}
+        return tuple(data[f] for f in requested)
 
 class Vector3DInteractiveSeries(VectorInteractiveBaseSeries, Vector3DSeries):
     """Represents an interactive 3D vector field."""
@@ -2768,6 +4984,8 @@ class PlaneSeries(SurfaceBaseSeries):
     """Represents a plane in a 3D domain."""
 
     is_3Dsurface = True
+    _lambdified_attrs = ["_functions", "_plane_func"]
+    _plane_func = None
 
     def __init__(
         self, plane, x_range, y_range, z_range=None, label="", params=dict(), **kwargs
@@ -2788,7 +5006,17 @@ class PlaneSeries(SurfaceBaseSeries):
         self._rendering_kw = kwargs.get("line_kw", dict())
         self.use_cm = kwargs.get("use_cm", True)
         self._set_surface_label(label)
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _z_color_func)
+        self._param_keys = list(params.keys())
+
+    def _get_plane_func(self):
+        """The normal vector and a point of the plane are lambdified on
+        first use: parameters updates only need to evaluate them.
+        """
+        if self._plane_func is None:
+            self._plane_func = lambdify(self._param_keys,
+                [*self.plane.normal_vector, *self.plane.p1])
+        return self._plane_func
 
     def __str__(self):
         return "plane series: %s over %s, %s, %s" % (
@@ -2801,55 +5029,29 @@ class PlaneSeries(SurfaceBaseSeries):
     def get_data(self):
         np = import_module('numpy')
 
-        x, y, z = symbols("x, y, z")
-        plane = self.plane.subs(self._params)
-        fs = plane.equation(x, y, z).free_symbols
-        xx, yy, zz = None, None, None
-        if fs == set([x]):
+        self._resolve_auto_discretization()
+        a, b, c, x0, y0, z0 = [float(t) for t in self._get_plane_func()(
+            *[self._params[k] for k in self._param_keys])]
+        discr = lambda r, n, scale: BaseSeries._discretize(
+            float(r[1]), float(r[2]), n, scale)
+        if (b == 0) and (c == 0):
             # parallel to yz plane (normal vector (1, 0, 0))
-            s = SurfaceOver2DRangeSeries(
-                plane.p1[0],
-                (x, *self.z_range[1:]),
-                (y, *self.y_range[1:]),
-                "",
-                n1=self.n3,
-                n2=self.n2,
-                xscale=self.xscale,
-                yscale=self.yscale
-            )
-            xx, yy, zz = s.get_data()
-            xx, yy, zz = zz, yy, xx
-        elif fs == set([y]):
+            zz, yy = np.meshgrid(discr(self.z_range, self.n3, self.xscale),
+                discr(self.y_range, self.n2, self.yscale))
+            xx = x0 * np.ones_like(zz)
+        elif (a == 0) and (c == 0):
             # parallel to xz plane (normal vector (0, 1, 0))
-            s = SurfaceOver2DRangeSeries(
-                plane.p1[1],
-                (x, *self.x_range[1:]),
-                (y, *self.z_range[1:]),
-                "",
-                n1=self.n1,
-                n2=self.n3,
-                xscale=self.xscale,
-                yscale=self.yscale
-            )
-            xx, yy, zz = s.get_data()
-            xx, yy, zz = xx, zz, yy
+            xx, zz = np.meshgrid(discr(self.x_range, self.n1, self.xscale),
+                discr(self.z_range, self.n3, self.yscale))
+            yy = y0 * np.ones_like(xx)
         else:
             # parallel to xy plane, or any other plane
-            eq = plane.equation(x, y, z)
-            if z in eq.free_symbols:
-                eq = solve(eq, z)[0]
-            s = SurfaceOver2DRangeSeries(
-                eq,
-                (x, *self.x_range[1:]),
-                (y, *self.y_range[1:]),
-                "",
-                n1=self.n1,
-                n2=self.n2,
-                xscale=self.xscale,
-                yscale=self.yscale
-            )
-            xx, yy, zz = s.get_data()
-            if len(fs) > 1:
+            xx, yy = np.meshgrid(discr(self.x_range, self.n1, self.xscale),
+                discr(self.y_range, self.n2, self.yscale))
+            zz = a * (xx - x0) + b * (yy - y0)
+            if c != 0:
+                zz = z0 - zz / c
+            if (a != 0) or (b != 0):
                 idx = np.logical_or(zz < self.z_range[1], zz > self.z_range[2])
                 zz[idx] = np.nan
         return xx, yy, zz
@@ -2883,6 +5085,8 @@ class GeometrySeries(BaseSeries):
     """
 
     is_geometry = True
+    _lambdified_attrs = ["_functions", "_geometry_func"]
+    _geometry_func = None
 
     def __new__(cls, *args, **kwargs):
         if isinstance(args[0], Plane):
@@ -2916,7 +5120,7 @@ class GeometrySeries(BaseSeries):
         self.expr = expr
         self._range = _range
         self.label = label
-        self._latex_label = label if label != str(expr) else latex(expr)
+        self._latex_label = label if label != str(expr) else partial(latex, expr)
         self._params = params
         self.is_filled = kwargs.get("is_filled", True)
         self.n = kwargs.get("n", 200)
@@ -2938,38 +5142,71 @@ class GeometrySeries(BaseSeries):
             self.is_point = True
             self.is_2Dline = True
         self._rendering_kw = kwargs.get("fill_kw", dict())
+        self._param_keys = list(params.keys())
+
+    def _get_geometry_func(self):
+        """The symbolic quantities describing the entity are lambdified on
+        first use, so that parameters updates don't need to rebuild the
+        entity. Return False if the structure of the entity depends on the
+        parameters, for example the number of sides of a regular polygon.
+        """
+        if self._geometry_func is None:
+            try:
+                self._geometry_func = lambdify(
+                    self._param_keys, self._get_geometry_values(self.expr))
+            except TypeError:
+                self._geometry_func = False
+        return self._geometry_func
+
+    def _get_geometry_values(self, expr):
+        """Return the list of symbolic quantities (coordinates, radius,
+        eccentricity, ...) which are needed to compute the numerical data
+        of the geometric entity.
+        """
+        if isinstance(expr, (Point2D, Point3D)):
+            return list(expr.args)
+        elif isinstance(expr, Polygon):
+            return [c for v in expr.vertices for c in v.args]
+        elif isinstance(expr, Circle):
+            return [*expr.center.args, expr.radius]
+        elif isinstance(expr, Ellipse):
+            return [*expr.center.args, expr.hradius, expr.eccentricity]
+        elif (isinstance(expr, (LinearEntity3D, Segment, Ray)) or
+            (self._range is None)):
+            return [c for p in expr.points for c in p.args]
+        # Line over a range
+        p1 = expr.points[0]
+        m = expr.slope
+        return [m, p1[1] - m * p1[0]]
 
     def get_data(self):
         np = import_module('numpy')
 
-        expr = self.expr.subs(self._params)
+        self._resolve_auto_discretization()
+        f = self._get_geometry_func()
+        if f:
+            expr = self.expr
+            v = f(*[self._params[k] for k in self._param_keys])
+        else:
+            expr = self.expr.subs(self._params)
+            v = self._get_geometry_values(expr)
+        v = np.array(v, dtype=float)
         if isinstance(expr, Point3D):
-            return (
-                np.array([expr.x], dtype=float),
-                np.array([expr.y], dtype=float),
-                np.array([expr.z], dtype=float),
-                np.array([0], dtype=float),
-            )
+            return v[:1], v[1:2], v[2:], np.array([0], dtype=float)
         elif isinstance(expr, Point2D):
-            return np.array([expr.x], dtype=float), np.array([expr.y], dtype=float)
+            return v[:1], v[1:]
         elif isinstance(expr, Polygon):
-            x = [float(v.x) for v in expr.vertices]
-            y = [float(v.y) for v in expr.vertices]
-            x.append(x[0])
-            y.append(y[0])
-            return np.array(x), np.array(y)
+            x, y = v[::2], v[1::2]
+            return np.append(x, x[0]), np.append(y, y[0])
         elif isinstance(expr, Circle):
-            cx, cy = float(expr.center[0]), float(expr.center[1])
-            r = float(expr.radius)
+            cx, cy, r = v
             t = np.linspace(0, 2 * np.pi, self.n)
             x, y = cx + r * np.cos(t), cy + r * np.sin(t)
             x = np.append(x, x[0])
             y = np.append(y, y[0])
             return x, y
         elif isinstance(expr, Ellipse):
-            cx, cy = float(expr.center[0]), float(expr.center[1])
-            a = float(expr.hradius)
-            e = float(expr.eccentricity)
+            cx, cy, a, e = v
             x = np.linspace(-a, a, self.n)
             y = np.sqrt((a ** 2 - x ** 2) * (1 - e ** 2))
             x += cx
@@ -2978,28 +5215,14 @@ class GeometrySeries(BaseSeries):
             y = np.append(y, y[0])
             return x, y
         elif isinstance(expr, LinearEntity3D):
-            p1, p2 = expr.points
-            x = np.array([p1.x, p2.x], dtype=float)
-            y = np.array([p1.y, p2.y], dtype=float)
-            z = np.array([p1.z, p2.z], dtype=float)
-            param = np.zeros_like(x)
-            return x, y, z, param
-        elif isinstance(expr, (Segment, Ray)):
-            p1, p2 = expr.points
-            x = np.array([p1.x, p2.x])
-            y = np.array([p1.y, p2.y])
-            return x.astype(float), y.astype(float)
-        else:  # Line
-            p1, p2 = expr.points
-            if self._range is None:
-                x = np.array([p1.x, p2.x])
-                y = np.array([p1.y, p2.y])
-            else:
-                m = expr.slope
-                q = p1[1] - m * p1[0]
-                x = np.array([self._range[1], self._range[2]])
-                y = m * x + q
-            return x.astype(float), y.astype(float)
+            x, y, z = v[::3], v[1::3], v[2::3]
+            return x, y, z, np.zeros_like(x)
+        elif isinstance(expr, (Segment, Ray)) or (self._range is None):
+            return v[::2], v[1::2]
+        # Line over a range
+        m, q = v
+        x = np.array([self._range[1], self._range[2]], dtype=float)
+        return x, m * x + q
 
     def __str__(self):
         return "geometry entity: %s" % str(self.expr)
@@ -3026,3 +5249,113 @@ class GeometryInteractiveSeries(GeometrySeries, InteractiveSeries):
     def __str__(self):
         s = super().__str__()
         return "interactive " + s + " with parameters " + str(tuple(self._params.keys()))
+
+
+class GeometryCollectionSeries(BaseSeries):
+    """Represents an homogeneous collection of entities from the
+    sympy.geometry module (2D or 3D points, 2D segments or polygons),
+    which is rendered by a single artist.
+
+    The coordinates of all the entities are extracted at once into arrays
+    where consecutive segments or polygons are separated by NaN values.
+    """
+
+    is_geometry = True
+    _lambdified_attrs = ["_functions", "_coords_func"]
+    _coords_func = None
+
+    def __init__(self, exprs, label="", params=dict(), **kwargs):
+        np = import_module('numpy')
+
+        exprs = list(exprs)
+        if len(exprs) == 0:
+            raise ValueError("The collection must contain at least one entity.")
+        kinds = (Point3D, Point2D, Segment2D, Polygon)
+        kind = [k for k in kinds if isinstance(exprs[0], k)]
+        if (len(kind) == 0) or (not all(isinstance(e, kind[0]) for e in exprs)):
+            raise ValueError(
+                "`exprs` must be an homogeneous collection of Point2D, "
+                + "Point3D, Segment2D or Polygon. Received types: "
+                + "{}".format(set(type(e).__name__ for e in exprs))
+            )
+        self._kind = kind[0]
+
+        free_symbols = set().union(*[e.free_symbols for e in exprs])
+        r = free_symbols.difference(set(params.keys()))
+        if len(r) > 0:
+            raise ValueError(
+                "Too many free symbols. Please, specify the values of the "
+                + "following symbols with the `params` dictionary: {}".format(r)
+            )
+
+        self.expr = exprs
+        self.label = label if label else str(self)
+        self._latex_label = self.label
+        self._params = params
+        self.is_filled = kwargs.get("is_filled", True)
+        self.use_cm = False
+        self.color_func = None
+        if self._kind is Point3D:
+            self.is_3Dline = True
+            self.is_point = True
+            self.start = 0
+            self.end = 0
+            self._rendering_kw = kwargs.get("line_kw", dict())
+        elif self._kind is Point2D:
+            self.is_2Dline = True
+            self.is_point = True
+            self._rendering_kw = kwargs.get("line_kw", dict())
+        elif (self._kind is Segment2D) or (not self.is_filled):
+            self.is_2Dline = True
+            self._rendering_kw = kwargs.get("line_kw", dict())
+        else:
+            self._rendering_kw = kwargs.get("fill_kw", dict())
+        self._param_keys = list(self._params.keys())
+        # without parameters, the coordinates are evaluated once
+        self._coords = (np.array(self._pack_coordinates(), dtype=float)
+            if len(free_symbols) == 0 else None)
+
+    def _pack_coordinates(self):
+        """Flatten the coordinates of all entities into a single list of
+        symbolic values.
+        """
+        if self._kind in (Point2D, Point3D):
+            return [c for e in self.expr for c in e.args]
+        flat = []
+        for e in self.expr:
+            points = (e.points if self._kind is Segment2D
+                else list(e.vertices) + [e.vertices[0]])
+            flat.extend(c for p in points for c in p.args)
+            flat.extend([S.NaN, S.NaN])
+        return flat[:-2]
+
+    def _get_coords_func(self):
+        """Lambdify the coordinates on first use."""
+        if self._coords_func is None:
+            self._coords_func = lambdify(self._param_keys,
+                self._pack_coordinates())
+        return self._coords_func
+
+    def get_data(self):
+        np = import_module('numpy')
+
+        if self._coords is not None:
+            coords = self._coords
+        else:
+            coords = np.array(self._get_coords_func()(
+                *[self._params[k] for k in self._param_keys]), dtype=float)
+        if self.is_3Dline:
+            coords = coords.reshape(-1, 3)
+            return (coords[:, 0], coords[:, 1], coords[:, 2],
+                np.zeros(len(coords)))
+        coords = coords.reshape(-1, 2)
+        return coords[:, 0], coords[:, 1]
+
+    def get_label(self, use_latex=False, wrapper="$%s$"):
+        # NOTE: the label is never the representation of the collection,
+        # which would be expensive to compute for thousands of entities.
+        return self.label
+
+    def __str__(self):
+        return "geometry collection of %s %s" % (
+            len(self.expr), self._kind.__name__)
@@ -219,15 +219,18 @@ def _plot_sympify(args):
     This function recursively loop over the arguments passed to the plot
     functions: the sympify function will be applied to all arguments except
     those of type string.
+    NumPy arrays are left untouched: they represent numerical data that
+    must be used without conversions.
     """
-    if isinstance(args, Expr):
+    np = import_module('numpy')
+    if isinstance(args, (Expr, np.ndarray)):
         return args
 
     args = list(args)
     for i, a in enumerate(args):
         if isinstance(a, (list, tuple)):
             args[i] = Tuple(*_plot_sympify(a), sympify=False)
-        elif not isinstance(a, str):
+        elif not isinstance(a, (str, np.ndarray)):
             args[i] = sympify(a)
     if isinstance(args, tuple):
         return Tuple(*args, sympify=False)
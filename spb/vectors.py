@@ -4,6 +4,8 @@ from spb.series import (
     Vector2DSeries,
     Vector3DSeries,
     ContourSeries,
+    VectorScalarSeries,
+    VectorScalarInteractiveSeries,
     SliceVector3DSeries,
     _set_discretization_points,
     InteractiveSeries
@@ -85,7 +87,14 @@ def _build_series(*args, interactive=False, **kwargs):
             cs_kwargs = kwargs.copy()
             cs_kwargs["n1"] = nc
             cs_kwargs["n2"] = nc
-            if not interactive:
+            if (len(series) == 1) and (scalar is True):
+                # the magnitude is computed from the components of the
+                # vector field, which is evaluated only once over a grid
+                # shared by the two series.
+                cls = (VectorScalarSeries if not interactive
+                    else VectorScalarInteractiveSeries)
+                cs = cls(series[0], scalar_field, scalar_label, **cs_kwargs)
+            elif not interactive:
                 cs = ContourSeries(scalar_field, *cranges, scalar_label, **cs_kwargs)
             else:
                 cs = InteractiveSeries(
@@ -313,14 +322,19 @@ def plot_vector(*args, show=True, **kwargs):
         Number of discretization points for the quivers or streamlines in the
         x/y/z-direction, respectively. Default to 25.
 
-    n : int
+    n : int or "auto"
         Set the same number of discretization points in all directions for
         the quivers or streamlines. It overrides `n1`, `n2`, `n3`.
         Default to 25.
+        If `"auto"`, it is computed from the size of the plot, in
+        pixels.
 
     nc : int
         Number of discretization points for the scalar contour plot.
-        Default to 100.
+        Default to 100. When the scalar field is the magnitude of a single
+        vector field, this number is slightly adjusted so that the quivers
+        lie on a subset of the contour's grid: the vector field is then
+        evaluated only once.
 
     quiver_kw : dict
         A dictionary of keywords/values which is passed to the backend quivers-
@@ -54,7 +54,7 @@ k3d = import_module(
     catch=(RuntimeError,))
 bokeh = import_module(
     'bokeh',
-    import_kwargs={'fromlist': ['models', 'resources', 'plotting']},
+    import_kwargs={'fromlist': ['models', 'resources', 'plotting', 'embed']},
     min_module_version='2.3.0',
     catch=(RuntimeError,))
 unset_show()
@@ -1121,8 +1121,11 @@ def test_plot_implicit_adaptive_true():
     assert len(p.series) == 1
     f = p.fig
     ax = f.axes[0]
-    assert len(ax.collections) == 0
-    assert len(ax.patches) == 1
+    # all the rectangles are drawn as a single collection
+    assert len(ax.collections) == 1
+    assert isinstance(ax.collections[0],
+        matplotlib.collections.PolyCollection)
+    assert len(ax.patches) == 0
     p.close()
 
     # PlotlyBackend doesn't support 2D plots
@@ -1178,6 +1181,36 @@ def test_plot_implicit_adaptive_false():
         lambda: _plot_implicit(KBchild1, contour_kw=dict()).process_series())
 
 
+def test_plot_implicit_equality():
+    # verify that the level curve of an equality is drawn as an ordinary
+    # line by all the 2D backends
+
+    x, y = symbols("x, y")
+
+    _plot_implicit = lambda B: plot_implicit(
+        Eq(x**2 + y**2, 4), (x, -5, 5), (y, -4, 4), n=100,
+        backend=B, show=False, use_latex=False
+    )
+
+    p = _plot_implicit(MB)
+    ax = p.fig.axes[0]
+    assert len(ax.lines) == 1
+    assert len(ax.collections) == 0
+    xc, yc = ax.lines[0].get_data()
+    assert np.allclose(np.hypot(xc, yc), 2, atol=1e-2)
+    p.close()
+
+    p = _plot_implicit(PB)
+    assert len(p.fig.data) == 1
+    assert p.fig.data[0]["mode"] == "lines"
+    assert np.allclose(np.hypot(p.fig.data[0]["x"], p.fig.data[0]["y"]), 2,
+        atol=1e-2)
+
+    p = _plot_implicit(BB)
+    assert len(p.fig.renderers) == 1
+    assert isinstance(p.fig.renderers[0].glyph, bokeh.models.glyphs.Line)
+
+
 def test_plot_real_imag():
     # verify that the backends produce the expected results when
     # `plot_real_imag()` is called and `line_kw` overrides the default
@@ -1440,6 +1473,69 @@ def test_plot_list_is_filled_true():
         lambda: _plot_list(KBchild1).process_series())
 
 
+def test_plot_list_dtypes():
+    # verify that the backends render the arrays used without copies by
+    # plot_list, whatever their dtype, including memory maps
+
+    with TemporaryDirectory(prefix="sympy_") as tmpdir:
+        filename = os.path.join(tmpdir, "data.npy")
+        np.save(filename, np.linspace(0, 1, 5).astype(np.float16))
+        data = [np.linspace(0, 1, 5).astype(t)
+            for t in [np.float16, np.float32, np.int8]]
+        data.append(np.load(filename, mmap_mode="r"))
+        data.append(filename)
+
+        for d in data:
+            for is_point in [False, True]:
+                p = plot_list(d, d, backend=MB, is_point=is_point,
+                    show=False)
+                p.fig.canvas.draw()
+                assert np.allclose(p.ax.lines[0].get_xdata(),
+                    np.load(filename) if isinstance(d, str) else d)
+                p.close()
+
+                p = plot_list(d, d, backend=PB, is_point=is_point,
+                    show=False)
+                p.fig.to_json()
+                assert p.fig.data[0]["x"].dtype != np.float16
+
+                p = plot_list(d, d, backend=BB, is_point=is_point,
+                    show=False)
+                bokeh.embed.json_item(p.fig)
+        del p, d, data
+
+
+def test_plot_list_streaming():
+    # verify that the backends only update the data of the streaming series,
+    # and that points appended before the figure is created are rendered too
+
+    def _do_test(B):
+        p = plot_list([0, 1], [0, 1], "a", backend=B, streaming=True,
+            window=5, show=False, use_latex=False)
+        p.stream(0, [2, 3], [4, 9])
+        f = p.fig
+        p.stream(0, np.arange(4, 8), np.arange(4, 8) ** 2)
+        return p, f
+
+    p, f = _do_test(MB)
+    assert np.allclose(f.axes[0].lines[0].get_xdata(), [3, 4, 5, 6, 7])
+    assert np.allclose(f.axes[0].lines[0].get_ydata(), [9, 16, 25, 36, 49])
+    p.close()
+
+    p, f = _do_test(PB)
+    assert np.allclose(f.data[0]["x"], [3, 4, 5, 6, 7])
+    assert np.allclose(f.data[0]["y"], [9, 16, 25, 36, 49])
+
+    p, f = _do_test(BB)
+    data = f.renderers[0].data_source.data
+    assert np.allclose(data["xs"], [3, 4, 5, 6, 7])
+    assert np.allclose(data["ys"], [9, 16, 25, 36, 49])
+
+    # only streaming series can be updated
+    p = plot_list([0, 1], [0, 1], backend=MB, show=False)
+    raises(ValueError, lambda: p.stream(0, [2], [2]))
+
+
 def test_plot_piecewise_single_series():
     # verify that plot_piecewise plotting 1 piecewise composed of N
     # sub-expressions uses only 1 color
@@ -1601,6 +1697,43 @@ def test_plot_geometry_2():
     assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Circle)]) == 1
 
 
+def test_plot_geometry_batch():
+    # verify that homogeneous collections of entities are rendered by a
+    # single artist when batch=True
+    from sympy.geometry import Point2D, Segment
+
+    points = [Point2D(k, k % 3) for k in range(50)]
+    segments = [Segment((k, 0), (k + 1, 1)) for k in range(50)]
+    polygons = [Polygon((k, 2), 0.4, n=6) for k in range(50)]
+    _plot_geometry = lambda B: plot_geometry(
+        (points, "points"), segments, polygons,
+        batch=True, backend=B, show=False, use_latex=False)
+
+    p = _plot_geometry(MB)
+    assert len(p.series) == 3
+    ax = p.fig.axes[0]
+    assert len(ax.lines) == 2
+    assert len(ax.patches) == 1
+    assert ax.lines[0].get_label() == "points"
+    p.close()
+
+    p = _plot_geometry(PB)
+    assert len(p.fig.data) == 3
+    assert p.fig.data[0]["mode"] == "markers"
+    assert p.fig.data[2]["fill"] == "toself"
+
+    p = _plot_geometry(BB)
+    assert len(p.fig.renderers) == 3
+    assert isinstance(p.fig.renderers[2].glyph, bokeh.models.glyphs.Patch)
+    assert np.allclose(p.fig.renderers[0].data_source.data["ys"],
+        [k % 3 for k in range(50)])
+
+    # non homogeneous collections fall back to one series per entity
+    p = plot_geometry(points[0], segments[0], batch=True, backend=MB,
+        show=False)
+    assert len(p.series) == 2
+
+
 def test_save():
     # Verify that:
     # 1. the save method accepts keyword arguments.
@@ -2557,15 +2690,94 @@ def test_plot3d_implicit():
         x**2 + y**3 - z**2, (x, -2, 2), (y, -2, 2), (z, -2, 2),
         backend=B, n1=10, n2=10, n3=10, show=False)
 
-    raises(NotImplementedError, lambda : _plot3d_implicit(MB).process_series())
+    # the surface is extracted as a triangle mesh by the series
+    p = _plot3d_implicit(MB)
+    p.process_series()
+    assert isinstance(p.ax.collections[0], mpl_toolkits.mplot3d.art3d.Poly3DCollection)
 
     raises(NotImplementedError, lambda : _plot3d_implicit(BB).process_series())
 
+    vertices, faces = p[0].get_mesh()
     p = _plot3d_implicit(PB)
-    assert isinstance(p.fig.data[0], go.Isosurface)
+    assert isinstance(p.fig.data[0], go.Mesh3d)
+    assert np.allclose(p.fig.data[0]["x"], vertices[:, 0])
+    assert np.allclose(p.fig.data[0]["i"], faces[:, 0])
 
     p = _plot3d_implicit(KBchild1)
-    assert isinstance(p.fig.objects[0], k3d.objects.MarchingCubes)
+    assert isinstance(p.fig.objects[0], k3d.objects.Mesh)
+    assert np.allclose(p.fig.objects[0].vertices, vertices.astype(np.float32))
+
+    # octree sampling: the mesh is extracted from the cells crossed by the
+    # surface
+    for B in [PB, KBchild1]:
+        p = plot3d_implicit(x**2 + y**2 + z**2 - 1, (x, -2, 2), (y, -2, 2),
+            (z, -2, 2), backend=B, n=5, adaptive=True, depth=2,
+            show=False)
+        vertices, _ = p[0].get_mesh()
+        assert np.allclose(np.linalg.norm(vertices, axis=1), 1, atol=0.05)
+    assert isinstance(p.fig.objects[0], k3d.objects.Mesh)
+
+    # the surface doesn't cross the plotting volume: nothing is rendered
+    from pytest import warns
+    p = plot3d_implicit(x**2 + y**2 + z**2 + 5, (x, -2, 2), (y, -2, 2),
+        (z, -2, 2), backend=MB, n=10, show=False)
+    with warns(UserWarning, match="doesn't cross the plotting volume"):
+        p.process_series()
+    assert len(p.ax.collections) == 0
+
+
+def test_plot3d_adaptive_triangulation():
+    # verify that backends render the triangulation of the adaptive
+    # algorithm, without interpolating it over a uniform grid.
+    x, y = symbols("x, y")
+
+    _plot3d = lambda B, use_cm: plot3d(cos(x * y), (x, -2, 2), (y, -2, 2),
+        adaptive=True, triangulate=True, backend=B, use_cm=use_cm,
+        show=False)
+
+    p = _plot3d(PB, True)
+    vertices, faces = p[0].get_mesh()
+    assert isinstance(p.fig.data[0], go.Mesh3d)
+    assert np.allclose(p.fig.data[0]["z"], vertices[:, 2])
+    assert np.allclose(p.fig.data[0]["k"], faces[:, 2])
+    assert np.allclose(p.fig.data[0]["intensity"], vertices[:, 2])
+
+    for use_cm in [True, False]:
+        p = _plot3d(MB, use_cm)
+        p.process_series()
+        assert isinstance(p.ax.collections[0],
+            mpl_toolkits.mplot3d.art3d.Poly3DCollection)
+
+        p = _plot3d(KBchild1, use_cm)
+        assert isinstance(p.fig.objects[0], k3d.objects.Mesh)
+        assert len(p.fig.objects[0].indices) == len(faces)
+
+    # the function is not real anywhere: the triangulation is empty
+    from pytest import warns
+    p = plot3d(sqrt(-1 - x**2 - y**2), (x, -2, 2), (y, -2, 2), n=10,
+        adaptive=True, triangulate=True, backend=MB, show=False)
+    with warns(UserWarning, match="doesn't contain any triangle"):
+        p.process_series()
+    assert len(p.ax.collections) == 0
+
+    # adaptive parametric surfaces are rendered as triangle meshes, colored
+    # with a function of the parameters
+    u, v = symbols("u, v")
+    _plot3d_param = lambda B: plot3d_parametric_surface(
+        (2 + cos(v)) * cos(u), (2 + cos(v)) * sin(u), sin(v),
+        (u, 0, 2 * pi), (v, 0, 2 * pi), adaptive=True, n=10,
+        color_func=lambda x, y, z, u, v: u, use_cm=True, backend=B,
+        show=False)
+    p = _plot3d_param(PB)
+    assert isinstance(p.fig.data[0], go.Mesh3d)
+    u_data = p[0].get_data(fields=("u",))[0]
+    assert np.allclose(p.fig.data[0]["intensity"], u_data)
+    p = _plot3d_param(KBchild1)
+    assert np.allclose(p.fig.objects[0].attribute, u_data)
+    p = _plot3d_param(MB)
+    p.process_series()
+    assert isinstance(p.ax.collections[0],
+        mpl_toolkits.mplot3d.art3d.Poly3DCollection)
 
 
 def test_surface_color_func():
@@ -2703,3 +2915,139 @@ def test_line_interactive_color_func():
     p._update_interactive({t: 2})
     assert isinstance(p.fig.renderers[0].glyph, bokeh.models.glyphs.Line)
     assert isinstance(p.fig.renderers[1].glyph, bokeh.models.glyphs.MultiLine)
+
+
+def test_memory_report():
+    # verify that backends report the memory held by series and artists
+
+    x, y = symbols("x, y")
+
+    for B in [MB, PB, BB]:
+        p = plot(sin(x), cos(x), backend=B, show=False, adaptive=False, n=100)
+        r = p.memory_report()
+        assert len(r["series"]) == 2
+        assert all(s["estimated"] > 0 for s in r["series"])
+        assert len(r["artists"]) == 2
+        assert all(a["nbytes"] > 0 for a in r["artists"])
+        assert r["total"] >= sum(a["nbytes"] for a in r["artists"])
+
+    p = plot3d(cos(x * y), (x, -2, 2), (y, -2, 2), n=10, backend=PB,
+        show=False)
+    r = p.memory_report()
+    # x, y, z arrays of the surface
+    assert r["artists"][0]["nbytes"] >= 3 * 10 * 10 * 8
+
+
+def test_memory_budget():
+    # verify that the memory policies are applied when the estimated memory
+    # exceeds the budget
+
+    from spb.defaults import cfg
+    from pytest import warns
+    x, y = symbols("x, y")
+    budget = cfg["evaluation"]["memory_budget"]
+    policy = cfg["evaluation"]["memory_policy"]
+
+    try:
+        cfg["evaluation"]["memory_budget"] = 100000
+
+        cfg["evaluation"]["memory_policy"] = "reduce"
+        with warns(UserWarning, match="has been reduced"):
+            p = plot3d(cos(x * y), (x, -2, 2), (y, -2, 2), n=100, backend=MB,
+                show=False)
+        assert p[0].n1 < 100 and p[0].n2 < 100
+        assert p[0].estimate_memory() <= 100000
+
+        cfg["evaluation"]["memory_policy"] = "chunk"
+        with warns(UserWarning, match="in chunks"):
+            p = plot3d(cos(x * y), (x, -2, 2), (y, -2, 2), n=40, backend=MB,
+                show=False)
+        assert p[0].n1 == p[0].n2 == 40
+        assert p[0]._chunk_size is not None
+        _, _, zz = p[0].get_data()
+        assert zz.shape == (40, 40)
+        assert not np.isnan(zz).any()
+
+        cfg["evaluation"]["memory_policy"] = "raise"
+        raises(ValueError, lambda: plot3d(cos(x * y), (x, -2, 2), (y, -2, 2),
+            n=100, backend=MB, show=False))
+
+        # small plots are not affected
+        p = plot(sin(x), n=10, adaptive=False, backend=MB, show=False)
+        assert p[0].n == 10
+    finally:
+        cfg["evaluation"]["memory_budget"] = budget
+        cfg["evaluation"]["memory_policy"] = policy
+
+
+def test_pickle():
+    # verify that plots can be pickled, optionally with their numerical data
+
+    import pickle
+    x, y = symbols("x, y")
+
+    for B in [MB, PB, BB]:
+        p = plot(sin(x), cos(x), backend=B, show=False, adaptive=False, n=10,
+            title="test", xlim=(-2, 2))
+        p2 = pickle.loads(pickle.dumps(p))
+        assert type(p2) is B
+        assert p2.title == "test"
+        assert p2.xlim == (-2, 2)
+        assert [str(s) for s in p2.series] == [str(s) for s in p.series]
+        p2.fig
+
+    p = plot3d(cos(x * y), (x, -2, 2), (y, -2, 2), n=10, backend=PB,
+        show=False)
+    p.bake()
+    p2 = pickle.loads(pickle.dumps(p))
+    assert p2[0].get_data == p2[0]._get_baked_data
+    assert np.allclose(p2[0].get_data()[-1], p[0].get_data()[-1])
+    p2.fig
+
+    # plots containing geometric entities
+    p = plot_geometry(Circle((0, 0), 2), Polygon((0, 0), 1, n=5),
+        backend=MB, show=False)
+    p2 = pickle.loads(pickle.dumps(p))
+    p2.fig
+    p2.close()
+
+
+def test_auto_discretization():
+    # verify that n="auto" computes the number of discretization points
+    # from the size of the plot, in pixels
+
+    x, y, z = symbols("x, y, z")
+
+    p = plot(sin(x), adaptive=False, n="auto", size=(400, 300), backend=PB,
+        show=False)
+    assert p[0].n == 400
+    p = plot(sin(x), adaptive=False, n="auto", size=(4, 3), dpi=100,
+        backend=MB, show=False)
+    assert p[0].n == round(400 * (matplotlib.rcParams["figure.subplot.right"]
+        - matplotlib.rcParams["figure.subplot.left"]))
+    p2 = plot(sin(x), adaptive=False, n="auto", size=(4, 3), dpi=200,
+        backend=MB, show=False)
+    assert abs(p2[0].n - 2 * p[0].n) <= 1
+    p2.fig
+
+    # the domain coloring image keeps the aspect ratio of the domain
+    p = plot_complex(gamma(z), (z, -2 - 1j, 2 + 1j), n="auto",
+        size=(400, 300), backend=PB, show=False)
+    assert (p[0].n1, p[0].n2) == (400, 200)
+
+    # surfaces and quivers use fewer points
+    p = plot3d(cos(x * y), n="auto", size=(400, 300), backend=PB, show=False)
+    assert p[0].n1 == p[0].n2 == 75
+    p = plot_vector([-sin(y), cos(x)], (x, -3, 3), (y, -3, 3), n="auto",
+        size=(500, 250), backend=BB, show=False)
+    assert (p[1].n1, p[1].n2) == (20, 10)
+    assert p[1]._shared_n == (p[0].n1, p[0].n2)
+
+    # piecewise functions are evaluated once the number of points is known
+    p = plot_piecewise(Piecewise((x, x < 0), (x**2, True)), (x, -2, 2),
+        n="auto", adaptive=False, size=(400, 300), backend=PB, show=False)
+    assert p[0].n == p[2].n == 400
+    assert len(p[0].get_data()[0]) == 400
+
+    raises(ValueError, lambda: plot(sin(x), adaptive=False, n="a",
+        backend=PB, show=False))
@@ -85,6 +85,29 @@ def test_build_complex_point_series():
     assert all(isinstance(t, ComplexPointInteractiveSeries) for t in s)
 
 
+def test_build_complex_point_series_arrays():
+    # NumPy arrays of complex points, or real and imaginary parts, create
+    # complex point series which use the arrays without copies
+    from sympy.external import import_module
+    np = import_module('numpy')
+    z = np.exp(1j * np.linspace(0, 2 * np.pi, 50))
+
+    for interactive in [False, True]:
+        cls = (ComplexPointSeries if not interactive
+            else ComplexPointInteractiveSeries)
+        s = bcs(z, (z.real, z.imag, "b"), interactive=interactive)
+        assert len(s) == 2
+        assert all(isinstance(t, cls) for t in s)
+        assert s[1].get_label() == "b"
+        for t in s:
+            x, y = t.get_data()
+            assert np.shares_memory(x, z) and np.shares_memory(y, z)
+            assert np.allclose(x + 1j * y, z)
+
+    s = bcs((z, "a"), interactive=False)
+    assert len(s) == 1 and (s[0].get_label() == "a")
+
+
 def test_build_complex_line_series():
     x, y, z = symbols("x:z")
 
@@ -12,7 +12,7 @@ def test_cfg_keys():
     assert isinstance(cfg, dict)
     must_have_keys = ["backend_2D", "backend_3D", "matplotlib", "plotly",
         "k3d", "bokeh", "complex", "interactive", "plot3d", "adaptive",
-        "plot_range"]
+        "plot_range", "evaluation"]
     for k in must_have_keys:
         assert k in cfg.keys()
 
@@ -21,6 +21,12 @@ def test_plot_range_keys():
     assert ("min" in cfg["plot_range"].keys()) and ("max" in cfg["plot_range"].keys())
 
 
+def test_evaluation_keys():
+    assert ("timeout" in cfg["evaluation"].keys()) and (cfg["evaluation"]["timeout"] is None)
+    assert cfg["evaluation"]["memory_budget"] is None
+    assert cfg["evaluation"]["memory_policy"] == "reduce"
+
+
 def test_plot3d_keys():
     assert ("use_cm" in cfg["plot3d"].keys()) and (cfg["plot3d"]["use_cm"] is False)
 
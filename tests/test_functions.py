@@ -85,6 +85,45 @@ def test_plot_list():
     assert p.series[1].label == "sin"
 
 
+def test_plot_list_zero_copy():
+    # verify that arrays, memory-mapped files and buffers are used without
+    # copies, preserving their dtype
+    import array
+
+    xx = np.linspace(-3, 3, 100, dtype=np.float32)
+    yy = np.cos(xx)
+
+    p = plot_list(xx[::2], yy[::2], "view", backend=MB, show=False)
+    s = p.series[0]
+    assert np.shares_memory(s.list_x, xx) and np.shares_memory(s.list_y, yy)
+    assert s.list_x.dtype == np.float32
+    assert s.estimate_memory() == 50 * 8
+
+    with TemporaryDirectory(prefix="sympy_") as tmpdir:
+        fx = os.path.join(tmpdir, "x.npy")
+        fy = os.path.join(tmpdir, "y.npy")
+        np.save(fx, xx)
+        np.save(fy, yy)
+        p = plot_list(fx, fy, backend=MB, show=False)
+        s = p.series[0]
+        assert isinstance(s.list_x, np.memmap)
+        assert s.list_x.dtype == np.float32
+        assert np.allclose(s.get_data()[1], yy)
+        p.fig
+        p.close()
+        del p, s
+
+    buf = array.array("h", [1, 2, 3])
+    p = plot_list((buf, memoryview(buf), "buffers"), backend=MB, show=False)
+    s = p.series[0]
+    assert np.shares_memory(s.list_x, s.list_y)
+    assert s.list_x.dtype == np.int16
+
+    # lists are converted to arrays of floats
+    p = plot_list([1, 2, 3], [4, 5, 6], backend=MB, show=False)
+    assert p.series[0].list_x.dtype == np.float64
+
+
 def test_process_sums():
     # verify that Sum containing infinity in its boundary, gets replaced with
     # a Sum with arbitrary big numbers instead.
@@ -198,6 +237,51 @@ def test_plot_piecewise():
     assert len([t for t in s if isinstance(t, List2DSeries) and t.is_filled]) == 2
 
 
+def test_plot_piecewise_single_evaluation():
+    # verify that with uniform sampling the pieces are evaluated while
+    # building the plot, and that the results are the same as evaluating
+    # each piece on its own.
+
+    x = symbols("x")
+    f = Piecewise(
+        (-1, x < -1),
+        (x, And(-1 <= x, x < 0)),
+        (x**2, And(0 <= x, x < 1)),
+        (x**3, x >= 1)
+    )
+    p = plot_piecewise(f, (x, -5, 5), backend=MB, show=False,
+        adaptive=False, n=20)
+    lines = [t for t in p.series if isinstance(t, LineOver1DRangeSeries)]
+    assert len(lines) == 4
+    for s in lines:
+        assert s._uniform_sampling_cache is not None
+        xx, yy = s.get_data()
+        assert len(xx) == 20
+        s2 = LineOver1DRangeSeries(s.expr, (x, s.start.real, s.end.real),
+            adaptive=False, n=20)
+        assert all(np.allclose(a, b) for a, b in zip(s2.get_data(), (xx, yy)))
+
+    # a new range invalidates the precomputed results
+    s = lines[-1]
+    s.end = 6
+    assert np.isclose(s.get_data()[1][-1], 216)
+    # so do a new expression or new modules
+    s.expr = x**2
+    assert np.isclose(s.get_data()[1][-1], 36)
+    key = s._get_sampling_key()
+    s.modules = "sympy"
+    assert s._get_sampling_key() != key
+
+    # the configured time budget is used
+    timeout = cfg["evaluation"]["timeout"]
+    try:
+        cfg["evaluation"]["timeout"] = -1
+        raises(ValueError, lambda: plot_piecewise(f, (x, -5, 5),
+            backend=MB, show=False, adaptive=False, n=20))
+    finally:
+        cfg["evaluation"]["timeout"] = timeout
+
+
 ###############################################################################
 ################### PLOT - PLOT_PARAMETRIC - PLOT3D-RELATED ###################
 ###############################################################################
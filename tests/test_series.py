@@ -1,13 +1,15 @@
 from sympy import latex
 from sympy.core.symbol import symbols
 from sympy.core.containers import Tuple
+from sympy.core.relational import Eq
+from sympy.logic.boolalg import And
 from sympy.core.numbers import I, pi
 from sympy.functions.elementary.trigonometric import sin, cos, tan
-from sympy.functions.elementary.exponential import log
+from sympy.functions.elementary.exponential import log, exp
 from sympy.functions.elementary.miscellaneous import sqrt
 from sympy.functions.elementary.complexes import re, im, arg
 from sympy.functions.elementary.integers import frac
-from sympy.geometry import Plane, Circle, Point
+from sympy.geometry import Plane, Circle, Point, Polygon
 from sympy.concrete.summations import Sum
 from sympy.core.singleton import S
 from sympy.external import import_module
@@ -23,9 +25,9 @@ from spb.series import (
     ComplexInteractiveBaseSeries,
     ComplexSurfaceInteractiveSeries, ComplexDomainColoringInteractiveSeries,
     ComplexPointSeries, ComplexPointInteractiveSeries,
-    GeometrySeries, GeometryInteractiveSeries,
+    GeometrySeries, GeometryInteractiveSeries, GeometryCollectionSeries,
     PlaneSeries, PlaneInteractiveSeries,
-    List2DSeries, AbsArgLineSeries,
+    List2DSeries, StreamingList2DSeries, AbsArgLineSeries,
     LineInteractiveSeries, AbsArgLineInteractiveSeries,
     Parametric2DLineInteractiveSeries, Parametric3DLineInteractiveSeries,
     ParametricSurfaceInteractiveSeries, SurfaceInteractiveSeries,
@@ -129,6 +131,249 @@ def test_adaptive_zerodivisionerror():
     x1, y1, z1, p1 = s1.get_data()
 
 
+def test_adaptive_learner_budget_executor():
+    # verify that the learners of the adaptive module can be executed in
+    # batches with an executor, and that they stop when the maximum number
+    # of points is reached.
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor
+    from pytest import raises
+
+    x, y = symbols("x, y")
+    kw = dict(adaptive=True, adaptive_sampler="adaptive")
+
+    s = LineOver1DRangeSeries(sin(x), (x, -10, 10), adaptive_goal=1e-06,
+        max_points=50, **kw)
+    xx, yy = s.get_data()
+    assert len(xx) == 50
+    assert np.allclose(yy, np.sin(xx))
+
+    x1, _ = LineOver1DRangeSeries(sin(x), (x, -10, 10), **kw).get_data()
+    with ThreadPoolExecutor(2) as executor:
+        for ex in ["threads", executor]:
+            s = LineOver1DRangeSeries(sin(x), (x, -10, 10), executor=ex,
+                batch_size=4, **kw)
+            xx, yy = s.get_data()
+            assert np.allclose(yy, np.sin(xx))
+            # batches might overshoot the goal, but not by much
+            assert len(x1) <= len(xx) < 1.5 * len(x1)
+
+        s = Parametric3DLineSeries(cos(x), sin(x), x, (x, 0, 2*pi),
+            executor=executor, max_points=30, **kw)
+        xx, yy, zz, param = s.get_data()
+        assert len(xx) == 30
+        assert np.allclose(zz, param)
+
+        # executors are not pickled
+        s2 = pickle.loads(pickle.dumps(s))
+        assert s2.executor is None
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        adaptive=True, executor="threads", max_points=100)
+    xx, yy, zz = s.get_data()
+    # with so few points the interpolated surface is coarse
+    assert xx.shape == yy.shape == zz.shape
+    assert np.all(np.isfinite(zz)) and np.all(np.abs(zz) <= 1 + 1e-08)
+
+    s = LineOver1DRangeSeries(sin(x), (x, -10, 10), executor="unknown",
+        **kw)
+    raises(ValueError, lambda: s.get_data())
+
+
+def test_surface_adaptive_triangulation():
+    # verify that SurfaceOver2DRangeSeries is able to return the
+    # triangulation computed by the adaptive algorithm.
+    import pickle
+    from pytest import raises
+
+    x, y = symbols("x, y")
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        adaptive=True, triangulate=True)
+    assert s.is_mesh
+    xx, yy, zz = s.get_data()
+    assert xx.ndim == yy.ndim == zz.ndim == 1
+    assert np.allclose(zz, np.cos(xx * yy))
+    vertices, faces = s.get_mesh()
+    assert np.allclose(vertices, np.column_stack([xx, yy, zz]))
+    assert faces.shape[1] == 3
+    assert faces.min() == 0 and faces.max() == len(vertices) - 1
+    # the triangles cover the domain
+    v = vertices[faces]
+    area = np.abs(np.cross(v[:, 1, :2] - v[:, 0, :2],
+        v[:, 2, :2] - v[:, 0, :2])).sum() / 2
+    assert np.isclose(area, 16)
+
+    # baked triangulations survive pickling
+    s.bake()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert np.allclose(s2.get_mesh()[1], faces)
+
+    # triangles with non-finite vertices are removed
+    s = SurfaceOver2DRangeSeries(1 / (x * y), (x, -2, 2), (y, -2, 2),
+        adaptive=True, triangulate=True, max_points=200)
+    vertices, faces = s.get_mesh()
+    assert np.all(np.isfinite(vertices[faces]))
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        adaptive=True)
+    assert not s.is_mesh
+    assert s.get_data()[0].ndim == 2
+    raises(ValueError, lambda: s.get_mesh())
+    raises(ValueError, lambda: s.get_data(fields=("faces",)))
+
+
+def test_parametric_surface_adaptive():
+    # verify that ParametricSurfaceSeries refines the (u, v) grid where the
+    # curvature is high, producing a triangle mesh without cracks.
+    import pickle
+    u, v = symbols("u, v")
+    expr = (u, v, 1 / (S(1) / 20 + u**2 + v**2))
+
+    s = ParametricSurfaceSeries(*expr, (u, -2, 2), (v, -2, 2),
+        adaptive=True)
+    assert s.is_mesh
+    x, y, z, uu, vv, faces = s.get_data(
+        fields=("x", "y", "z", "u", "v", "faces"))
+    assert np.allclose(x, uu) and np.allclose(y, vv)
+    assert np.allclose(z, 1 / (0.05 + uu**2 + vv**2))
+    vertices, faces2 = s.get_mesh()
+    assert np.allclose(vertices, np.column_stack([x, y, z]))
+    assert np.allclose(faces, faces2)
+
+    # the triangles cover the parameter domain, with the same orientation
+    t = np.column_stack([uu, vv])[faces]
+    area = np.cross(t[:, 1] - t[:, 0], t[:, 2] - t[:, 0]) / 2
+    assert np.all(area > 0) and np.isclose(area.sum(), 16)
+    # every edge is shared by two triangles, except on the boundary
+    edges = np.sort(np.concatenate(
+        [faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+    edges, count = np.unique(edges, axis=0, return_counts=True)
+    assert set(count) == {1, 2}
+    e = edges[count == 1]
+    on_boundary = np.isclose(np.abs(uu[e]), 2) | np.isclose(np.abs(vv[e]), 2)
+    assert np.all(on_boundary)
+
+    # the vertices are concentrated around the peak
+    near = (np.abs(uu) < 0.5) & (np.abs(vv) < 0.5)
+    assert near.sum() > 4 * len(uu) / 64
+
+    # a plane is not refined
+    s = ParametricSurfaceSeries(u, v, u + v, (u, -1, 1), (v, -1, 1),
+        adaptive=True, n1=5, n2=5)
+    assert len(s.get_data()[0]) == 25 + 16
+
+    # the number of points is limited
+    s = ParametricSurfaceSeries(*expr, (u, -2, 2), (v, -2, 2),
+        adaptive=True, max_points=1000)
+    assert 761 < len(s.get_data()[0]) <= 1000
+
+    # baked meshes survive pickling
+    s.bake()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert len(s2.get_mesh()[1]) == len(s.get_mesh()[1])
+
+    # uniform sampling only evaluates the requested components
+    s = ParametricSurfaceSeries(*expr, (u, -2, 2), (v, -2, 2),
+        n1=10, n2=10)
+    assert not s.is_mesh
+    z, uu, vv = s.get_data(fields=("z", "u", "v"))
+    assert z.shape == (10, 10)
+    assert np.allclose(z, 1 / (0.05 + uu**2 + vv**2))
+    assert len(s.get_data()) == 5
+
+
+def test_adaptive_native_sampler():
+    # verify that the built-in adaptive algorithm refines lines in batches,
+    # without requiring the adaptive module.
+    import time
+    from sympy.utilities.lambdify import implemented_function
+    from pytest import warns, raises
+
+    x = symbols("x")
+
+    def check_error(xx, yy, f, tol):
+        xd = np.linspace(xx[0], xx[-1], 10001)
+        yd = f(xd)
+        err = np.abs(np.interp(xd, xx, yy) - yd) / np.ptp(yd)
+        assert err.max() < tol
+
+    s1 = LineOver1DRangeSeries(sin(x), (x, -10, 10), adaptive=True)
+    s2 = LineOver1DRangeSeries(sin(x), (x, -10, 10), adaptive=True,
+        adaptive_goal=0.001)
+    x1, y1 = s1.get_data()
+    x2, y2 = s2.get_data()
+    assert np.all(np.diff(x1) > 0)
+    assert np.isclose(x1[0], -10) and np.isclose(x1[-1], 10)
+    assert len(x1) < len(x2)
+    check_error(x1, y1, np.sin, 2e-3)
+    check_error(x2, y2, np.sin, 2e-4)
+
+    # narrow features are resolved
+    s = LineOver1DRangeSeries(exp(-100 * x**2), (x, -10, 10),
+        adaptive=True)
+    xx, yy = s.get_data()
+    check_error(xx, yy, lambda t: np.exp(-100 * t**2), 2e-2)
+
+    # the evaluations points are limited by max_points, even around poles
+    s = LineOver1DRangeSeries(sin(1 / x), (x, -1, 1), adaptive=True,
+        max_points=500)
+    assert len(s.get_data()[0]) <= 500
+    s = LineOver1DRangeSeries(tan(x), (x, -1.5*pi, 1.5*pi), adaptive=True)
+    xx, yy = s.get_data()
+    assert len(xx) < 3000
+    mask = np.abs(xx) < 1.4
+    check_error(xx[mask], yy[mask], np.tan, 2e-3)
+
+    # the boundaries of the domain are located
+    s = LineOver1DRangeSeries(sqrt(x), (x, -1, 1), adaptive=True)
+    xx, yy = s.get_data()
+    assert np.all(np.isnan(yy[xx < 0]))
+    assert xx[(xx >= 0) & ~np.isnan(yy)].min() < 1e-03
+
+    # complex functions and parametric lines
+    s = AbsArgLineSeries(sqrt(x), (x, -5, 5), adaptive=True)
+    xx, _abs, _arg = s.get_data()
+    assert np.allclose(_abs, np.sqrt(np.abs(xx)))
+    assert np.allclose(_arg[xx < 0], np.pi / 2)
+    s = Parametric2DLineSeries(cos(x), sin(x), (x, 0, 2*pi), adaptive=True)
+    xx, yy, param = s.get_data()
+    assert np.allclose(np.hypot(xx, yy), 1)
+    assert np.allclose(xx, np.cos(param))
+    s = Parametric3DLineSeries(cos(x), sin(x), sqrt(x), (x, -1, 2*pi),
+        adaptive=True)
+    xx, yy, zz, param = s.get_data()
+    assert np.all(np.isnan(zz[param < 0])) and not np.isnan(zz[-1])
+
+    # logarithmic discretization
+    s = LineOver1DRangeSeries(log(x), (x, 1e-05, 10), adaptive=True,
+        xscale="log")
+    xx, yy = s.get_data()
+    assert np.allclose(yy, np.log(xx))
+    assert len(xx) < 200
+
+    # functions that can't be evaluated over arrays
+    f = implemented_function("f", lambda t: float(t)**2)
+    s = LineOver1DRangeSeries(f(x), (x, -1, 1), adaptive=True)
+    xx, yy = s.get_data()
+    assert np.allclose(yy, xx**2)
+
+    # time budget: each round of evaluations is a single call
+    def slow(t):
+        time.sleep(0.05)
+        return np.sin(t)
+
+    f = implemented_function("f", slow)
+    s = LineOver1DRangeSeries(f(x), (x, -10, 10), adaptive=True,
+        adaptive_goal=1e-06, timeout=0.2)
+    with warns(UserWarning, match="exceeded the time budget"):
+        xx, yy = s.get_data()
+    assert np.allclose(yy, np.sin(xx))
+
+    s = LineOver1DRangeSeries(sin(x), (x, -10, 10), adaptive=True,
+        adaptive_sampler="unknown")
+    raises(ValueError, lambda: s.get_data())
+
+
 def test_detect_poles():
     x, u = symbols("x, u")
 
@@ -177,6 +422,125 @@ def test_detect_poles():
     assert np.any(np.isnan(yy2))
 
 
+def test_detect_poles_symbolic():
+    # verify that the poles found by SymPy break the lines exactly at their
+    # locations, and that they are approached with additional samples.
+    x, u = symbols("x, u")
+
+    s = LineOver1DRangeSeries(tan(x), (x, -pi, pi), adaptive=False, n=100,
+        detect_poles="symbolic")
+    xx, yy = s.get_data()
+    assert np.allclose(xx[np.isnan(yy)], [-np.pi / 2, np.pi / 2])
+    assert len(xx) > 100
+    assert np.all(np.diff(xx) > 0)
+    assert np.nanmax(np.abs(yy)) > 100
+    # the singularities are computed once
+    assert s._poles_cache is not None
+    s._poles_cache = (s._poles_cache[0], np.array([0.5]))
+    s._uniform_sampling_cache = None
+    xx, _ = s.get_data()
+    assert np.any(np.isclose(xx, 0.5))
+
+    s = LineOver1DRangeSeries(1 / (x**2 - 1), (x, -3, 3), adaptive=True,
+        detect_poles="symbolic")
+    xx, yy = s.get_data()
+    assert np.allclose(xx[np.isnan(yy)], [-1, 1])
+
+    s = LineInteractiveSeries([u * tan(x)], [(x, -pi, pi)], params={u: 1},
+        n1=100, detect_poles="symbolic")
+    xx, yy = s.get_data()
+    assert np.any(np.isclose(xx, np.pi / 2))
+    assert np.all(np.isnan(yy[np.isclose(np.abs(xx), np.pi / 2)]))
+    s.params = {u: 2}
+    xx2, yy2 = s.get_data()
+    assert np.allclose(xx, xx2)
+    finite = np.isfinite(yy2)
+    assert np.allclose(yy2[finite], 2 * yy[finite])
+
+    # the poles depend on the parameters: only the numerical detection
+    s = LineInteractiveSeries([1 / (x - u)], [(x, -5, 5)], params={u: 1},
+        n1=100, detect_poles="symbolic")
+    xx, yy = s.get_data()
+    assert s._get_poles() is None
+    assert len(xx) == 100
+
+
+def test_exploit_symmetry():
+    # verify that periodic, even and odd expressions are evaluated over one
+    # period or one half, producing the correct results.
+    from spb.series import _find_symmetry, _symmetric_discretization
+    from sympy.utilities.lambdify import lambdify
+    x, y = symbols("x, y")
+
+    assert _find_symmetry(sin(x) * cos(3 * x), x) == (float(2 * pi), -1)
+    assert _find_symmetry(exp(-x**2), x) == (None, 1)
+    assert _find_symmetry(x + exp(x), x) == (None, 0)
+    assert _find_symmetry(sin(x * y), x)[0] is None
+
+    xx, reduced, index, sign = _symmetric_discretization(0, 10, 100,
+        2.5, 0)
+    assert np.allclose(np.diff(xx), 2.5 / 24) and np.isclose(xx[-1], 10)
+    assert len(xx) <= 100
+    assert np.allclose(reduced[index], xx % 2.5)
+    xx, reduced, index, sign = _symmetric_discretization(-2, 2, 10,
+        None, -1)
+    assert np.allclose(xx, -xx[::-1]) and len(reduced) == 5
+    assert np.allclose(sign * reduced[index], xx)
+    assert _symmetric_discretization(-1, 2, 10, None, 1)[0] is None
+
+    for expr, r in [(sin(x) * cos(3 * x), (x, -50, 50)),
+            (x * exp(-x**2), (x, -3, 3)), (x**2, (x, -3, 3)),
+            (x * sin(x), (x, 0, 10))]:
+        s = LineOver1DRangeSeries(expr, r, adaptive=False, n=1000,
+            exploit_symmetry=True)
+        xx, yy = s.get_data()
+        assert 980 < len(xx) <= 1000
+        assert np.isclose(xx[0], float(r[1])) and np.isclose(xx[-1], r[2])
+        assert np.allclose(yy, lambdify(x, expr)(xx))
+
+    # too few points per period: the regular grid is used, otherwise the
+    # samples would only hit the zeros of the function
+    assert _symmetric_discretization(0, 10000, 1000, 2 * np.pi, -1)[0] is None
+    s = LineOver1DRangeSeries(sin(x), (x, 0, 10000), adaptive=False, n=1000,
+        exploit_symmetry=True)
+    xx, yy = s.get_data()
+    assert len(xx) == 1000
+    assert np.allclose(yy, np.sin(xx)) and (np.amax(yy) > 0.9)
+
+    for expr in [sin(x) * cos(y), x * exp(-x**2 - y**2), sin(x * y)]:
+        s = SurfaceOver2DRangeSeries(expr, (x, -20, 20), (y, -3, 3),
+            n1=300, n2=200, exploit_symmetry=True)
+        xx, yy, zz = s.get_data()
+        assert np.allclose(zz, lambdify((x, y), expr)(xx, yy))
+
+
+def test_auto_discretization_standalone():
+    # verify that n="auto" is resolved with the default size of the plot
+    # area when a series is evaluated without being added to a plot
+    x, y, u = symbols("x, y, u")
+
+    s = LineOver1DRangeSeries(sin(x), (x, -5, 5), adaptive=False, n="auto")
+    xx, yy = s.get_data()
+    assert s.n == len(xx) == 640
+    assert np.allclose(yy, np.sin(xx))
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        n1="auto", n2="auto")
+    assert s.get_data()[0].shape == (s.n2, s.n1)
+    assert isinstance(s.n1, int)
+
+    s = InteractiveSeries([u * cos(x * y)], [(x, -2, 2), (y, -2, 2)],
+        params={u: 1}, n1="auto", n2="auto")
+    assert s.get_data()[0].shape == (s.n2, s.n1)
+
+    s = Vector2DSeries(-sin(y), cos(x), (x, -3, 3), (y, -3, 3),
+        n1="auto", n2="auto")
+    assert s.get_data()[0].shape == (s.n2, s.n1)
+
+    s = LineOver1DRangeSeries(sin(x), (x, -5, 5), adaptive=False, n="a")
+    raises(ValueError, lambda: s.get_data())
+
+
 def test_list2dseries():
     xx = np.linspace(-3, 3, 10)
     yy1 = np.cos(xx)
@@ -188,6 +552,37 @@ def test_list2dseries():
     raises(ValueError, lambda: List2DSeries(xx, yy2))
 
 
+def test_streaming_list2dseries():
+    # verify that new points are appended to the series, that a rolling
+    # window only keeps the most recent points and that the backends can
+    # retrieve only the points added since the last rendering
+
+    s = StreamingList2DSeries([1, 2], [3, 4])
+    assert s.is_streaming and not List2DSeries([1], [2]).is_streaming
+    s.append(np.arange(3, 2003), np.arange(3, 2003) ** 2)
+    x, y = s.get_data()
+    assert np.allclose(x, np.arange(1, 2003))
+    assert np.allclose(y, [3, 4] + list(np.arange(3, 2003) ** 2))
+    raises(ValueError, lambda: s.append([1, 2], [3]))
+
+    s = StreamingList2DSeries([0, 1], [0, 1], window=5)
+    x, y = s.get_data()
+    s.append([2, 3], [2, 3])
+    nx, ny = s._get_new_points()
+    assert np.allclose(nx, [2, 3]) and np.allclose(ny, [2, 3])
+    assert len(s._get_new_points()[0]) == 0
+    for k in range(4, 12):
+        s.append([k], [-k])
+    x, y = s.get_data()
+    assert np.allclose(x, [7, 8, 9, 10, 11])
+    assert np.allclose(y, [-7, -8, -9, -10, -11])
+    # more points than the window
+    s.append(np.arange(20), np.arange(20))
+    x, y = s.get_data()
+    assert np.allclose(x, np.arange(15, 20))
+    raises(ValueError, lambda: StreamingList2DSeries(window=0))
+
+
 def test_interactive_instance():
     # test that the correct data series is produced when instantiating
     # InteractiveSeries
@@ -957,6 +1352,105 @@ def test_geometry_is_filled():
     assert s.is_filled
 
 
+def test_complex_point_interactive_lambdified():
+    # verify that the points of ComplexPointInteractiveSeries are evaluated
+    # in the complex domain, like evalf does
+    from sympy import log
+    u = symbols("u")
+
+    points = [sqrt(-u) + 1, 2 + I, log(-u), u * exp(I * pi / 4)]
+    s = ComplexPointInteractiveSeries(points, params={u: 1})
+    for p in [{u: 1}, {u: 4}]:
+        s.params = p
+        x, y = s.get_data()
+        expected = np.array([complex(t.evalf(subs=p)) for t in points])
+        assert np.allclose(x, expected.real)
+        assert np.allclose(y, expected.imag)
+
+    # NumPy arrays don't depend on the parameters
+    z = np.array([1 + 2j, 3 - 1j])
+    s = ComplexPointInteractiveSeries(z, params={u: 1})
+    assert np.allclose(s.get_data()[1], [2, -1])
+
+
+def test_geometry_collection():
+    # verify that GeometryCollectionSeries packs the coordinates of an
+    # homogeneous collection of entities into NaN-separated arrays
+    from sympy.geometry import Point3D, Segment
+    x = symbols("x")
+
+    s = GeometryCollectionSeries([Point(k, k**2) for k in range(4)])
+    assert s.is_2Dline and s.is_point
+    xx, yy = s.get_data()
+    assert np.allclose(xx, [0, 1, 2, 3]) and np.allclose(yy, [0, 1, 4, 9])
+
+    s = GeometryCollectionSeries([Point3D(k, 1, 2) for k in range(3)])
+    assert s.is_3Dline and s.is_point
+    assert len(s.get_data()) == 4
+
+    s = GeometryCollectionSeries(
+        [Segment((0, 0), (1, x)), Segment((2, 0), (3, 1))], params={x: 2})
+    assert s.is_2Dline and (not s.is_point)
+    xx, yy = s.get_data()
+    assert np.allclose(xx, [0, 1, np.nan, 2, 3], equal_nan=True)
+    assert np.allclose(yy, [0, 2, np.nan, 0, 1], equal_nan=True)
+
+    polygons = [Polygon((0, 0), (1, 0), (1, 1)), Polygon((2, 0), 1, n=4)]
+    s = GeometryCollectionSeries(polygons)
+    assert s.is_geometry and (not s.is_2Dline)
+    xx, yy = s.get_data()
+    assert len(xx) == 4 + 1 + 5
+    assert np.isnan(xx[4]) and np.allclose(xx[:4], [0, 1, 1, 0])
+    s = GeometryCollectionSeries(polygons, is_filled=False)
+    assert s.is_2Dline
+
+    raises(ValueError,
+        lambda: GeometryCollectionSeries([Point(0, 0), Segment((0, 0), (1, 1))]))
+    raises(ValueError, lambda: GeometryCollectionSeries([Point(x, 0)]))
+
+
+def test_geometry_plane_lambdified_updates():
+    # verify that interactive geometric entities and planes evaluate the
+    # lambdified quantities computed on first use, which produce the
+    # same results as substituting the parameters into the entity
+    from sympy.geometry import Segment, Line, Ellipse
+    a, b, x, y, z = symbols("a, b, x, y, z")
+
+    entities = [
+        (Point(a, b), []),
+        (Circle(Point(a, 0), b), []),
+        (Ellipse(Point(a, 1), 3, b), []),
+        (Polygon(Point(a, b), 2, n=5), []),
+        (Segment((a, 0), (1, b)), []),
+        (Line((a, 0), (1, b)), [(x, -3, 3)]),
+        # number of sides depending on a parameter
+        (Polygon(Point(0, 0), 1, n=a), []),
+    ]
+    for e, r in entities:
+        s = GeometryInteractiveSeries([e], r, params={a: 3, b: 2})
+        for p in [{a: 3, b: 2}, {a: 4, b: 1}]:
+            s.params = p
+            s2 = GeometrySeries(e.subs(p), *(r if r else [None]))
+            for d1, d2 in zip(s.get_data(), s2.get_data()):
+                assert np.allclose(d1, d2)
+
+    ranges = [(x, -2, 3), (y, -4, 5), (z, -1, 6)]
+    planes = [
+        Plane((a, 2, 3), (1, 0, 0)),
+        Plane((1, a, 3), (0, 1, 0)),
+        Plane((0, 0, a), (0, 0, 1)),
+        Plane((0, 0, a), (1, b, 3)),
+    ]
+    for pl in planes:
+        s = PlaneInteractiveSeries([pl], ranges, params={a: 1, b: 2},
+            n1=5, n2=6, n3=7)
+        for p in [{a: 1, b: 2}, {a: 2, b: -1}]:
+            s.params = p
+            s2 = PlaneSeries(pl.subs(p), *ranges, n1=5, n2=6, n3=7)
+            for d1, d2 in zip(s.get_data(), s2.get_data()):
+                assert np.allclose(d1, d2, equal_nan=True)
+
+
 def test_steps():
     x, u = symbols("x, u")
 
@@ -2328,3 +2822,442 @@ def test_is_polar_3d():
     x22, y22 = x1 * np.cos(y1), x1 * np.sin(y1)
     assert np.allclose(x2, x22)
     assert np.allclose(y2, y22)
+
+
+def test_timeout():
+    # verify that the numerical evaluation stops when the time budget is
+    # exceeded, returning partial results.
+    import time
+    from sympy.utilities.lambdify import implemented_function
+    from pytest import warns
+
+    x, y = symbols("x, y")
+
+    def slow(t):
+        time.sleep(0.01)
+        return t
+
+    f = implemented_function("f", slow)
+
+    s = LineOver1DRangeSeries(f(x), (x, -5, 5), adaptive=False, n=100,
+        timeout=0.1)
+    with warns(UserWarning, match="exceeded the time budget"):
+        xx, yy = s.get_data()
+    assert len(xx) == len(yy) == 100
+    assert np.isnan(yy).any()
+    assert np.allclose(xx[:5], yy[:5])
+
+    s = LineOver1DRangeSeries(f(x), (x, -5, 5), adaptive=True,
+        adaptive_goal=1e-06, timeout=0.1, adaptive_sampler="adaptive")
+    with warns(UserWarning, match="exceeded the time budget"):
+        xx, yy = s.get_data()
+    assert 2 <= len(xx) < 100
+
+    s = SurfaceOver2DRangeSeries(f(x) + y, (x, -5, 5), (y, -5, 5),
+        n1=10, n2=10, timeout=0.1)
+    with warns(UserWarning, match="exceeded the time budget"):
+        xx, yy, zz = s.get_data()
+    assert zz.shape == (10, 10)
+    assert np.isnan(zz).any()
+
+    # the time budget of the octree includes the evaluation of the first
+    # level, and each level can be interrupted
+    z = symbols("z")
+    s = Implicit3DSeries(f(x) + y**2 + z**2 - 4, (x, -3, 3), (y, -3, 3),
+        (z, -3, 3), n1=5, n2=5, n3=5, adaptive=True, depth=2, timeout=0.1)
+    t0 = time.monotonic()
+    with warns(UserWarning, match="exceeded the time budget"):
+        s.get_data()
+    # without a time budget, the first level alone takes 1.25 seconds
+    assert time.monotonic() - t0 < 0.6
+
+    # no time budget: all points are evaluated
+    s = LineOver1DRangeSeries(f(x), (x, -5, 5), adaptive=False, n=20)
+    xx, yy = s.get_data()
+    assert not np.isnan(yy).any()
+
+
+def test_estimate_memory():
+    # verify that the memory estimate scales with the number of
+    # discretization points
+
+    x, y, z = symbols("x:z")
+
+    s1 = LineOver1DRangeSeries(sin(x), (x, -5, 5), n=100)
+    s2 = LineOver1DRangeSeries(sin(x), (x, -5, 5), n=200)
+    assert s2.estimate_memory() == 2 * s1.estimate_memory()
+
+    s1 = SurfaceOver2DRangeSeries(cos(x * y), (x, -5, 5), (y, -5, 5),
+        n1=10, n2=10)
+    s2 = SurfaceOver2DRangeSeries(cos(x * y), (x, -5, 5), (y, -5, 5),
+        n1=20, n2=20)
+    assert s2.estimate_memory() == 4 * s1.estimate_memory()
+
+    s = Implicit3DSeries(x**2 + y**2 + z**2 - 4, (x, -3, 3), (y, -3, 3),
+        (z, -3, 3), n1=10, n2=10, n3=10)
+    e = s.estimate_memory()
+    s._reduce_discretization(1 / 8)
+    assert s.n1 == s.n2 == s.n3 == 5
+    assert s.estimate_memory() == e / 8
+
+    s = InteractiveSeries([cos(x * y * z)], [(x, -5, 5), (y, -5, 5)],
+        n1=10, n2=20, params={z: 1})
+    assert s.estimate_memory() > 10 * 20 * 8
+
+    s = List2DSeries([1, 2, 3], [4, 5, 6])
+    assert s.estimate_memory() == 3 * 16
+
+    # chunked evaluation gives the same results
+    s1 = SurfaceOver2DRangeSeries(cos(x * y), (x, -5, 5), (y, -5, 5),
+        n1=10, n2=10)
+    s2 = SurfaceOver2DRangeSeries(cos(x * y), (x, -5, 5), (y, -5, 5),
+        n1=10, n2=10)
+    s2._chunk_size = 7
+    assert s2.estimate_memory() < s1.estimate_memory()
+    assert np.allclose(s1.get_data()[-1], s2.get_data()[-1])
+
+
+def test_get_data_fields():
+    # verify that get_data is able to return only the requested arrays, and
+    # that they are equal to the ones returned by default
+
+    x, y, z, u = symbols("x, y, z, u")
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -5, 5), (y, -3, 3),
+        n1=10, n2=15)
+    xx, yy, zz = s.get_data()
+    x1d, zz2 = s.get_data(fields=("x1d", "z"))
+    assert np.allclose(x1d, xx[0, :])
+    assert np.allclose(zz2, zz)
+    y1d, = s.get_data(fields="y1d")
+    assert np.allclose(y1d, yy[:, 0])
+    raises(ValueError, lambda: s.get_data(fields=("x", "w")))
+
+    s = ContourInteractiveSeries([u * cos(x * y)], [(x, -5, 5), (y, -3, 3)],
+        params={u: 2}, n1=10, n2=15)
+    xx, yy, zz = s.get_data()
+    x1d, y1d, zz2 = s.get_data(fields=("x1d", "y1d", "z"))
+    assert np.allclose(x1d, xx[0, :]) and np.allclose(y1d, yy[:, 0])
+    assert np.allclose(zz2, zz)
+
+    s = ComplexSurfaceSeries(sqrt(z), (z, -5 - 5j, 5 + 5j), n1=10, n2=10)
+    xx, yy, zz = s.get_data()
+    zz2, = s.get_data(fields=("z",))
+    assert np.allclose(zz2, zz)
+
+    for s in [
+        ComplexDomainColoringSeries(sqrt(z), (z, -5 - 5j, 5 + 5j),
+            n1=10, n2=10),
+        ComplexDomainColoringInteractiveSeries(u * sqrt(z),
+            (z, -5 - 5j, 5 + 5j), params={u: 1}, n1=10, n2=10)
+    ]:
+        xx, yy, mag, angle, img, colors = s.get_data()
+        mag2, img2 = s.get_data(fields=("abs", "img"))
+        assert np.allclose(mag2, mag) and np.allclose(img2, img)
+        colors2, angle2 = s.get_data(fields=("colors", "arg"))
+        assert np.allclose(colors2, colors) and np.allclose(angle2, angle)
+        raises(ValueError, lambda: s.get_data(fields=("z",)))
+
+
+def test_lazy_construction():
+    # verify that latex labels, lambda functions and discretized ranges are
+    # computed on first use
+
+    u, x, y = symbols("u, x, y")
+
+    s = LineOver1DRangeSeries(cos(x), (x, -5, 5), str(cos(x)))
+    assert callable(s._latex_label_value)
+    assert s.get_label(True) == "$%s$" % latex(cos(x))
+    assert s._latex_label_value == latex(cos(x))
+
+    s = SurfaceInteractiveSeries([cos(u * x * y)], [(x, -5, 5), (y, -5, 5)],
+        str(cos(u * x * y)), params={u: 1}, n1=10, n2=10)
+    assert callable(s._latex_label_value)
+    assert (s._functions is None) and (s._ranges is None)
+    xx, yy, zz = s.get_data()
+    assert (s._functions is not None) and (s._ranges is not None)
+    assert xx.shape == (10, 10)
+    functions = s.functions
+    s.params = {u: 2}
+    s.get_data()
+    assert s.functions is functions
+
+    s = ComplexSurfaceInteractiveSeries(u * sqrt(x), (x, -5 - 5j, 5 + 5j),
+        params={u: 1}, n1=10, n2=10)
+    assert (s._functions is None) and (s._ranges is None)
+    assert s.get_data()[0].shape == (10, 10)
+
+
+def test_pickle():
+    # verify that series can be pickled: lambda functions are dropped and
+    # generated again on first use, while the data stored by ``bake()`` is
+    # preserved.
+
+    import pickle
+    u, x, y = symbols("u, x, y")
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -5, 5), (y, -3, 3),
+        n1=10, n2=15)
+    s2 = pickle.loads(pickle.dumps(s))
+    assert str(s2) == str(s)
+    assert all(np.allclose(a, b) for a, b in zip(s.get_data(), s2.get_data()))
+
+    s = InteractiveSeries([u * cos(x * y)], [(x, -5, 5), (y, -3, 3)],
+        params={u: 1}, n1=10, n2=15)
+    data = s.get_data()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert s2._functions is None
+    assert all(np.allclose(a, b) for a, b in zip(data, s2.get_data()))
+
+    # baked data is returned without evaluating the expression
+    s.bake()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert all(np.allclose(a, b) for a, b in zip(data, s2.get_data()))
+    assert np.allclose(s2.get_data(fields=("z",))[0], data[-1])
+    assert s2._functions is None
+    # new parameters discard the baked data
+    s2.params = {u: 2}
+    assert np.allclose(s2.get_data()[-1], 2 * data[-1])
+
+    s = ComplexDomainColoringSeries(sqrt(x), (x, -5 - 5j, 5 + 5j),
+        n1=10, n2=10)
+    s.bake()
+    s2 = pickle.loads(pickle.dumps(s))
+    img, = s2.get_data(fields=("img",))
+    assert np.allclose(img, s.get_data()[4])
+    s2.unbake()
+    assert "get_data" not in s2.__dict__
+
+    # planes and geometric entities, with and without parameters
+    a, b, z = symbols("a, b, z")
+    ranges = [(x, -2, 3), (y, -4, 5), (z, -1, 6)]
+    series = [
+        PlaneSeries(Plane((0, 0, 1), (1, 2, 3)), *ranges, n1=5, n2=6, n3=7),
+        PlaneInteractiveSeries([Plane((0, 0, a), (1, b, 3))], ranges,
+            params={a: 1, b: 2}, n1=5, n2=6, n3=7),
+        GeometrySeries(Circle(Point(1, 2), 3)),
+        GeometryInteractiveSeries([Circle(Point(a, 0), b)], [],
+            params={a: 1, b: 2}),
+        GeometryInteractiveSeries([Polygon(Point(0, 0), 1, n=a)], [],
+            params={a: 5}),
+        GeometryCollectionSeries([Point(k, 1) for k in range(3)]),
+        GeometryCollectionSeries([Polygon(Point(a, 0), 1, n=4),
+            Polygon(Point(0, b), 1, n=3)], params={a: 1, b: 2}),
+    ]
+    for s in series:
+        data = s.get_data()
+        s2 = pickle.loads(pickle.dumps(s))
+        assert all(np.allclose(d1, d2, equal_nan=True)
+            for d1, d2 in zip(data, s2.get_data()))
+
+    # interactive complex points
+    s = ComplexPointInteractiveSeries([1 + 2 * I * a, 3 + 4 * I, sqrt(-a)],
+        params={a: 2})
+    data = s.get_data()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert all(np.allclose(d1, d2) for d1, d2 in zip(data, s2.get_data()))
+    s2.params = {a: 3}
+    assert np.allclose(s2.get_data()[1], [6, 4, np.sqrt(3)])
+
+
+def test_implicit_adaptive_rectangles():
+    # verify that the adaptive algorithm of ImplicitSeries returns the
+    # rectangles as an array and that the results are reproducible.
+
+    x, y = symbols("x, y")
+
+    s = ImplicitSeries(x**2 + y**2 < 4, (x, -3, 3), (y, -3, 3),
+        adaptive=True)
+    rectangles, plot_type = s.get_data()
+    assert plot_type == "fill"
+    assert rectangles.shape[1] == 4
+    assert np.all(rectangles[:, 0] < rectangles[:, 1])
+    assert np.all(rectangles[:, 2] < rectangles[:, 3])
+    # the rectangles cover the inside of the circle
+    area = np.sum((rectangles[:, 1] - rectangles[:, 0]) *
+        (rectangles[:, 3] - rectangles[:, 2]))
+    assert np.isclose(area, 4 * np.pi, rtol=0.05)
+    far_x = np.abs(rectangles[:, :2]).max(axis=1)
+    far_y = np.abs(rectangles[:, 2:]).max(axis=1)
+    assert np.all(np.hypot(far_x, far_y) <= 2)
+
+    # the same seed produces the same jitter
+    assert np.array_equal(rectangles, s.get_data()[0])
+    s2 = ImplicitSeries(x**2 + y**2 < 4, (x, -3, 3), (y, -3, 3),
+        adaptive=True, seed=1)
+    assert not np.array_equal(rectangles, s2.get_data()[0])
+
+    # equalities are drawn with the undecided rectangles of the last level
+    s = ImplicitSeries(Eq(y, sin(x)), (x, -5, 5), (y, -5, 5), adaptive=True)
+    rectangles, _ = s.get_data()
+    xc = (rectangles[:, 0] + rectangles[:, 1]) / 2
+    yc = (rectangles[:, 2] + rectangles[:, 3]) / 2
+    assert len(rectangles) > 0
+    assert np.allclose(yc, np.sin(xc), atol=0.1)
+
+    # boolean functions
+    s = ImplicitSeries(And(y > 0, x**2 + y**2 < 4) | (x > 2),
+        (x, -3, 3), (y, -3, 3), adaptive=True)
+    rectangles, _ = s.get_data()
+    xc = (rectangles[:, 0] + rectangles[:, 1]) / 2
+    yc = (rectangles[:, 2] + rectangles[:, 3]) / 2
+    assert np.all((yc > 0) | (xc > 2))
+
+
+def test_implicit_equality_marching_squares():
+    # verify that the uniform meshing strategy returns the level curve of
+    # an equality as NaN-separated polylines.
+
+    x, y = symbols("x, y")
+
+    s = ImplicitSeries(Eq(x**2 + y**2, 4), (x, -3, 3), (y, -3, 3),
+        n1=50, n2=40, adaptive=False)
+    xc, yc, plot_type = s.get_data()
+    assert plot_type == "lines"
+    # a single closed curve
+    assert not np.any(np.isnan(xc))
+    assert np.isclose(xc[0], xc[-1]) and np.isclose(yc[0], yc[-1])
+    assert np.allclose(np.hypot(xc, yc), 2, atol=1e-2)
+
+    # two separate curves
+    s = ImplicitSeries(Eq(x**2, 1), (x, -3, 3), (y, -3, 3),
+        n1=50, n2=40, adaptive=False)
+    xc, yc, _ = s.get_data()
+    assert np.sum(np.isnan(xc)) == 1
+    assert np.allclose(np.abs(xc[~np.isnan(xc)]), 1, atol=1e-2)
+
+    # the curve is interrupted where the expression is not defined
+    s = ImplicitSeries(Eq(sqrt(x) * y, 1), (x, -3, 3), (y, -3, 3),
+        n1=50, n2=40, adaptive=False)
+    xc, yc, _ = s.get_data()
+    assert np.all(xc[~np.isnan(xc)] > 0)
+    assert np.allclose((np.sqrt(xc) * yc)[~np.isnan(xc)], 1, rtol=5e-2)
+
+    # inequalities are still rendered with filled contours
+    s = ImplicitSeries(x**2 + y**2 < 4, (x, -3, 3), (y, -3, 3),
+        n1=50, n2=40, adaptive=False)
+    xx, yy, zz, plot_type = s.get_data()
+    assert plot_type == "contourf"
+    assert zz.shape == (40, 50)
+
+
+def test_implicit_boolean_uniform_mesh():
+    # verify that Boolean combinations of inequalities are evaluated with
+    # the uniform mesh, as masks of the regions.
+    from pytest import warns
+
+    x, y = symbols("x, y")
+    r1 = x**2 + y**2 < 4
+    r2 = y > x
+
+    def inside(expr, points):
+        s = ImplicitSeries(expr, (x, -3, 3), (y, -3, 3), n1=61, n2=61)
+        assert not s.adaptive
+        xx, yy, zz, plot_type = s.get_data()
+        assert plot_type == "contourf"
+        assert set(np.unique(zz)) <= {-1, 1}
+        # indices of the points in the discretized domain
+        return [zz[int(round((py + 3) * 10)), int(round((px + 3) * 10))] > 0
+            for px, py in points]
+
+    points = [(0, 1), (1, 0), (-2.5, 2.5), (2.5, -2.5)]
+    assert inside(r1 & r2, points) == [True, False, False, False]
+    assert inside(r1 | r2, points) == [True, True, True, False]
+    assert inside(~(r1 | r2), points) == [False, False, False, True]
+    assert inside(r1 ^ r2, points) == [False, True, True, False]
+
+    # Boolean functions of equalities still require interval arithmetic
+    with warns(UserWarning, match="automatically switched"):
+        s = ImplicitSeries(Eq(y, x) & r1, (x, -3, 3), (y, -3, 3))
+    assert s.adaptive
+
+
+def test_implicit3d_adaptive_octree():
+    # verify that the octree sampling of Implicit3DSeries returns the same
+    # cells crossed by the surface as a uniform grid with the same
+    # resolution.
+    from sympy.utilities.lambdify import lambdify
+
+    x, y, z = symbols("x:z")
+    expr = x**4 + y**4 + z**4 - (x**2 + y**2 + z**2 - 0.3)
+
+    s = Implicit3DSeries(expr, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=8, n2=9, n3=10, adaptive=True, depth=2)
+    xx, yy, zz, ijk, values = s.get_data()
+    assert len(xx) == 29 and len(yy) == 33 and len(zz) == 37
+    assert np.allclose([xx[0], xx[-1], zz[0], zz[-1]], [-2, 2, -2, 2])
+    assert values.shape == (len(ijk), 2, 2, 2)
+    # values are the evaluation of the expression at the corners
+    f = lambdify((x, y, z), expr)
+    i, j, k = ijk[0]
+    assert np.allclose(values[0],
+        f(*np.meshgrid(xx[i:i+2], yy[j:j+2], zz[k:k+2], indexing="ij")))
+
+    s = Implicit3DSeries(expr, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=29, n2=33, n3=37)
+    _, _, _, v = s.get_data()
+    corners = np.stack([v[a:v.shape[0]-1+a, b:v.shape[1]-1+b, c:v.shape[2]-1+c]
+        for a in (0, 1) for b in (0, 1) for c in (0, 1)], axis=-1)
+    crossed = (corners > 0).any(axis=-1) & (corners <= 0).any(axis=-1)
+    assert set(map(tuple, np.argwhere(crossed))) == set(map(tuple, ijk))
+
+    # the refinement is much cheaper than the uniform grid
+    s = Implicit3DSeries(x**2 + y**2 + z**2 - 1, (x, -2, 2), (y, -2, 2),
+        (z, -2, 2), n=5, n1=5, n2=5, n3=5, adaptive=True, depth=4)
+    xx, yy, zz, ijk, values = s.get_data()
+    assert len(xx) == 65
+    assert len(ijk) < 0.1 * 64**3
+    centers = np.column_stack([xx[ijk[:, 0]], yy[ijk[:, 1]], zz[ijk[:, 2]]])
+    centers += (xx[1] - xx[0]) / 2
+    assert np.allclose(np.linalg.norm(centers, axis=1), 1, atol=0.06)
+
+
+def test_implicit3d_mesh():
+    # verify that Implicit3DSeries extracts the surface as a closed and
+    # consistently oriented triangle mesh, with both sampling strategies.
+
+    x, y, z = symbols("x:z")
+    sphere = x**2 + y**2 + z**2 - 1
+
+    def check_closed(faces):
+        # every edge is shared by exactly two triangles
+        edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]],
+            faces[:, [2, 0]]]), axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        assert np.all(counts == 2)
+
+    s = Implicit3DSeries(sphere, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=30, n2=31, n3=32)
+    vertices, faces = s.get_mesh()
+    assert vertices.shape[1] == faces.shape[1] == 3
+    assert np.allclose(np.linalg.norm(vertices, axis=1), 1, atol=1e-2)
+    check_closed(faces)
+    # normals point toward positive values, outside of the sphere. Then,
+    # the enclosed volume is positive.
+    a, b, c = [vertices[faces[:, i]] for i in range(3)]
+    assert np.isclose(np.sum(a * np.cross(b, c)) / 6, 4 * np.pi / 3,
+        rtol=2e-2)
+
+    # octree: the same mesh of the uniform grid with the same resolution
+    s1 = Implicit3DSeries(sphere, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=5, n2=5, n3=5, adaptive=True, depth=3)
+    s2 = Implicit3DSeries(sphere, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=33, n2=33, n3=33)
+    v1, f1 = s1.get_mesh()
+    v2, f2 = s2.get_mesh()
+    check_closed(f1)
+    assert len(f1) == len(f2)
+    assert np.allclose(np.sort(v1, axis=0), np.sort(v2, axis=0))
+
+    # the surface is open where the expression is not defined
+    s = Implicit3DSeries(sphere + sqrt(z), (x, -2, 2), (y, -2, 2),
+        (z, -2, 2), n1=20, n2=20, n3=20)
+    vertices, faces = s.get_mesh()
+    assert len(faces) > 0
+    assert np.all(vertices[:, 2] >= 0)
+
+    # no surface
+    s = Implicit3DSeries(sphere + 5, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=5, n2=5, n3=5)
+    vertices, faces = s.get_mesh()
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
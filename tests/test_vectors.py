@@ -1,19 +1,25 @@
 from sympy.core.symbol import symbols
 from sympy.matrices.dense import Matrix
 from sympy.core.containers import Tuple
-from sympy.functions.elementary.trigonometric import cos
+from sympy.functions.elementary.trigonometric import cos, sin
 from sympy.functions.elementary.miscellaneous import sqrt
 from sympy.geometry import Plane
 from sympy.vector import CoordSys3D
 from sympy.external import import_module
 from spb.vectors import _preprocess, _series, plot_vector
+from spb.ccomplex.complex import plot_complex_vector
 from spb.utils import _plot_sympify, _split_vector
 from spb.series import (
     Vector2DSeries,
     Vector3DSeries,
     SliceVector3DSeries,
     ContourSeries,
+    ComplexVector2DSeries,
+    VectorScalarSeries,
+    VectorScalarInteractiveSeries,
+    Vector2DInteractiveSeries,
 )
+from spb.interactive import create_series
 from spb.backends.utils import get_seeds_points
 from pytest import raises
 
@@ -398,6 +404,110 @@ def test_vector_data():
     assert zz.shape == ww.shape == (15, 10, 20)
 
 
+def test_plot_vector_shared_grid():
+    # verify that the magnitude scalar field and the vector field share the
+    # same evaluation, the quivers being a strided subset of the contour grid
+
+    x, y, a, b = symbols("x, y, a, b")
+    p = plot_vector([-sin(y), cos(x)], (x, -3, 3), (y, -2, 2), n=21,
+        show=False)
+    cs, vs = p.series
+    assert isinstance(cs, VectorScalarSeries)
+    assert cs.n1 == cs.n2 == 101
+    assert vs._shared_n == (101, 101)
+    xx, yy, uu, vv = vs.get_data()
+    assert xx.shape == uu.shape == (21, 21)
+    assert np.allclose(xx[0, :], np.linspace(-3, 3, 21))
+    assert np.allclose(uu, -np.sin(yy))
+    assert np.allclose(vv, np.cos(xx))
+    xx, yy, zz = cs.get_data()
+    assert zz.shape == (101, 101)
+    assert np.allclose(zz, np.sqrt(np.sin(yy)**2 + np.cos(xx)**2))
+
+    # the two series are not sharing the grid: each one is evaluated
+    # over its own discretization
+    vs._shared_n = (100, 100)
+    xx, yy, uu, vv = vs.get_data()
+    assert xx.shape == uu.shape == (21, 21)
+    assert np.allclose(uu, -np.sin(yy))
+
+    # a symbolic scalar field is evaluated on its own
+    p = plot_vector([-sin(y), cos(x)], (x, -3, 3), (y, -2, 2),
+        scalar=x + y, show=False)
+    assert type(p.series[0]) is ContourSeries
+    assert p.series[1]._shared_n is None
+
+    # interactive series
+    s = create_series(([-a * sin(y), b * cos(x)], (x, -3, 3), (y, -2, 2)),
+        params={a: 1, b: 2}, is_vector=True, n=11)
+    assert isinstance(s[0], VectorScalarInteractiveSeries)
+    assert isinstance(s[1], Vector2DInteractiveSeries)
+    assert s[1]._shared_n == (101, 101)
+    s[0].params = {a: 2, b: 3}
+    # the parameters are propagated to the vector series when they are set
+    assert s[1].params == {a: 2, b: 3}
+    xx, yy, zz = s[0].get_data()
+    assert zz.shape == (101, 101)
+    assert np.allclose(zz, np.sqrt(4 * np.sin(yy)**2 + 9 * np.cos(xx)**2))
+    s[1].params = {a: 2, b: 3}
+    xx, yy, uu, vv = s[1].get_data()
+    assert xx.shape == uu.shape == (11, 11)
+    assert np.allclose(uu, -2 * np.sin(yy))
+    assert np.allclose(vv, 3 * np.cos(xx))
+
+
+def test_plot_complex_vector():
+    # verify that plot_complex_vector evaluates the complex function over
+    # the complex grid, and that the scalar field shares that evaluation
+
+    z = symbols("z")
+    p = plot_complex_vector(z**2, (z, -5 - 4j, 5 + 4j), n=11, nc=50,
+        show=False)
+    assert len(p.series) == 2
+    cs, vs = p.series
+    assert isinstance(cs, VectorScalarSeries)
+    assert isinstance(vs, ComplexVector2DSeries)
+    assert vs.get_expr() == z**2
+    assert cs.n1 == cs.n2 == 51
+    assert vs._shared_n == (51, 51)
+
+    xx, yy, uu, vv = vs.get_data()
+    assert xx.shape == uu.shape == (11, 11)
+    assert np.allclose(xx[0, :], np.linspace(-5, 5, 11))
+    assert np.allclose(yy[:, 0], np.linspace(-4, 4, 11))
+    assert np.allclose(uu, xx**2 - yy**2)
+    assert np.allclose(vv, 2 * xx * yy)
+
+    # the scalar field is computed from the cached evaluation
+    vs._grid_cache[1][2][:] = 1
+    vs._grid_cache[1][3][:] = 1
+    _, _, mag = cs.get_data()
+    assert mag.shape == (51, 51)
+    assert np.allclose(mag, np.sqrt(2))
+
+    p = plot_complex_vector(z**2, (z, -5 - 4j, 5 + 4j), n=11, nc=50,
+        scalar="arg", show=False)
+    xx, yy, zz = p.series[0].get_data()
+    assert np.allclose(zz, np.arctan2(2 * xx * yy, xx**2 - yy**2))
+
+    p = plot_complex_vector(
+        (z**2, (z, -5 - 5j, 5 + 0j)), (z**3, (z, -5 - 0j, 5 + 5j)),
+        show=False)
+    assert len(p.series) == 2
+    assert all(isinstance(s, ComplexVector2DSeries) for s in p.series)
+
+    raises(ValueError, lambda: plot_complex_vector(z**2, scalar="s",
+        show=False))
+
+    # parameters are not supported: the error is raised when the series
+    # are built, not when they are evaluated
+    a = symbols("a")
+    raises(ValueError, lambda: plot_complex_vector(a * z**2,
+        (z, -2 - 2j, 2 + 2j), params={a: (1, 0, 2)}, show=False))
+    raises(ValueError, lambda: plot_complex_vector(a * z**2,
+        (z, -2 - 2j, 2 + 2j), show=False))
+
+
 def test_get_seeds_points():
     # verify that spb.backends.utils.get_seeds_points returns the correct
     # data type based on the parameters